@@ -0,0 +1,32 @@
+"""Add TIMEOUT to validator outcome
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-06-02 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "010"
+down_revision = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TYPE validatoroutcome ADD VALUE IF NOT EXISTS 'TIMEOUT'")
+
+
+def downgrade() -> None:
+    # Postgres cannot drop an enum value; recreate the type without it.
+    op.execute("UPDATE validator_log SET outcome = 'FAIL' WHERE outcome = 'TIMEOUT'")
+    op.execute("ALTER TYPE validatoroutcome RENAME TO validatoroutcome_old")
+    op.execute("CREATE TYPE validatoroutcome AS ENUM ('PASS', 'FAIL')")
+    op.execute(
+        "ALTER TABLE validator_log ALTER COLUMN outcome TYPE validatoroutcome "
+        "USING outcome::text::validatoroutcome"
+    )
+    op.execute("DROP TYPE validatoroutcome_old")
@@ -0,0 +1,35 @@
+"""Raise the stored ban list word limit
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "011"
+down_revision = "010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_constraint("ck_ban_list_banned_words_max_items", "ban_list", type_="check")
+    op.create_check_constraint(
+        "ck_ban_list_banned_words_max_items",
+        "ban_list",
+        "coalesce(array_length(banned_words, 1), 0) <= 100000",
+    )
+
+
+def downgrade() -> None:
+    # Fails while any ban list holds more than 1000 words.
+    op.drop_constraint("ck_ban_list_banned_words_max_items", "ban_list", type_="check")
+    op.create_check_constraint(
+        "ck_ban_list_banned_words_max_items",
+        "ban_list",
+        "coalesce(array_length(banned_words, 1), 0) <= 1000",
+    )
@@ -1,12 +1,23 @@
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 
 from app.api.deps import MultitenantAuthDep, SessionDep
+from app.core.ban_list_words import MEDIA_TYPES, format_words, parse_word
 from app.crud.ban_list import ban_list_crud
-from app.schemas.ban_list import BanListCreate, BanListUpdate, BanListResponse
-from app.utils import APIResponse, load_description
+from app.schemas.ban_list import (
+    MAX_STORED_BANNED_WORDS,
+    BanListCreate,
+    BanListResponse,
+    BanListUpdate,
+    BanListWordsFormat,
+    BanListWordsResponse,
+    BanListWordsUpdate,
+)
+from app.utils import APIResponse, load_description, request_lines
 
 router = APIRouter(prefix="/guardrails/ban_lists", tags=["Ban Lists"])
 
@@ -85,6 +96,135 @@ def update_ban_list(
     return APIResponse.success_response(data=ban_list)
 
 
+@router.post(
+    "/{id}/words/add",
+    description=load_description("ban_lists/add_ban_list_words.md"),
+    response_model=APIResponse[BanListWordsResponse],
+)
+def add_ban_list_words(
+    id: UUID,
+    payload: BanListWordsUpdate,
+    session: SessionDep,
+    auth: MultitenantAuthDep,
+):
+    result = ban_list_crud.update_words(
+        session,
+        id=id,
+        organization_id=auth.organization_id,
+        project_id=auth.project_id,
+        add=payload.words,
+    )
+    return APIResponse.success_response(data=result)
+
+
+@router.post(
+    "/{id}/words/remove",
+    description=load_description("ban_lists/remove_ban_list_words.md"),
+    response_model=APIResponse[BanListWordsResponse],
+)
+def remove_ban_list_words(
+    id: UUID,
+    payload: BanListWordsUpdate,
+    session: SessionDep,
+    auth: MultitenantAuthDep,
+):
+    result = ban_list_crud.update_words(
+        session,
+        id=id,
+        organization_id=auth.organization_id,
+        project_id=auth.project_id,
+        remove=payload.words,
+    )
+    return APIResponse.success_response(data=result)
+
+
+@router.put(
+    "/{id}/words",
+    description=load_description("ban_lists/import_ban_list_words.md"),
+    response_model=APIResponse[BanListWordsResponse],
+)
+async def import_ban_list_words(
+    id: UUID,
+    request: Request,
+    session: SessionDep,
+    auth: MultitenantAuthDep,
+    format: BanListWordsFormat = "csv",
+    mode: Literal["replace", "append"] = "replace",
+):
+    """
+    Reads the body line by line as it arrives, so only the parsed words are
+    held, never the whole upload.
+    """
+    # Refuse an unknown or foreign ban list before reading the upload, and
+    # release the connection while it is read.
+    await run_in_threadpool(
+        ban_list_crud.get_version,
+        session,
+        id,
+        auth.organization_id,
+        auth.project_id,
+        require_owner=True,
+    )
+    await run_in_threadpool(session.rollback)
+
+    words: dict[str, None] = {}
+    number = 0
+    async for line in request_lines(request):
+        number += 1
+        try:
+            word = parse_word(line, format, first=number == 1)
+        except ValueError as exc:
+            raise HTTPException(400, f"Line {number}: {exc}")
+        if word is None:
+            continue
+        words[word] = None
+        if len(words) > MAX_STORED_BANNED_WORDS:
+            raise HTTPException(
+                400,
+                f"Ban list cannot hold more than {MAX_STORED_BANNED_WORDS} words",
+            )
+
+    if mode == "append":
+        result = await run_in_threadpool(
+            ban_list_crud.update_words,
+            session,
+            id=id,
+            organization_id=auth.organization_id,
+            project_id=auth.project_id,
+            add=list(words),
+        )
+    else:
+        result = await run_in_threadpool(
+            ban_list_crud.replace_words,
+            session,
+            id=id,
+            organization_id=auth.organization_id,
+            project_id=auth.project_id,
+            words=list(words),
+        )
+    return APIResponse.success_response(data=result)
+
+
+@router.get(
+    "/{id}/words",
+    description=load_description("ban_lists/export_ban_list_words.md"),
+)
+def export_ban_list_words(
+    id: UUID,
+    session: SessionDep,
+    auth: MultitenantAuthDep,
+    format: BanListWordsFormat = "csv",
+):
+    ban_list = ban_list_crud.get(session, id, auth.organization_id, auth.project_id)
+    return StreamingResponse(
+        format_words(ban_list.banned_words, format),
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{ban_list.id}.{format}"'
+        },
+    )
+
+
 @router.delete(
     "/{id}",
     description=load_description("ban_lists/delete_ban_list.md"),
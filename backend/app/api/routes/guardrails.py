@@ -1,21 +1,53 @@
+import asyncio
+import logging
+import time
 import uuid
+from collections.abc import AsyncIterator
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException
-from guardrails.guard import Guard
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import StreamingResponse
 from guardrails.validators import FailResult, PassResult
+from pydantic import ValidationError
 from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
 
 from app.api.deps import AuthDep, SessionDep
+from app.core.ban_list_cache import (
+    CompiledBanList,
+    compile_ban_list,
+    get_compiled_ban_list,
+)
+from app.core.config import settings
 from app.core.constants import (
     BAN_LIST,
     LLM_CRITIC_ERROR_MESSAGE,
     LLM_CRITIC_REPHRASE_MESSAGE,
     REPHRASE_ON_FAIL_PREFIX,
 )
+from app.core.db import engine
 from app.core.enum import LLMValidatorName, ValidatorType
 from app.core.exception_handlers import _safe_error_message
-from app.core.guardrail_controller import build_guard, get_validator_config_models
+from app.core.guardrail_controller import (
+    build_batch_executor,
+    build_executor,
+    get_validator_config_models,
+)
+from app.core.result_cache import (
+    GuardrailOutcome,
+    cache_result,
+    result_cache,
+    result_cache_key,
+)
+from app.core.stream_segmenter import StreamSegmenter
+from app.core.validator_executor import ValidatorExecutor, ValidatorRunLog
+from app.core.validator_planner import (
+    plan_validators,
+    record_latencies,
+    skipped_validators,
+)
 from app.core.validators.config.answer_relevance_custom_llm_safety_validator_config import (
     AnswerRelevanceCustomLLMSafetyValidatorConfig,
 )
@@ -32,10 +64,30 @@ from app.crud.ban_list import ban_list_crud
 from app.crud.llm_prompt_config import llm_prompt_config_crud
 from app.crud.request_log import RequestLogCrud
 from app.crud.validator_log import ValidatorLogCrud
-from app.models.logging.request_log import RequestLogUpdate, RequestStatus
+from app.models.logging.request_log import (
+    RequestLog,
+    RequestLogUpdate,
+    RequestStatus,
+)
 from app.models.logging.validator_log import ValidatorLog, ValidatorOutcome
-from app.schemas.guardrail_config import GuardrailRequest, GuardrailResponse
-from app.utils import APIResponse, load_description
+from app.schemas.guardrail_config import (
+    GuardrailBatchItem,
+    GuardrailBatchItemResponse,
+    GuardrailBatchRequest,
+    GuardrailRequest,
+    GuardrailResponse,
+    GuardrailStreamDelta,
+    GuardrailStreamEvent,
+    GuardrailStreamRequest,
+)
+from app.utils import (
+    APIResponse,
+    DuplexStreamingResponse,
+    load_description,
+    request_lines,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/guardrails", tags=["guardrails"])
 
@@ -46,7 +98,7 @@ router = APIRouter(prefix="/guardrails", tags=["guardrails"])
     response_model=APIResponse[GuardrailResponse],
     response_model_exclude_none=True,
 )
-def run_guardrails(
+async def run_guardrails(
     payload: GuardrailRequest,
     session: SessionDep,
     _: AuthDep,
@@ -55,22 +107,25 @@ def run_guardrails(
     """
     Resolves any config-backed validator references (ban list words, topic relevance scope),
     then runs validation and returns a structured guardrail response.
+
+    Runs on the event loop so requests waiting on LLM validators do not hold a
+    threadpool slot; database calls are short and are sent to the threadpool.
     """
     request_log_crud = RequestLogCrud(session=session)
     validator_log_crud = ValidatorLogCrud(session=session)
 
     try:
-        request_log = request_log_crud.create(payload)
+        request_log = await run_in_threadpool(request_log_crud.create, payload)
     except ValueError:
         return APIResponse.failure_response(error="Invalid request_id")
 
-    _resolve_validator_configs(payload, session)
+    await run_in_threadpool(_resolve_validator_configs, payload, session)
     has_output_validator = any(
         isinstance(v, AnswerRelevanceCustomLLMSafetyValidatorConfig)
         for v in payload.validators
     )
     data = (payload.output or "") if has_output_validator else payload.input
-    return _validate_with_guard(
+    return await _validate_with_guard(
         payload,
         data,
         request_log_crud,
@@ -80,6 +135,114 @@ def run_guardrails(
     )
 
 
+@router.post(
+    "/batch",
+    description=load_description("guardrails/run_guardrails_batch.md"),
+    response_model=APIResponse[list[GuardrailBatchItemResponse]],
+    response_model_exclude_none=True,
+)
+async def run_guardrails_batch(
+    payload: GuardrailBatchRequest,
+    session: SessionDep,
+    _: AuthDep,
+    suppress_pass_logs: bool = True,
+    stream: bool | None = None,
+):
+    """
+    Runs one validator list over many texts. Validators are built once, model
+    inference is batched where the validator supports it, and logs are written
+    in bulk per chunk. Large batches stream back as NDJSON, one item per line.
+    """
+    await run_in_threadpool(
+        _resolve_stored_configs,
+        payload.validators,
+        payload.organization_id,
+        payload.project_id,
+        session,
+    )
+
+    if stream is None:
+        stream = len(payload.items) > settings.GUARDRAILS_BATCH_STREAM_THRESHOLD
+
+    if not stream:
+        items = [
+            item async for item in _run_batch(payload, session, suppress_pass_logs)
+        ]
+        return APIResponse.success_response(data=items)
+
+    async def ndjson_lines():
+        # The request-scoped session may be closed before the body is sent.
+        with Session(engine) as stream_session:
+            async for item in _run_batch(payload, stream_session, suppress_pass_logs):
+                yield item.model_dump_json(exclude_none=True) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.post(
+    "/stream",
+    description=load_description("guardrails/run_guardrails_stream.md"),
+)
+async def run_guardrails_stream(
+    request: Request,
+    session: SessionDep,
+    _: AuthDep,
+    suppress_pass_logs: bool = True,
+):
+    """
+    Validates an output while it is still being generated. The body is NDJSON:
+    a GuardrailStreamRequest line, then {"delta": "..."} lines as tokens arrive.
+    Sentences are validated as soon as they are complete and streamed back as
+    NDJSON chunk events, followed by one done event.
+    """
+    lines = request_lines(request)
+    header = await anext(lines, None)
+    if header is None:
+        raise HTTPException(400, "Request body is required")
+    try:
+        payload = GuardrailStreamRequest.model_validate_json(header)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+
+    not_streamable = [v.type for v in payload.validators if not v.streamable]
+    if not_streamable:
+        raise HTTPException(
+            400,
+            f"Validators {not_streamable} need the full text and cannot run on a stream",
+        )
+
+    try:
+        request_log = RequestLog(
+            request_id=UUID(payload.request_id),
+            request_text=payload.input,
+            organization_id=payload.organization_id,
+            project_id=payload.project_id,
+        )
+    except ValueError:
+        return APIResponse.failure_response(error="Invalid request_id")
+
+    request_log_id = request_log.id
+    await run_in_threadpool(
+        _resolve_stored_configs,
+        payload.validators,
+        payload.organization_id,
+        payload.project_id,
+        session,
+    )
+    await run_in_threadpool(RequestLogCrud(session=session).create_many, [request_log])
+
+    async def ndjson_events():
+        # The request-scoped session may be closed before the body is sent.
+        with Session(engine) as stream_session:
+            async for event in _run_stream(
+                payload, lines, request_log_id, stream_session, suppress_pass_logs
+            ):
+                yield event.model_dump_json(exclude_none=True) + "\n"
+
+    # The events are generated while the deltas are still being received.
+    return DuplexStreamingResponse(ndjson_events(), media_type="application/x-ndjson")
+
+
 @router.get("/", description=load_description("guardrails/list_validators.md"))
 def list_validators(_: AuthDep):
     """
@@ -113,23 +276,26 @@ def list_validators(_: AuthDep):
 def _resolve_validator_configs(payload: GuardrailRequest, session: Session) -> None:
     """
     Resolves config-backed references for all validators in-place before guard execution:
-    - BanList: fetches banned_words from the stored BanList when not provided inline.
+    - BanList: resolves the stored BanList's compiled matcher when banned_words are not provided inline.
     - TopicRelevance: fetches configuration and prompt_schema_version from stored config.
     - TopicRelevanceLLM: fetches configuration from stored config.
     - AnswerRelevance: fetches custom prompt template from stored config.
-
-    Returns the data string to pass to guard.validate().
     """
-    for validator in payload.validators:
+    _resolve_stored_configs(
+        payload.validators, payload.organization_id, payload.project_id, session
+    )
+    _bind_request_text(payload.validators, payload.input, payload.output)
+
+
+def _resolve_stored_configs(
+    validators, organization_id: int, project_id: int, session: Session
+) -> None:
+    for validator in validators:
         if isinstance(validator, BanListSafetyValidatorConfig):
             if validator.type == BAN_LIST and validator.banned_words is None:
-                ban_list = ban_list_crud.get(
-                    session,
-                    id=validator.ban_list_id,
-                    organization_id=payload.organization_id,
-                    project_id=payload.project_id,
+                validator.use_compiled(
+                    _compiled_ban_list(validator, organization_id, project_id, session)
                 )
-                validator.banned_words = ban_list.banned_words
 
         elif isinstance(
             validator,
@@ -142,8 +308,8 @@ def _resolve_validator_configs(payload: GuardrailRequest, session: Session) -> N
                 config = llm_prompt_config_crud.get(
                     session=session,
                     id=validator.topic_relevance_config_id,
-                    organization_id=payload.organization_id,
-                    project_id=payload.project_id,
+                    organization_id=organization_id,
+                    project_id=project_id,
                 )
                 if config.validator_name != LLMValidatorName.TopicRelevance:
                     raise HTTPException(
@@ -157,14 +323,12 @@ def _resolve_validator_configs(payload: GuardrailRequest, session: Session) -> N
                     validator.prompt_schema_version = config.prompt_schema_version
 
         elif isinstance(validator, AnswerRelevanceCustomLLMSafetyValidatorConfig):
-            validator.input = payload.input
-            validator.output = payload.output or ""
             if validator.custom_prompt_id is not None:
                 prompt_config = llm_prompt_config_crud.get(
                     session=session,
                     id=validator.custom_prompt_id,
-                    organization_id=payload.organization_id,
-                    project_id=payload.project_id,
+                    organization_id=organization_id,
+                    project_id=project_id,
                 )
                 if (
                     prompt_config.validator_name
@@ -178,7 +342,46 @@ def _resolve_validator_configs(payload: GuardrailRequest, session: Session) -> N
                 validator.prompt_template = prompt_config.llm_prompt
 
 
-def _validate_with_guard(
+def _compiled_ban_list(
+    validator: BanListSafetyValidatorConfig,
+    organization_id: int,
+    project_id: int,
+    session: Session,
+) -> CompiledBanList:
+    """
+    Only the ban list's version is read per request; its words are loaded and
+    compiled when that version is not cached in this worker yet.
+    """
+    matcher = (validator.resolve_engine(), validator.max_distance)
+    updated_at = ban_list_crud.get_version(
+        session,
+        id=validator.ban_list_id,
+        organization_id=organization_id,
+        project_id=project_id,
+    )
+    compiled = get_compiled_ban_list(validator.ban_list_id, updated_at, *matcher)
+    if compiled is None:
+        ban_list = ban_list_crud.get(
+            session,
+            id=validator.ban_list_id,
+            organization_id=organization_id,
+            project_id=project_id,
+        )
+        compiled = compile_ban_list(
+            ban_list.id, ban_list.updated_at, ban_list.banned_words, *matcher
+        )
+    return compiled
+
+
+def _bind_request_text(validators, input_text: str, output_text: str | None) -> None:
+    """Validators that judge the input/output pair read both texts from their config."""
+    for validator in validators:
+        if isinstance(validator, AnswerRelevanceCustomLLMSafetyValidatorConfig):
+            validator.input = input_text
+            validator.output = output_text or ""
+
+
+async def _validate_with_guard(
     payload: GuardrailRequest,
     data: str,
     request_log_crud: RequestLogCrud,
@@ -187,118 +390,457 @@ def _validate_with_guard(
     suppress_pass_logs: bool = False,
 ) -> APIResponse:
     """
-    Runs Guardrails validation on input/output data, persists request & validator logs,
+    Runs the validators on input/output data, persists request & validator logs,
     and returns a structured APIResponse.
 
     This function treats validation failures as first-class outcomes (not exceptions),
     while still safely handling unexpected runtime errors.
     """
     response_id = uuid.uuid4()
-    validators = payload.validators
-    guard: Guard | None = None
-
-    def _finalize(
-        *,
-        status: RequestStatus,
-        validated_output: str | None = None,
-        error_message: str | None = None,
-    ) -> APIResponse:
+    deadline = (
+        time.monotonic() + payload.deadline_ms / 1000
+        if payload.deadline_ms is not None
+        else None
+    )
+    validators = (
+        plan_validators(payload.validators) if payload.fail_fast else payload.validators
+    )
+    executor: ValidatorExecutor | None = None
+
+    def _finalize(outcome: GuardrailOutcome) -> APIResponse:
         """
         Single exit-point helper to ensure:
         - request logs are always updated
         - validator logs are written when available
         - API responses are consistent
         """
-        response_text = (
-            validated_output if validated_output is not None else error_message
-        )
-        if response_text is None:
-            response_text = "Validation failed"
+        response_text = _response_text(outcome.validated_output, outcome.error_message)
 
         request_log_crud.update(
             request_log_id=request_log_id,
-            request_status=status,
+            request_status=outcome.status,
             request_log_update=RequestLogUpdate(
                 response_text=response_text,
                 response_id=response_id,
             ),
         )
 
-        if guard is not None:
-            add_validator_logs(
-                guard, request_log_id, validator_log_crud, payload, suppress_pass_logs
-            )
+        add_validator_logs(
+            list(outcome.validator_logs),
+            request_log_id,
+            validator_log_crud,
+            payload,
+            suppress_pass_logs,
+        )
 
-        rephrase_needed = validated_output is not None and (
-            validated_output == LLM_CRITIC_REPHRASE_MESSAGE
-            or validated_output.startswith(REPHRASE_ON_FAIL_PREFIX)
+        return _build_response(
+            outcome.status,
+            outcome.validated_output,
+            response_text,
+            response_id,
+            metadata=outcome.metadata,
+            skipped=outcome.skipped_validators,
+            timed_out=outcome.timed_out_validators,
         )
 
-        response_model = GuardrailResponse(
-            response_id=response_id,
-            rephrase_needed=rephrase_needed,
-            safe_text=validated_output,
+    # A repeated request (same texts, same resolved configs) reuses the stored
+    # outcome, and its validator logs are written from the stored ones.
+    cache_key = result_cache_key(
+        payload.validators, payload.input, payload.output, payload.fail_fast
+    )
+    cached = result_cache.get(cache_key) if cache_key is not None else None
+    if cached is not None:
+        return await run_in_threadpool(_finalize, cached)
+
+    try:
+        # Cache misses construct validators (model loads, lexicon compiles).
+        executor = await run_in_threadpool(
+            build_executor, validators, payload.fail_fast, deadline=deadline
+        )
+        result = await executor.async_validate(data)
+        status, validated_output, error_message = _outcome_from_result(
+            result.validated_output, result.validator_logs, data
         )
+        completed = True
+    except Exception as exc:
+        status, validated_output, error_message = _outcome_from_error(
+            exc, executor.validator_logs if executor is not None else [], data
+        )
+        completed = False
+
+    timed_out = None
+    if executor is not None:
+        record_latencies(validators, executor.validator_logs)
+        timed_out = _timed_out_validators(validators, executor.validator_logs)
+
+    outcome = GuardrailOutcome(
+        status=status,
+        validated_output=validated_output,
+        error_message=error_message,
+        metadata=_validator_metadata(validators),
+        skipped_validators=skipped_validators(validators, executor.validator_logs)
+        if payload.fail_fast and executor is not None
+        else None,
+        timed_out_validators=timed_out,
+        validator_logs=tuple(executor.validator_logs) if executor is not None else (),
+    )
+    # Unexpected errors (provider outages, timeouts) are not worth repeating.
+    if completed and timed_out is None and cache_key is not None:
+        cache_result(cache_key, payload.validators, outcome)
+
+    return await run_in_threadpool(_finalize, outcome)
+
+
+def _outcome_from_result(
+    validated_output: str | None,
+    validator_logs: list[ValidatorRunLog],
+    data: str,
+) -> tuple[RequestStatus, str | None, str | None]:
+    # Case 1: validation passed OR failed-with-fix (on_fail=FIX)
+    if validated_output is not None:
+        return RequestStatus.SUCCESS, validated_output, None
+
+    # Case 2: a fail-closed validator timed out and stopped the run
+    if validator_logs and validator_logs[-1].timed_out:
+        return RequestStatus.ERROR, None, _timeout_message(validator_logs[-1])
+
+    # Case 3: validation failed without a fix, or on_fail=exception stopped the run
+    error_message = (
+        _extract_error_from_logs(validator_logs, data) or "Validation failed"
+    )
+    return RequestStatus.ERROR, None, error_message
+
+
+def _outcome_from_error(
+    exc: Exception,
+    validator_logs: list[ValidatorRunLog],
+    data: str,
+) -> tuple[RequestStatus, str | None, str | None]:
+    # Case 4: unexpected system / runtime failure
+    # First try to extract structured fail results from the validators that ran.
+    extracted = _extract_error_from_logs(validator_logs, data)
+    if extracted is not None:
+        return RequestStatus.ERROR, None, extracted
+
+    return RequestStatus.ERROR, None, _redact_input(_safe_error_message(exc), data)
+
+
+def _response_text(validated_output: str | None, error_message: str | None) -> str:
+    response_text = validated_output if validated_output is not None else error_message
+    if response_text is None:
+        response_text = "Validation failed"
+    return response_text
+
+
+def _build_response(
+    status: RequestStatus,
+    validated_output: str | None,
+    response_text: str,
+    response_id: UUID,
+    metadata: dict | None = None,
+    skipped: list[str] | None = None,
+    timed_out: list[str] | None = None,
+) -> APIResponse:
+    rephrase_needed = validated_output is not None and (
+        validated_output == LLM_CRITIC_REPHRASE_MESSAGE
+        or validated_output.startswith(REPHRASE_ON_FAIL_PREFIX)
+    )
+
+    response_model = GuardrailResponse(
+        response_id=response_id,
+        rephrase_needed=rephrase_needed,
+        safe_text=validated_output,
+        skipped_validators=skipped,
+        timed_out_validators=timed_out,
+    )
+
+    if status == RequestStatus.SUCCESS:
+        return APIResponse.success_response(data=response_model, metadata=metadata)
+
+    return APIResponse.failure_response(
+        data=response_model,
+        error=response_text or "Validation failed",
+    )
+
+
+def _timed_out_validators(
+    validator_items, validator_logs: list[ValidatorRunLog]
+) -> list[str] | None:
+    timed_out = [
+        v_item.type
+        for v_item, log in zip(validator_items, validator_logs, strict=False)
+        if log.timed_out
+    ]
+    return timed_out or None
+
+
+def _timeout_message(log: ValidatorRunLog) -> str:
+    return f"{log.validator_name} timed out after {log.latency_ms:.0f} ms"
 
-        if status == RequestStatus.SUCCESS:
-            meta = next(
-                (v._validator_metadata for v in validators if v._validator_metadata),
-                None,
-            )
-            return APIResponse.success_response(data=response_model, metadata=meta)
 
-        return APIResponse.failure_response(
-            data=response_model,
-            error=response_text or "Validation failed",
+def _validator_metadata(validators) -> dict | None:
+    """Metadata recorded by the first validator whose fix emptied the text."""
+    meta = next(
+        (v._validator_metadata for v in validators if v._validator_metadata),
+        None,
+    )
+    return dict(meta) if meta is not None else None
+
+
+async def _run_batch(
+    payload: GuardrailBatchRequest,
+    session: Session,
+    suppress_pass_logs: bool,
+) -> AsyncIterator[GuardrailBatchItemResponse]:
+    """Validates the batch chunk by chunk, yielding item responses in request order."""
+    request_log_crud = RequestLogCrud(session=session)
+    validator_log_crud = ValidatorLogCrud(session=session)
+    chunk_size = settings.GUARDRAILS_BATCH_CHUNK_SIZE
+
+    for start in range(0, len(payload.items), chunk_size):
+        chunk = payload.items[start : start + chunk_size]
+        responses = await _run_batch_chunk(
+            payload,
+            chunk,
+            request_log_crud,
+            validator_log_crud,
+            suppress_pass_logs,
         )
+        for response in responses:
+            yield response
+
+
+async def _run_batch_chunk(
+    payload: GuardrailBatchRequest,
+    chunk: list[GuardrailBatchItem],
+    request_log_crud: RequestLogCrud,
+    validator_log_crud: ValidatorLogCrud,
+    suppress_pass_logs: bool,
+) -> list[GuardrailBatchItemResponse]:
+    responses: dict[int, GuardrailBatchItemResponse] = {}
+    request_logs: dict[int, RequestLog] = {}
+    for index, item in enumerate(chunk):
+        try:
+            request_id = UUID(item.request_id)
+        except ValueError:
+            responses[index] = GuardrailBatchItemResponse(
+                request_id=item.request_id, success=False, error="Invalid request_id"
+            )
+            continue
+        request_logs[index] = RequestLog(
+            request_id=request_id,
+            request_text=item.input,
+            output_text=item.output,
+            organization_id=payload.organization_id,
+            project_id=payload.project_id,
+        )
+
+    indices = list(request_logs)
+    # Ids come from the model's default factory; read them before the commit
+    # expires the instances.
+    request_log_ids = {index: request_logs[index].id for index in indices}
+    await run_in_threadpool(request_log_crud.create_many, list(request_logs.values()))
+
+    has_output_validator = any(
+        isinstance(v, AnswerRelevanceCustomLLMSafetyValidatorConfig)
+        for v in payload.validators
+    )
+    item_validators = []
+    texts = []
+    for index in indices:
+        item = chunk[index]
+        validators = [v.model_copy() for v in payload.validators]
+        _bind_request_text(validators, item.input, item.output)
+        item_validators.append(validators)
+        texts.append((item.output or "") if has_output_validator else item.input)
 
     try:
-        guard = build_guard(validators)
-        result = guard.validate(data)
-
-        # Case 1: validation passed OR failed-with-fix (on_fail=FIX)
-        if result.validated_output is not None:
-            return _finalize(
-                status=RequestStatus.SUCCESS,
-                validated_output=result.validated_output,
+        executor = await run_in_threadpool(build_batch_executor, item_validators)
+        results = await executor.async_validate(texts)
+        outcomes = [
+            _outcome_from_error(result.error, result.validator_logs, text)
+            if result.error is not None
+            else _outcome_from_result(
+                result.validated_output, result.validator_logs, text
+            )
+            for result, text in zip(results, texts, strict=True)
+        ]
+    except Exception as exc:
+        results = []
+        outcomes = [_outcome_from_error(exc, [], text) for text in texts]
+
+    updates = []
+    validator_log_rows = []
+    for position, index in enumerate(indices):
+        status, validated_output, error_message = outcomes[position]
+        response_id = uuid.uuid4()
+        response_text = _response_text(validated_output, error_message)
+        updates.append(
+            (
+                request_log_ids[index],
+                status,
+                RequestLogUpdate(response_text=response_text, response_id=response_id),
+            )
+        )
+        if results:
+            validator_log_rows.extend(
+                _validator_log_rows(
+                    results[position].validator_logs,
+                    request_log_ids[index],
+                    payload,
+                    suppress_pass_logs,
+                )
             )
 
-        # Case 2: validation failed without a fix
-        error_message = _extract_error_from_guard(guard, data) or "Validation failed"
-        return _finalize(
-            status=RequestStatus.ERROR,
-            error_message=error_message,
+        api_response = _build_response(
+            status,
+            validated_output,
+            response_text,
+            response_id,
+            metadata=_validator_metadata(item_validators[position]),
+        )
+        responses[index] = GuardrailBatchItemResponse(
+            request_id=chunk[index].request_id,
+            success=api_response.success,
+            data=api_response.data,
+            error=api_response.error,
+            metadata=api_response.metadata,
         )
 
-    except Exception as exc:
-        # Case 3: unexpected system / runtime failure
-        # First try to extract structured fail results from guard history.
-        # This handles on_fail="exception" where guardrails raises instead of returning.
-        if guard is not None:
-            extracted = _extract_error_from_guard(guard, data)
-            if extracted is not None:
-                return _finalize(status=RequestStatus.ERROR, error_message=extracted)
-
-        safe_msg = _redact_input(_safe_error_message(exc), data)
-        return _finalize(
-            status=RequestStatus.ERROR,
-            error_message=safe_msg,
+    await run_in_threadpool(request_log_crud.update_many, updates)
+    await run_in_threadpool(validator_log_crud.create_many, validator_log_rows)
+
+    return [responses[index] for index in range(len(chunk))]
+
+
+async def _stream_segments(
+    lines: AsyncIterator[str], received: list[str]
+) -> AsyncIterator[str]:
+    segmenter = StreamSegmenter(settings.GUARDRAILS_STREAM_MAX_WINDOW_CHARS)
+    async for line in lines:
+        delta = GuardrailStreamDelta.model_validate_json(line).delta
+        received.append(delta)
+        for segment in segmenter.feed(delta):
+            yield segment
+    for segment in segmenter.flush():
+        yield segment
+
+
+async def _run_stream(
+    payload: GuardrailStreamRequest,
+    lines: AsyncIterator[str],
+    request_log_id: UUID,
+    session: Session,
+    suppress_pass_logs: bool,
+) -> AsyncIterator[GuardrailStreamEvent]:
+    """
+    Validates the streamed output segment by segment and yields each validated
+    segment as it clears. The request log is finalized once, when the stream
+    ends, with everything received and everything sent back.
+    """
+    request_log_crud = RequestLogCrud(session=session)
+    validator_log_crud = ValidatorLogCrud(session=session)
+    received: list[str] = []
+    cleared: list[str] = []
+    validator_logs: list[ValidatorRunLog] = []
+    status, error_message = RequestStatus.SUCCESS, None
+    response_id = uuid.uuid4()
+    finalized = False
+
+    def _finalize() -> None:
+        response_text = (
+            "".join(cleared)
+            if status == RequestStatus.SUCCESS
+            else error_message or "Validation failed"
+        )
+        request_log_crud.update(
+            request_log_id=request_log_id,
+            request_status=status,
+            request_log_update=RequestLogUpdate(
+                response_text=response_text,
+                response_id=response_id,
+                output_text="".join(received),
+            ),
+        )
+        validator_log_crud.create_many(
+            _validator_log_rows(
+                validator_logs, request_log_id, payload, suppress_pass_logs
+            )
+        )
+
+    def _finalize_closed() -> None:
+        try:
+            _finalize()
+        except Exception:
+            logger.exception(
+                f"Could not finalize request log {request_log_id} of a closed stream"
+            )
+
+    try:
+        try:
+            executor = await run_in_threadpool(build_executor, payload.validators)
+            async for segment in _stream_segments(lines, received):
+                text = segment.strip()
+                if not text:
+                    cleared.append(segment)
+                    continue
+
+                result = await executor.async_validate(text)
+                validator_logs.extend(result.validator_logs)
+                if result.validated_output is None:
+                    status, _, error_message = _outcome_from_result(
+                        None, result.validator_logs, text
+                    )
+                    break
+
+                # Validators see the stripped sentence; put its spacing back.
+                leading = segment[: len(segment) - len(segment.lstrip())]
+                trailing = segment[len(segment.rstrip()) :]
+                safe_text = leading + result.validated_output + trailing
+                cleared.append(safe_text)
+                yield GuardrailStreamEvent(
+                    type="chunk", index=len(cleared) - 1, safe_text=safe_text
+                )
+        except ClientDisconnect:
+            # The client went away while still sending the output; there is
+            # no one to send the done event to.
+            return
+        except Exception as exc:
+            status, _, error_message = _outcome_from_error(
+                exc, validator_logs, "".join(received)
+            )
+
+        await run_in_threadpool(_finalize)
+        finalized = True
+        success = status == RequestStatus.SUCCESS
+        yield GuardrailStreamEvent(
+            type="done",
+            success=success,
+            response_id=response_id,
+            safe_text="".join(cleared) if success else None,
+            error=error_message,
+            metadata=_validator_metadata(payload.validators) if success else None,
         )
+    finally:
+        if not finalized:
+            # The client went away mid-stream; still close the request log,
+            # off the event loop and shielded from the cancellation that may
+            # be closing the stream.
+            status, error_message = (
+                RequestStatus.ERROR,
+                "Stream closed before completion",
+            )
+            await asyncio.shield(run_in_threadpool(_finalize_closed))
 
 
-def _extract_error_from_guard(guard: Guard, data: str) -> str | None:
+def _extract_error_from_logs(
+    validator_logs: list[ValidatorRunLog], data: str
+) -> str | None:
     """
-    Scans the guard's last history iteration for the first FailResult and returns
-    a normalized, redacted error message. Returns None if no fail result is found.
+    Scans the validator logs for the first FailResult and returns a normalized,
+    redacted error message. Returns None if no fail result is found.
     """
-    history = getattr(guard, "history", None)
-    if not history or not getattr(history, "last", None):
-        return None
-    iterations = getattr(history.last, "iterations", None)
-    if not iterations:
-        return None
-    logs = getattr(getattr(iterations[-1], "outputs", None), "validator_logs", [])
-    for log in logs:
+    for log in validator_logs:
         log_result = log.validation_result
         if isinstance(log_result, FailResult) and log_result.error_message:
             if log.validator_name in (
@@ -317,32 +859,46 @@ def _redact_input(error_message: str, input_text: str) -> str:
 
 
 def add_validator_logs(
-    guard: Guard,
+    validator_logs: list[ValidatorRunLog],
     request_log_id: UUID,
     validator_log_crud: ValidatorLogCrud,
     payload: GuardrailRequest,
     suppress_pass_logs: bool = False,
 ) -> None:
     """
-    Writes a ValidatorLog entry for each validator outcome in the guard's last iteration.
+    Writes a ValidatorLog entry for each validator outcome in a single commit.
     Pass results are skipped when suppress_pass_logs is True.
     """
-    history = getattr(guard, "history", None)
-    if not history:
-        return
-
-    last_call = getattr(history, "last", None)
-    if not last_call or not getattr(last_call, "iterations", None):
-        return
+    validator_log_crud.create_many(
+        _validator_log_rows(validator_logs, request_log_id, payload, suppress_pass_logs)
+    )
 
-    iteration = last_call.iterations[-1]
-    outputs = getattr(iteration, "outputs", None)
-    if not outputs or not getattr(outputs, "validator_logs", None):
-        return
 
-    for log in iteration.outputs.validator_logs:
+def _validator_log_rows(
+    validator_logs: list[ValidatorRunLog],
+    request_log_id: UUID,
+    payload: GuardrailRequest | GuardrailBatchRequest,
+    suppress_pass_logs: bool = False,
+) -> list[ValidatorLog]:
+    rows = []
+    for log in validator_logs:
         result = log.validation_result
 
+        if log.timed_out:
+            rows.append(
+                ValidatorLog(
+                    request_id=request_log_id,
+                    organization_id=payload.organization_id,
+                    project_id=payload.project_id,
+                    name=log.validator_name,
+                    input=str(log.value_before_validation),
+                    output=None,
+                    error=_timeout_message(log),
+                    outcome=ValidatorOutcome.TIMEOUT,
+                )
+            )
+            continue
+
         if result is None:
             continue
 
@@ -353,18 +909,19 @@ def add_validator_logs(
         if isinstance(result, FailResult):
             error_message = result.error_message
 
-        validator_log = ValidatorLog(
-            request_id=request_log_id,
-            organization_id=payload.organization_id,
-            project_id=payload.project_id,
-            name=log.validator_name,
-            input=str(log.value_before_validation),
-            output=log.value_after_validation,
-            error=error_message,
-            outcome=ValidatorOutcome(result.outcome.upper()),
+        rows.append(
+            ValidatorLog(
+                request_id=request_log_id,
+                organization_id=payload.organization_id,
+                project_id=payload.project_id,
+                name=log.validator_name,
+                input=str(log.value_before_validation),
+                output=log.value_after_validation,
+                error=error_message,
+                outcome=ValidatorOutcome(result.outcome.upper()),
+            )
         )
-
-        validator_log_crud.create(log=validator_log)
+    return rows
 
 
 def _normalize_llm_critic_error(message: str) -> str:
@@ -1,4 +1,10 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from app.api.deps import AuthDep
+from app.core.cache import cache_stats
+from app.core.validator_planner import cost_model
+from app.core.warmup import readiness
 from app.utils import load_description
 
 router = APIRouter(prefix="/utils", tags=["utils"])
@@ -10,3 +16,22 @@ router = APIRouter(prefix="/utils", tags=["utils"])
 )
 def health_check() -> bool:
     return True
+
+
+@router.get(
+    "/ready/",
+    description=load_description("utils/ready.md"),
+)
+def ready() -> JSONResponse:
+    state = readiness()
+    return JSONResponse(state, status_code=200 if state["ready"] else 503)
+
+
+@router.get(
+    "/cache-stats/",
+    description=load_description("utils/cache_stats.md"),
+)
+def get_cache_stats(_: AuthDep) -> dict:
+    # Not a cache, but learned per worker the same way: the latencies the
+    # fail_fast planner has observed per validator type.
+    return {**cache_stats(), "validator_latency": cost_model.stats()}
@@ -0,0 +1,118 @@
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from guardrails.validators import Validator
+
+from app.core.cache import LRUCache, invalidate_config, register_cache
+from app.core.config import settings
+from app.core.validators.ban_list import TrieBanList, build_ban_list
+
+# Compiled stored ban lists per (ban_list_id, updated_at) and matcher options.
+# Keys carry no tenant, so a public list is compiled once per worker for every
+# project that uses it; a request only reads the list's updated_at to find its
+# entry, and an update elsewhere changes the key even where no invalidation
+# reaches.
+ban_list_cache = register_cache(
+    LRUCache(
+        name="ban_list",
+        max_entries=settings.BAN_LIST_CACHE_MAX_ENTRIES,
+        max_bytes=settings.BAN_LIST_CACHE_MAX_BYTES,
+    )
+)
+
+
+@dataclass(frozen=True)
+class CompiledBanList:
+    ban_list_id: UUID
+    updated_at: datetime
+    engine: str
+    max_distance: Optional[int]
+    banned_words: list[str]
+    # Built without an on_fail handler; bound per request with config.bind().
+    validator: Validator
+
+
+def get_compiled_ban_list(
+    ban_list_id: UUID,
+    updated_at: datetime,
+    engine: str,
+    max_distance: Optional[int] = None,
+) -> Optional[CompiledBanList]:
+    return ban_list_cache.get((ban_list_id, updated_at, engine, max_distance))
+
+
+def compile_ban_list(
+    ban_list_id: UUID,
+    updated_at: datetime,
+    banned_words: list[str],
+    engine: str,
+    max_distance: Optional[int] = None,
+) -> CompiledBanList:
+    """
+    Builds the matcher for one version of a stored ban list and caches it.
+    Fuzzy indexes are built here too, once per version.
+    """
+    started = time.perf_counter()
+    compiled = CompiledBanList(
+        ban_list_id=ban_list_id,
+        updated_at=updated_at,
+        engine=engine,
+        max_distance=max_distance,
+        banned_words=list(banned_words),
+        validator=build_ban_list(list(banned_words), engine, max_distance=max_distance),
+    )
+    ban_list_cache.record_build(time.perf_counter() - started)
+    ban_list_cache.put(
+        (ban_list_id, updated_at, engine, max_distance),
+        compiled,
+        tags={ban_list_id},
+    )
+    return compiled
+
+
+def apply_ban_list_change(
+    ban_list_id: UUID,
+    previous_updated_at: datetime,
+    updated_at: datetime,
+    banned_words: list[str],
+    added: list[str],
+    removed: list[str],
+) -> None:
+    """
+    Drops everything cached from a ban list after its words changed, and
+    carries this worker's compiled trie matchers of the previous version over
+    to the new one by applying just the added and removed words. Other
+    engines, and other workers, compile the new version on first use.
+    """
+    carried = []
+    for key, compiled in ban_list_cache.tagged(ban_list_id):
+        if compiled.updated_at != previous_updated_at or not isinstance(
+            compiled.validator, TrieBanList
+        ):
+            continue
+        started = time.perf_counter()
+        carried.append(
+            (
+                key,
+                CompiledBanList(
+                    ban_list_id=ban_list_id,
+                    updated_at=updated_at,
+                    engine=compiled.engine,
+                    max_distance=compiled.max_distance,
+                    banned_words=list(banned_words),
+                    validator=compiled.validator.updated(banned_words, added, removed),
+                ),
+            )
+        )
+        ban_list_cache.record_build(time.perf_counter() - started)
+
+    invalidate_config(ban_list_id)
+    for (_, _, engine, max_distance), compiled in carried:
+        ban_list_cache.put(
+            (ban_list_id, updated_at, engine, max_distance),
+            compiled,
+            tags={ban_list_id},
+        )
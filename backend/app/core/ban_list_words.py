@@ -0,0 +1,69 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+
+from pydantic import TypeAdapter, ValidationError
+
+from app.schemas.ban_list import BanListWordsFormat, BannedWord
+
+# Words per chunk of an export, so a large list is sent in a few hundred
+# writes rather than one per word.
+_EXPORT_CHUNK_WORDS = 1000
+_CSV_HEADER = "word"
+
+_banned_word = TypeAdapter(BannedWord)
+
+MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def parse_word(
+    line: str, format: BanListWordsFormat, first: bool = False
+) -> str | None:
+    """
+    The banned word on one line of an import: the first column of a CSV row
+    or the "word" of an NDJSON object. Returns None for the CSV header row
+    and raises ValueError for a line that holds no valid word.
+    """
+    line = line.lstrip("\ufeff") if first else line
+    if format == "csv":
+        row = next(csv.reader([line]), [])
+        value = row[0] if row else ""
+        if first and value.strip().lower() == _CSV_HEADER:
+            return None
+    else:
+        try:
+            value = json.loads(line)["word"]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            raise ValueError('expected a JSON object with a "word" string')
+    try:
+        return _banned_word.validate_python(value)
+    except ValidationError as exc:
+        raise ValueError(exc.errors()[0]["msg"]) from exc
+
+
+def format_words(words: Iterable[str], format: BanListWordsFormat) -> Iterator[str]:
+    """Chunks of an export of words, in the format parse_word() reads."""
+    if format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow([_CSV_HEADER])
+        for count, word in enumerate(words, start=1):
+            writer.writerow([word])
+            if count % _EXPORT_CHUNK_WORDS == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+        return
+
+    chunk = []
+    for word in words:
+        chunk.append(json.dumps({"word": word}, ensure_ascii=False) + "\n")
+        if len(chunk) == _EXPORT_CHUNK_WORDS:
+            yield "".join(chunk)
+            chunk = []
+    yield "".join(chunk)
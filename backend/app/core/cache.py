@@ -0,0 +1,219 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Walking arbitrary validator objects (torch modules, spaCy pipelines) to
+# measure them is not feasible, so sizes are approximate and bounded.
+_MAX_SIZE_DEPTH = 4
+_MAX_SIZE_OBJECTS = 50_000
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Approximate the retained size of an object in bytes by walking its
+    containers and instance attributes up to a fixed depth and object count.
+    """
+    seen: set[int] = set()
+    total = 0
+    stack: list[tuple[Any, int]] = [(obj, 0)]
+
+    while stack and len(seen) < _MAX_SIZE_OBJECTS:
+        current, depth = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+
+        try:
+            total += sys.getsizeof(current)
+        except TypeError:
+            continue
+
+        if depth >= _MAX_SIZE_DEPTH or isinstance(current, (str, bytes, int, float)):
+            continue
+
+        if isinstance(current, dict):
+            children: Iterable[Any] = [*current.keys(), *current.values()]
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            children = current
+        elif hasattr(current, "__dict__"):
+            children = vars(current).values()
+        else:
+            continue
+
+        stack.extend((child, depth + 1) for child in children)
+
+    return total
+
+
+@dataclass
+class _CacheEntry:
+    value: Any
+    size: int
+    tags: frozenset = field(default_factory=frozenset)
+    expires_at: Optional[float] = None
+
+
+class LRUCache:
+    """
+    Thread-safe LRU cache bounded by entry count and approximate memory, with
+    an optional time-to-live per entry.
+
+    Entries may carry tags (e.g. the ids of stored configs they were built
+    from) so that every entry derived from a config can be dropped when that
+    config changes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.expirations = 0
+        self.builds = 0
+        self._build_seconds_total = 0.0
+        self._build_seconds_last = 0.0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: Optional[int] = None,
+        tags: Iterable[Hashable] = (),
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        """Stores value; ttl_seconds overrides the cache's time-to-live for it."""
+        if size is None:
+            size = estimate_size(value)
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            # An entry larger than the whole budget would only evict
+            # everything else and then itself.
+            if self.max_entries <= 0 or size > self.max_bytes:
+                return
+
+            self._entries[key] = _CacheEntry(
+                value=value,
+                size=size,
+                tags=frozenset(tags),
+                expires_at=time.monotonic() + ttl_seconds
+                if ttl_seconds is not None
+                else None,
+            )
+            self._size_bytes += size
+
+            while len(self._entries) > self.max_entries or (
+                self._size_bytes > self.max_bytes
+            ):
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+
+    def record_build(self, seconds: float) -> None:
+        """Records how long building a value for this cache took after a miss."""
+        with self._lock:
+            self.builds += 1
+            self._build_seconds_total += seconds
+            self._build_seconds_last = seconds
+
+    def tagged(self, tag: Hashable) -> list[tuple[Hashable, Any]]:
+        """Live (key, value) pairs carrying tag, without counting as lookups."""
+        with self._lock:
+            now = time.monotonic()
+            return [
+                (key, entry.value)
+                for key, entry in self._entries.items()
+                if tag in entry.tags
+                and (entry.expires_at is None or entry.expires_at > now)
+            ]
+
+    def invalidate_tag(self, tag: Hashable) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if tag in entry.tags]
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "expirations": self.expirations,
+                "builds": self.builds,
+                "build_ms_total": round(self._build_seconds_total * 1000, 3),
+                "build_ms_last": round(self._build_seconds_last * 1000, 3),
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size_bytes -= entry.size
+
+
+_REGISTERED_CACHES: dict[str, LRUCache] = {}
+
+
+def register_cache(cache: LRUCache) -> LRUCache:
+    """Register a process-wide cache for stats reporting and config invalidation."""
+    _REGISTERED_CACHES[cache.name] = cache
+    return cache
+
+
+def invalidate_config(config_id: Hashable) -> None:
+    """Drop every cached entry built from the given stored config (ban list, prompt config)."""
+    for cache in _REGISTERED_CACHES.values():
+        cache.invalidate_tag(config_id)
+
+
+def cache_stats() -> dict[str, dict[str, Any]]:
+    return {name: cache.stats() for name, cache in _REGISTERED_CACHES.items()}
@@ -48,6 +48,70 @@ class Settings(BaseSettings):
     ANSWER_RELEVANCE_LLM_MODEL: str = "gpt-4o-mini"
     DEFAULT_LLM_CALLABLE: str = "gpt-4o-mini"
     TOPIC_RELEVANCE_LLM_THRESHOLD: int = 2
+    # Process-wide cache of built validators, keyed by normalized validator config
+    GUARD_CACHE_MAX_ENTRIES: int = 256
+    GUARD_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    # Full guardrail responses per (texts, resolved validator configs); 0 entries disables it
+    RESULT_CACHE_MAX_ENTRIES: int = 10_000
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESULT_CACHE_TTL_SECONDS: int = 15 * 60
+    # Validator types whose results are not reused, on top of the remote-model validators
+    # that always opt out (see BaseValidatorConfig.cacheable_result)
+    RESULT_CACHE_EXCLUDED_VALIDATORS: list[str] = []
+    # Matcher for ban_list validators that do not set engine: "hub" (Guardrails Hub
+    # BanList, fuzzy) or "trie" (exact words and phrases in one scan, for large lists)
+    BAN_LIST_ENGINE: Literal["hub", "trie"] = "hub"
+    # Compiled stored ban lists per (ban_list_id, updated_at), shared by every project that can read them
+    BAN_LIST_CACHE_MAX_ENTRIES: int = 512
+    BAN_LIST_CACHE_MAX_BYTES: int = 128 * 1024 * 1024
+    # Normalized copies of recently validated texts (emoji/ftfy/NFKC pipeline)
+    NORMALIZATION_CACHE_MAX_ENTRIES: int = 2048
+    NORMALIZATION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    # PII analyzer results of recently validated texts, shared by a request's PII validators
+    PII_ANALYSIS_CACHE_MAX_ENTRIES: int = 2048
+    PII_ANALYSIS_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    # Topic relevance LLM verdicts per (model, system prompt, prompt version, normalized
+    # text), in memory and, when LLM_RESPONSE_CACHE_DIR is set, on disk across workers and
+    # restarts; a validator config opts out with cache_responses=false
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = 10_000
+    LLM_RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    LLM_RESPONSE_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    LLM_RESPONSE_CACHE_DIR: str | None = None
+    # How often each worker sweeps expired entries out of LLM_RESPONSE_CACHE_DIR
+    LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS: int = 60 * 60
+    # Directory for filtered slur lists (per severity and languages, as JSON), so
+    # workers start without parsing the slur list CSV; unset keeps them in memory only
+    SLUR_LEXICON_CACHE_DIR: str | None = None
+    # Start validators of a request together instead of one after another, up to
+    # the next one that can fix the text or stop the request
+    VALIDATOR_CONCURRENCY_ENABLED: bool = False
+    # Time limit per validator type in ms (a validator config's timeout_ms takes
+    # precedence); validators without one only stop at the request's deadline_ms
+    VALIDATOR_TIMEOUT_MS: dict[str, int] = {}
+    # Per validator type, what a timeout means for the request: "fail_closed" fails it,
+    # "fail_open" skips the validator. Overrides the validator's default policy
+    VALIDATOR_TIMEOUT_POLICY: dict[str, Literal["fail_open", "fail_closed"]] = {}
+    # POST /guardrails/batch: texts validated (and logged) per chunk, per-text
+    # validator calls in flight, and item count above which results stream as NDJSON
+    GUARDRAILS_BATCH_CHUNK_SIZE: int = 64
+    GUARDRAILS_BATCH_MAX_CONCURRENCY: int = 16
+    GUARDRAILS_BATCH_STREAM_THRESHOLD: int = 100
+    # Load the spaCy model and build the common PII analyzers before a worker takes
+    # requests, instead of on its first PII request; reported by GET /utils/ready/
+    PII_WARMUP_ON_STARTUP: bool = True
+    # spaCy pipeline behind PII detection: a tier ("sm", "md", "lg", "trf"), an installed
+    # pipeline package or a path; a pii_remover config may pick another installed tier
+    PII_SPACY_MODEL: str = "lg"
+    # PIIRemover.validate_batch: texts per spaCy nlp.pipe batch, and processes spaCy
+    # spreads them over (1 keeps them in the calling thread; more pays off for bulk runs)
+    PII_BATCH_SIZE: int = 32
+    PII_BATCH_N_PROCESS: int = 1
+    # Texts longer than PII_CHUNK_CHARS are analyzed in sentence-aligned windows of at
+    # most that size, each overlapping the previous one by PII_CHUNK_OVERLAP_CHARS or more
+    PII_CHUNK_CHARS: int = 10_000
+    PII_CHUNK_OVERLAP_CHARS: int = 300
+    # POST /guardrails/stream: longest segment validated at once when no sentence ends
+    GUARDRAILS_STREAM_MAX_WINDOW_CHARS: int = 500
 
     SLUR_LIST_FILENAME: ClassVar[str] = "curated_slurlist_hi_en.csv"
 
@@ -0,0 +1,103 @@
+import copy
+from itertools import combinations
+
+# Only the first characters of a word are indexed; the rest of the word is
+# still compared when a candidate is checked.
+_PREFIX_LENGTH = 7
+# Characters a word needs per allowed edit, so short words ("ban" vs "bun",
+# "pill" vs "will") are only matched exactly.
+_CHARS_PER_EDIT = 4
+
+
+def allowed_distance(word: str, max_distance: int) -> int:
+    return min(max_distance, len(word) // _CHARS_PER_EDIT)
+
+
+class DeletionIndex:
+    """
+    Symmetric deletion index (SymSpell) over a word list: every string a word
+    becomes after up to max_distance deleted characters points back to the
+    word. Two words within that many edits share such a string, so a lookup
+    only generates the deletions of the looked-up word and checks the words
+    they point to, however long the list is.
+    """
+
+    def __init__(self, words: list[str], max_distance: int):
+        self.max_distance = max_distance
+        self.words: list[str] = []
+        self._positions: dict[str, int] = {}
+        self._deletes: dict[str, tuple[int, ...]] = {}
+        self._add(words)
+
+    def _add(self, words: list[str]) -> None:
+        for word in words:
+            if word in self._positions:
+                continue
+            index = self._positions[word] = len(self.words)
+            self.words.append(word)
+            distance = allowed_distance(word, self.max_distance)
+            if distance == 0:
+                continue
+            for deleted in _deletions(word[:_PREFIX_LENGTH], distance):
+                self._deletes[deleted] = self._deletes.get(deleted, ()) + (index,)
+
+    def extended(self, words: list[str]) -> "DeletionIndex":
+        """A copy that also indexes words; this index is left as it is."""
+        index = copy.copy(self)
+        index.words = list(self.words)
+        index._positions = dict(self._positions)
+        index._deletes = dict(self._deletes)
+        index._add(words)
+        return index
+
+    def lookup(self, word: str) -> list[str]:
+        """Listed words within their allowed distance of word, itself excluded."""
+        if len(word) < _CHARS_PER_EDIT:
+            return []
+        checked: set[int] = set()
+        found = []
+        for deleted in _deletions(word[:_PREFIX_LENGTH], self.max_distance):
+            for index in self._deletes.get(deleted, ()):
+                if index in checked:
+                    continue
+                checked.add(index)
+                candidate = self.words[index]
+                limit = allowed_distance(candidate, self.max_distance)
+                if candidate != word and edit_distance(word, candidate, limit) <= limit:
+                    found.append(candidate)
+        return found
+
+
+def _deletions(word: str, distance: int) -> set[str]:
+    deleted = {word}
+    for count in range(1, min(distance, len(word)) + 1):
+        for positions in combinations(range(len(word)), count):
+            deleted.add(
+                "".join(char for i, char in enumerate(word) if i not in positions)
+            )
+    return deleted
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Edits (insertions, deletions, substitutions and swaps of neighbouring
+    characters) between a and b, or limit + 1 once it is known to exceed
+    limit.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1] if previous[-1] <= limit else limit + 1
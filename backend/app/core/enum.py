@@ -43,3 +43,14 @@ class ValidatorType(Enum):
     ProfanityFree = "profanity_free"
     NSFWText = "nsfw_text"
     AnswerRelevanceCustomLLM = "answer_relevance_custom_llm"
+
+
+class ValidatorCostClass(Enum):
+    Lexical = "lexical"
+    LocalModel = "local_model"
+    RemoteLLM = "remote_llm"
+
+
+class TimeoutPolicy(Enum):
+    FailOpen = "fail_open"
+    FailClosed = "fail_closed"
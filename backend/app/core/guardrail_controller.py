@@ -1,15 +1,154 @@
-from typing import get_args
+import hashlib
+import json
+import time
+from typing import Optional, get_args
 
 from guardrails import Guard
+from guardrails.validators import Validator
 
+from app.core.cache import LRUCache, register_cache
+from app.core.config import settings
+from app.core.enum import GuardrailOnFail, TimeoutPolicy
+from app.core.validator_executor import BatchValidatorExecutor, ValidatorExecutor
+from app.core.validators.config.base_validator_config import BaseValidatorConfig
+from app.core.validators.pii_remover import share_pii_analysis
 from app.schemas.guardrail_config import ValidatorConfigItem
 
+# Built validators are immutable between requests (compiled slur patterns,
+# lexicons, model handles), so they are kept per normalized config list and
+# shallow-copied per request. Guards and executors are cheap and carry per-call
+# logs, so a fresh one is created for every request.
+_guard_cache = register_cache(
+    LRUCache(
+        name="guard",
+        max_entries=settings.GUARD_CACHE_MAX_ENTRIES,
+        max_bytes=settings.GUARD_CACHE_MAX_BYTES,
+    )
+)
+
 
 def build_guard(validator_items):
-    validators = [v_item.build() for v_item in validator_items]
+    validators = build_validators(validator_items)
     return Guard().use(*validators)
 
 
+def is_barrier(on_fail: GuardrailOnFail, fail_fast: bool = False) -> bool:
+    """
+    Whether validators after one with this on_fail have to wait for it when
+    run concurrently. A fix rewrites the text, so later validators must not
+    see the text before it. An exception only stops the run, and a rephrase
+    replaces a failed text with the rephrase message, so later runs started
+    next to them are just discarded; with fail_fast an exception waits too,
+    so a terminal failure never pays for the validators behind it.
+    """
+    if on_fail == GuardrailOnFail.Fix:
+        return True
+    return fail_fast and on_fail == GuardrailOnFail.Exception
+
+
+def build_executor(
+    validator_items, fail_fast: bool = False, deadline: Optional[float] = None
+) -> ValidatorExecutor:
+    timeouts_ms = [v_item.resolve_timeout_ms() for v_item in validator_items]
+    return ValidatorExecutor(
+        build_validators(validator_items),
+        concurrent=settings.VALIDATOR_CONCURRENCY_ENABLED,
+        barriers=[is_barrier(v_item.on_fail, fail_fast) for v_item in validator_items],
+        timeouts=[t / 1000 if t is not None else None for t in timeouts_ms],
+        fail_open=[
+            v_item.resolve_timeout_policy() == TimeoutPolicy.FailOpen
+            for v_item in validator_items
+        ],
+        deadline=deadline,
+    )
+
+
+def build_batch_executor(item_validator_items) -> BatchValidatorExecutor:
+    """
+    Builds one executor for a batch. item_validator_items holds a copy of the
+    same validator config list per text; validators are built (or fetched from
+    the cache) once and bound to each text's configs.
+    """
+    prototypes = (
+        _get_prototypes(item_validator_items[0]) if item_validator_items else ()
+    )
+    rows = [
+        _bind_validators(prototypes, validator_items)
+        if prototypes is not None
+        else [v_item.build() for v_item in validator_items]
+        for validator_items in item_validator_items
+    ]
+    for row in rows:
+        share_pii_analysis(row)
+    return BatchValidatorExecutor(
+        rows, max_concurrency=settings.GUARDRAILS_BATCH_MAX_CONCURRENCY
+    )
+
+
+def build_validators(validator_items) -> list[Validator]:
+    """
+    Returns one validator per config item, reusing previously built validators
+    for an identical (normalized) config list.
+    """
+    prototypes = _get_prototypes(validator_items)
+    if prototypes is None:
+        validators = [v_item.build() for v_item in validator_items]
+    else:
+        validators = _bind_validators(prototypes, validator_items)
+    share_pii_analysis(validators)
+    return validators
+
+
+def _get_prototypes(validator_items) -> Optional[tuple[Optional[Validator], ...]]:
+    """
+    Cached validators for the config list (None where a config opts out of
+    caching), or None when the list cannot be cached at all.
+    """
+    cache_key = _cache_key(validator_items)
+    if cache_key is None:
+        return None
+
+    prototypes = _guard_cache.get(cache_key)
+    if prototypes is None:
+        started = time.perf_counter()
+        prototypes = tuple(
+            v_item.build() if v_item.cacheable else None for v_item in validator_items
+        )
+        _guard_cache.record_build(time.perf_counter() - started)
+        config_ids = set()
+        for v_item in validator_items:
+            config_ids |= v_item.referenced_config_ids()
+        _guard_cache.put(cache_key, prototypes, tags=config_ids)
+    return prototypes
+
+
+def _bind_validators(prototypes, validator_items) -> list[Validator]:
+    return [
+        v_item.bind(prototype) if prototype is not None else v_item.build()
+        for prototype, v_item in zip(prototypes, validator_items, strict=True)
+    ]
+
+
+def _cache_key(validator_items) -> Optional[str]:
+    """
+    Stable hash of the normalized validator config list. on_fail is excluded
+    because it is re-bound per request, timeout_ms because the executor applies
+    it; configs that opt out of caching only contribute their type so positions
+    stay aligned.
+    """
+    normalized = []
+    for v_item in validator_items:
+        if not isinstance(v_item, BaseValidatorConfig):
+            return None
+        if v_item.cacheable:
+            normalized.append(v_item.cache_dump(exclude={"on_fail", "timeout_ms"}))
+        else:
+            normalized.append({"type": v_item.type, "cacheable": False})
+
+    payload = json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def get_validator_config_models():
     annotated_args = get_args(ValidatorConfigItem)
     union_type = annotated_args[0]
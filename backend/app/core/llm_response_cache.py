@@ -0,0 +1,239 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from guardrails.validators import ValidationResult
+
+from app.core.cache import LRUCache, register_cache
+from app.core.config import settings
+from app.core.text_normalizer import normalize_for_matching
+
+logger = logging.getLogger(__name__)
+
+# Result metadata key set on verdicts served from the cache.
+_CACHE_HIT_KEY = "llm_response_cache_hit"
+
+
+class LLMResponseCache(LRUCache):
+    """
+    LLM verdicts by response key, in memory and, when LLM_RESPONSE_CACHE_DIR
+    is set, in one JSON file per key there, so that workers share them and
+    they survive restarts. Entries expire LLM_RESPONSE_CACHE_TTL_SECONDS after
+    the LLM call in both tiers. Each entry keeps how long that call took,
+    which every hit reports as saved.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.persistent_hits = 0
+        self.persistent_misses = 0
+        self._saved_seconds_total = 0.0
+
+    def lookup(self, key: str) -> Optional[Any]:
+        entry = self.get(key)
+        if entry is None:
+            path = _entry_path(key)
+            entry = self._read(path) if path is not None else None
+            if entry is None:
+                return None
+            self._promote(key, entry)
+        return self._hit(entry)
+
+    async def async_lookup(self, key: str) -> Optional[Any]:
+        """lookup for the event loop: the directory tier is read in a thread."""
+        entry = self.get(key)
+        if entry is None:
+            path = _entry_path(key)
+            entry = await asyncio.to_thread(self._read, path) if path else None
+            if entry is None:
+                return None
+            self._promote(key, entry)
+        return self._hit(entry)
+
+    def store(self, key: str, response: Any, latency_seconds: float) -> None:
+        entry = _entry(response, latency_seconds)
+        self.put(key, entry)
+        path = _entry_path(key)
+        if path is not None:
+            _write(path, entry)
+
+    async def async_store(
+        self, key: str, response: Any, latency_seconds: float
+    ) -> None:
+        """store for the event loop: the directory tier is written in a thread."""
+        entry = _entry(response, latency_seconds)
+        self.put(key, entry)
+        path = _entry_path(key)
+        if path is not None:
+            await asyncio.to_thread(_write, path, entry)
+
+    def stats(self) -> dict[str, Any]:
+        stats = super().stats()
+        with self._lock:
+            lookups = stats["hits"] + stats["misses"]
+            stats.update(
+                persistent_hits=self.persistent_hits,
+                persistent_misses=self.persistent_misses,
+                # Hits in either tier, per lookup.
+                overall_hit_ratio=(
+                    round((stats["hits"] + self.persistent_hits) / lookups, 4)
+                    if lookups
+                    else 0.0
+                ),
+                saved_ms_total=round(self._saved_seconds_total * 1000, 3),
+            )
+        return stats
+
+    def _promote(self, key: str, entry: dict) -> None:
+        # Kept in memory until the LLM call's own expiry.
+        self.put(
+            key,
+            entry,
+            ttl_seconds=entry["stored_at"]
+            + settings.LLM_RESPONSE_CACHE_TTL_SECONDS
+            - time.time(),
+        )
+
+    def _hit(self, entry: dict) -> Any:
+        with self._lock:
+            self._saved_seconds_total += entry["latency_ms"] / 1000
+        return entry["response"]
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            entry = None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM response cache entry {path}: {e}")
+            entry = None
+
+        if entry is not None and _expired(entry):
+            entry = None
+            path.unlink(missing_ok=True)
+        with self._lock:
+            if entry is None:
+                self.persistent_misses += 1
+            else:
+                self.persistent_hits += 1
+        return entry
+
+
+llm_response_cache = register_cache(
+    LLMResponseCache(
+        name="llm_response",
+        max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+        max_bytes=settings.LLM_RESPONSE_CACHE_MAX_BYTES,
+        ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL_SECONDS,
+    )
+)
+
+
+def llm_response_key(
+    model: str, system_prompt: str, prompt_schema_version: int, text: str
+) -> str:
+    """
+    Hash of what decides an LLM verdict: the model, the rendered system
+    prompt, the prompt schema version and the user text as normalized for
+    matching (case, whitespace, Unicode forms). Neither the prompt nor the
+    text can be read back from the key.
+    """
+    payload = json.dumps(
+        [
+            model,
+            hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+            prompt_schema_version,
+            normalize_for_matching(text),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def mark_cache_hit(result: ValidationResult) -> ValidationResult:
+    """
+    Flags a result served from this cache, so its latency is not taken for
+    the validator's (see app.core.validator_planner.record_latencies).
+    """
+    result.metadata = {**(result.metadata or {}), _CACHE_HIT_KEY: True}
+    return result
+
+
+def is_cache_hit(result: Optional[ValidationResult]) -> bool:
+    return bool(result is not None and (result.metadata or {}).get(_CACHE_HIT_KEY))
+
+
+def _entry_path(key: str) -> Optional[Path]:
+    if not settings.LLM_RESPONSE_CACHE_DIR:
+        return None
+    return Path(settings.LLM_RESPONSE_CACHE_DIR) / f"{key}.json"
+
+
+def _entry(response: Any, latency_seconds: float) -> dict:
+    return {
+        "stored_at": time.time(),
+        "latency_ms": round(latency_seconds * 1000, 3),
+        "response": response,
+    }
+
+
+def _expired(entry: dict) -> bool:
+    return entry["stored_at"] + settings.LLM_RESPONSE_CACHE_TTL_SECONDS <= time.time()
+
+
+def _write(path: Path, entry: dict) -> None:
+    # Written to a temporary file first so concurrent workers never read a
+    # partial entry.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=path.parent, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            json.dump(entry, f)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.warning(f"Could not write LLM response cache entry {path}: {e}")
+
+
+def prune_expired(directory: Path) -> int:
+    """
+    Removes expired entries, judged by file modification time, and returns
+    how many. Entries removed meanwhile by another worker are skipped.
+    """
+    cutoff = time.time() - settings.LLM_RESPONSE_CACHE_TTL_SECONDS
+    removed = 0
+    try:
+        with os.scandir(directory) as entries:
+            for item in entries:
+                if not item.name.endswith(".json"):
+                    continue
+                try:
+                    if item.stat().st_mtime <= cutoff:
+                        os.unlink(item.path)
+                        removed += 1
+                except FileNotFoundError:
+                    continue
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not prune LLM response cache {directory}: {e}")
+    return removed
+
+
+async def prune_periodically() -> None:
+    """
+    Background task for the app's lifespan: sweeps expired entries out of
+    LLM_RESPONSE_CACHE_DIR every LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS,
+    in a thread, so requests never wait for a sweep.
+    """
+    directory = Path(settings.LLM_RESPONSE_CACHE_DIR)
+    while True:
+        await asyncio.sleep(settings.LLM_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS)
+        await asyncio.to_thread(prune_expired, directory)
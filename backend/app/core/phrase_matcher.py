@@ -0,0 +1,389 @@
+import copy
+import re
+from array import array
+
+from app.core.deletion_index import DeletionIndex
+
+_WORD = re.compile(r"\w")
+# Runs of word characters, and every other non-space character on its own.
+_TOKEN = re.compile(r"\w+|[^\w\s]")
+
+
+def _fold(char: str) -> str:
+    # On lowercased text, re.IGNORECASE treats two characters as equal exactly
+    # when their uppercase forms are equal (this also covers its extra
+    # equivalences such as "ı"/"i" and "ς"/"σ"), so that is the matching key.
+    return char.upper()
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a phrase list that matches like one
+    re.compile(rf"(?<!\\w){re.escape(phrase)}(?!\\w)", re.IGNORECASE) pattern
+    per phrase, but scans the text once for all phrases.
+
+    Phrases and texts are expected to be lowercased already. Phrases are tried
+    longest first (ties keep list order), and redact() reproduces applying
+    pattern.sub() for each found phrase in that order: a longer phrase claims
+    its span first, and shorter phrases only replace what is left around it.
+    """
+
+    def __init__(self, phrases: list[str]):
+        self.phrases = list(phrases)
+        self._rank_phrases()
+        self._alphabet: dict[str, int] = {}
+        # (state << 20 | symbol) -> state, one dict for the whole trie so a large
+        # lexicon does not pay for a dict object per state.
+        self._goto: dict[int, int] = {}
+        self._fail: list[int] = [0]
+        self._out: list[tuple[int, ...]] = [()]
+        self._build()
+
+    def _rank_phrases(self) -> None:
+        # Position of each phrase when sorted longest first; sorted() is
+        # stable, so equal lengths keep list order.
+        self._rank = array("l", [0]) * len(self.phrases)
+        priority = sorted(
+            range(len(self.phrases)), key=lambda i: len(self.phrases[i]), reverse=True
+        )
+        for rank, index in enumerate(priority):
+            self._rank[index] = rank
+
+    def _build(self) -> None:
+        for index, phrase in enumerate(self.phrases):
+            if not phrase:
+                continue
+            state = 0
+            for char in phrase:
+                symbol = self._alphabet.setdefault(_fold(char), len(self._alphabet))
+                key = state << 20 | symbol
+                next_state = self._goto.get(key)
+                if next_state is None:
+                    next_state = len(self._fail)
+                    self._goto[key] = next_state
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        # Failure links in breadth-first order, i.e. by increasing depth.
+        children: dict[int, list[tuple[int, int]]] = {}
+        for key, child in self._goto.items():
+            children.setdefault(key >> 20, []).append((key & 0xFFFFF, child))
+
+        queue = [child for _, child in children.get(0, ())]
+        for state in queue:
+            for symbol, child in children.get(state, ()):
+                fallback = self._fail[state]
+                while True:
+                    target = self._goto.get(fallback << 20 | symbol)
+                    if target is not None or fallback == 0:
+                        break
+                    fallback = self._fail[fallback]
+                self._fail[child] = target if target is not None else 0
+                self._out[child] += self._out[self._fail[child]]
+                queue.append(child)
+
+    def occurrences(self, text: str) -> list[tuple[int, int, int]]:
+        """
+        Every (start, end, phrase index) whose characters match, overlapping
+        ones included, ordered by end. Word boundaries are not checked here.
+        """
+        found = []
+        goto, fail, out = self._goto, self._fail, self._out
+        alphabet = self._alphabet
+        # Uppercasing the whole text is one call; it stays aligned with the
+        # text unless a character uppercases to several ("ß" -> "SS").
+        folded = text.upper()
+        if len(folded) != len(text):
+            folded = [_fold(char) for char in text]
+        state = 0
+        for end, char in enumerate(folded, start=1):
+            symbol = alphabet.get(char)
+            if symbol is None:
+                state = 0
+                continue
+            while True:
+                next_state = goto.get(state << 20 | symbol)
+                if next_state is not None or state == 0:
+                    break
+                state = fail[state]
+            state = next_state or 0
+            for index in out[state]:
+                found.append((end - len(self.phrases[index]), end, index))
+        return found
+
+    def search(self, text: str) -> list[str]:
+        """Phrases found in text, longest first, as testing each pattern would."""
+        _, found = self._find(text)
+        return [self.phrases[index] for index in found]
+
+    def redact(self, text: str, replacement: str) -> tuple[list[str], str]:
+        """
+        Returns the phrases found in text (longest first) and the text with
+        every found phrase replaced.
+        """
+        found, spans = self.find_spans(text)
+        parts = []
+        position = 0
+        for start, end in spans:
+            parts.append(text[position:start])
+            parts.append(replacement)
+            position = end
+        parts.append(text[position:])
+        return found, "".join(parts)
+
+    def find_spans(
+        self, text: str, breaks: frozenset[int] = frozenset()
+    ) -> tuple[list[str], list[tuple[int, int]]]:
+        """
+        Returns the phrases found in text (longest first) and the sorted,
+        non-overlapping (start, end) spans redact() replaces. breaks are
+        positions that count as word boundaries even between two letters.
+        """
+        by_phrase, found = self._find(text, breaks)
+        if not found:
+            return [], []
+
+        taken = bytearray(len(text))
+        spans: list[tuple[int, int]] = []
+        opened: set[int] = set(breaks)
+        closed: set[int] = set(breaks)
+        for index in found:
+            # One pattern.sub(): leftmost non-overlapping matches, judged on
+            # the text as it was before this phrase's own replacements.
+            position = 0
+            claimed = []
+            for start, end in by_phrase[index]:
+                if start < position or taken.find(1, start, end) != -1:
+                    continue
+                if _bounded(text, start, end, opened, closed):
+                    claimed.append((start, end))
+                    position = end
+            for start, end in claimed:
+                taken[start:end] = b"\x01" * (end - start)
+                opened.add(start)
+                closed.add(end)
+            spans.extend(claimed)
+
+        return [self.phrases[index] for index in found], sorted(spans)
+
+    def _find(
+        self, text: str, breaks: frozenset[int] = frozenset()
+    ) -> tuple[dict[int, list[tuple[int, int]]], list[int]]:
+        """Occurrences grouped by phrase, and the phrases with a bounded one."""
+        by_phrase: dict[int, list[tuple[int, int]]] = {}
+        for start, end, index in self.occurrences(text):
+            by_phrase.setdefault(index, []).append((start, end))
+
+        found = [
+            index
+            for index, spans in by_phrase.items()
+            if any(_bounded(text, start, end, breaks, breaks) for start, end in spans)
+        ]
+        found.sort(key=self._rank.__getitem__)
+        return by_phrase, found
+
+
+class TokenTrie(PhraseMatcher):
+    """
+    PhraseMatcher over a trie of tokens (word runs and single symbols)
+    instead of characters, for lists of tens of thousands of phrases.
+
+    A bounded match always starts and ends on token edges, so matching walks
+    the trie from each token of the text and compares the characters of each
+    phrase it reaches; for phrases without leading or trailing whitespace the
+    result is the same as PhraseMatcher's. The trie has one node per distinct
+    token prefix and needs no failure links, so it is built with one dict
+    insert per token.
+    """
+
+    def _build(self) -> None:
+        # First token -> state, and (state, token) -> state below that. Tokens
+        # are keyed by _fold_token, which leaves lowercased phrases as they
+        # are, so a one-token phrase is its own key.
+        self._roots: dict[str, int] = {}
+        self._trie: dict[tuple[int, str], int] = {}
+        # Per state, the indexes of the phrases ending there.
+        self._ends: list[tuple[int, ...]] = [()]
+        self._depth = 0
+        for index, phrase in enumerate(self.phrases):
+            self._insert(index, phrase)
+
+    def _insert(self, index: int, phrase: str) -> None:
+        tokens = _TOKEN.findall(phrase)
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            key = _fold_token(token)
+            edges = self._roots if state == 0 else self._trie
+            edge = key if state == 0 else (state, key)
+            next_state = edges.get(edge)
+            if next_state is None:
+                next_state = edges[edge] = len(self._ends)
+                self._ends.append(())
+            state = next_state
+        self._ends[state] += (index,)
+        self._depth = max(self._depth, len(tokens))
+
+    def _state(self, phrase: str) -> int | None:
+        state = 0
+        for token in _TOKEN.findall(phrase):
+            key = _fold_token(token)
+            state = self._roots.get(key) if state == 0 else self._trie.get((state, key))
+            if state is None:
+                return None
+        return state or None
+
+    def updated(self, added: list[str], removed: list[str]) -> "TokenTrie":
+        """
+        A copy of this matcher with added phrases inserted and removed ones
+        dropped, for small edits to a large list. Only the trie's dicts are
+        copied, so this one keeps matching as before while others use it;
+        a removed phrase leaves an empty slot and its nodes behind.
+        """
+        matcher = copy.copy(self)
+        matcher.phrases = list(self.phrases)
+        matcher._roots = dict(self._roots)
+        matcher._trie = dict(self._trie)
+        matcher._ends = list(self._ends)
+
+        positions = {phrase: index for index, phrase in enumerate(self.phrases)}
+        for phrase in removed:
+            index = positions.pop(phrase, None)
+            state = matcher._state(phrase)
+            if index is None or state is None:
+                continue
+            matcher.phrases[index] = ""
+            matcher._ends[state] = tuple(i for i in matcher._ends[state] if i != index)
+        for phrase in added:
+            if phrase in positions:
+                continue
+            positions[phrase] = len(matcher.phrases)
+            matcher.phrases.append(phrase)
+            matcher._insert(positions[phrase], phrase)
+        matcher._rank_phrases()
+        return matcher
+
+    def occurrences(self, text: str) -> list[tuple[int, int, int]]:
+        roots, trie, ends, phrases = self._roots, self._trie, self._ends, self.phrases
+        tokens = [
+            (match.start(), match.end(), _fold_token(match.group()))
+            for match in _TOKEN.finditer(text)
+        ]
+
+        found = []
+        for first, (start, _, token) in enumerate(tokens):
+            state = roots.get(token)
+            last = min(first + self._depth, len(tokens))
+            position = first
+            while state is not None:
+                end = tokens[position][1]
+                for index in ends[state]:
+                    # Same tokens; the spacing between them must match too.
+                    if _same_phrase(text[start:end], phrases[index]):
+                        found.append((start, end, index))
+                position += 1
+                if position == last:
+                    break
+                state = trie.get((state, tokens[position][2]))
+        found.sort(key=lambda occurrence: occurrence[1])
+        return found
+
+
+class FuzzyTokenTrie(TokenTrie):
+    """
+    TokenTrie that also matches phrases with misspelled words: a word of the
+    text stands for every listed word within its allowed number of edits
+    (see app.core.deletion_index), and the trie is walked along each of
+    them. Spacing between the words of a phrase is not compared.
+    """
+
+    def __init__(self, phrases: list[str], max_distance: int):
+        self.max_distance = max_distance
+        super().__init__(phrases)
+
+    def _build(self) -> None:
+        super()._build()
+        words = set(self._roots) | {key for _, key in self._trie}
+        self._index = DeletionIndex(
+            sorted(word for word in words if _WORD.match(word)), self.max_distance
+        )
+
+    def updated(self, added: list[str], removed: list[str]) -> "FuzzyTokenTrie":
+        matcher = super().updated(added, removed)
+        # Words of removed phrases stay in the index; they reach no phrase.
+        words = {
+            _fold_token(token) for phrase in added for token in _TOKEN.findall(phrase)
+        }
+        matcher._index = self._index.extended(
+            sorted(word for word in words if _WORD.match(word))
+        )
+        return matcher
+
+    def occurrences(self, text: str) -> list[tuple[int, int, int]]:
+        roots, trie, ends = self._roots, self._trie, self._ends
+        tokens = [
+            (match.start(), match.end(), _fold_token(match.group()))
+            for match in _TOKEN.finditer(text)
+        ]
+        # Per token of the text, itself and the listed words it may stand for.
+        near: dict[str, list[str]] = {}
+        keys = []
+        for _, _, token in tokens:
+            if token not in near:
+                near[token] = [token, *self._index.lookup(token)]
+            keys.append(near[token])
+
+        found = set()
+        for first, (start, _, _) in enumerate(tokens):
+            states = [roots[key] for key in keys[first] if key in roots]
+            last = min(first + self._depth, len(tokens))
+            position = first
+            while states:
+                end = tokens[position][1]
+                for state in states:
+                    for index in ends[state]:
+                        found.add((start, end, index))
+                position += 1
+                if position == last:
+                    break
+                states = [
+                    trie[(state, key)]
+                    for state in states
+                    for key in keys[position]
+                    if (state, key) in trie
+                ]
+        return sorted(found, key=lambda occurrence: (occurrence[1], occurrence[0]))
+
+
+def _same_phrase(matched: str, phrase: str) -> bool:
+    return matched == phrase or (
+        len(matched) == len(phrase)
+        and all(_fold(a) == _fold(b) for a, b in zip(matched, phrase, strict=True))
+    )
+
+
+def _fold_token(token: str) -> str:
+    # Tokens with the same uppercase form (see _fold) get the same key; most
+    # lowercase tokens are their own key.
+    folded = token.upper().lower()
+    return token if folded == token else folded
+
+
+def _bounded(
+    text: str,
+    start: int,
+    end: int,
+    opened: frozenset | set = frozenset(),
+    closed: frozenset | set = frozenset(),
+) -> bool:
+    """
+    The (?<!\\w) and (?!\\w) checks around text[start:end]. opened and closed
+    hold the edges of spans already replaced, which read as "[...]" to later
+    phrases: both edges are non-word characters.
+    """
+    before = start == 0 or start in closed or not _WORD.match(text, start - 1)
+    after = end == len(text) or end in opened or not _WORD.match(text, end)
+    return before and after
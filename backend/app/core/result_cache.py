@@ -0,0 +1,73 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from app.core.cache import LRUCache, register_cache
+from app.core.config import settings
+from app.core.validator_executor import ValidatorRunLog
+from app.models.logging.request_log import RequestStatus
+
+# Final outcomes of /guardrails requests. Keys hash the texts together with
+# the resolved validator configs (banned words, prompts), so an entry can only
+# be hit by a request that would run the exact same validators on the exact
+# same text; entries are also tagged with the stored configs they were
+# resolved from and dropped when one of them is updated or deleted.
+result_cache = register_cache(
+    LRUCache(
+        name="result",
+        max_entries=settings.RESULT_CACHE_MAX_ENTRIES,
+        max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+        ttl_seconds=settings.RESULT_CACHE_TTL_SECONDS,
+    )
+)
+
+
+@dataclass(frozen=True)
+class GuardrailOutcome:
+    status: RequestStatus
+    validated_output: Optional[str] = None
+    error_message: Optional[str] = None
+    metadata: Optional[dict[str, Any]] = None
+    skipped_validators: Optional[list[str]] = None
+    timed_out_validators: Optional[list[str]] = None
+    # Per-validator outcomes of the run, written again as the validator logs
+    # of every request the entry is served to.
+    validator_logs: tuple[ValidatorRunLog, ...] = ()
+
+
+def result_cache_key(
+    validator_items,
+    input_text: str,
+    output_text: Optional[str],
+    fail_fast: bool = False,
+) -> Optional[str]:
+    """
+    Content hash of a request after its stored configs have been resolved, or
+    None when one of its validators is excluded from result caching.
+    """
+    if any(
+        not v_item.cacheable_result
+        or v_item.type in settings.RESULT_CACHE_EXCLUDED_VALIDATORS
+        for v_item in validator_items
+    ):
+        return None
+
+    payload = json.dumps(
+        {
+            "input": input_text,
+            "output": output_text,
+            "fail_fast": fail_fast,
+            "validators": [v_item.cache_dump() for v_item in validator_items],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cache_result(cache_key: str, validator_items, outcome: GuardrailOutcome) -> None:
+    config_ids = set()
+    for v_item in validator_items:
+        config_ids |= v_item.referenced_config_ids()
+    result_cache.put(cache_key, outcome, tags=config_ids)
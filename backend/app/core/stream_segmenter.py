@@ -0,0 +1,47 @@
+import re
+
+# End of a sentence: terminal punctuation (including the Devanagari danda),
+# optional closing quotes/brackets, then whitespace; or a line break. The
+# whitespace must already have arrived, so "3." is held back until we know it
+# is not "3.5".
+_SENTENCE_END = re.compile(r"[.!?।॥]+[\"'”’)\]]*\s+|\n\s*")
+
+
+class StreamSegmenter:
+    """
+    Splits incrementally received text into segments that can be validated on
+    their own: whole sentences, or windows of at most max_chars (cut at the
+    last whitespace) when a sentence runs longer than that.
+
+    Segments keep their surrounding whitespace, so joining them gives back
+    exactly the text that was fed.
+    """
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        self._buffer += text
+        segments = []
+        while True:
+            cut = self._next_cut()
+            if cut is None:
+                return segments
+            segments.append(self._buffer[:cut])
+            self._buffer = self._buffer[cut:]
+
+    def flush(self) -> list[str]:
+        """Returns whatever is left once the stream has ended."""
+        remainder, self._buffer = self._buffer, ""
+        return [remainder] if remainder else []
+
+    def _next_cut(self) -> int | None:
+        match = _SENTENCE_END.search(self._buffer)
+        if match is not None and match.end() <= self.max_chars:
+            return match.end()
+        if len(self._buffer) <= self.max_chars:
+            return None
+
+        space = self._buffer.rfind(" ", 0, self.max_chars)
+        return space + 1 if space > 0 else self.max_chars
@@ -0,0 +1,179 @@
+import re
+import sys
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+import emoji
+import ftfy
+
+from app.core.cache import LRUCache, register_cache
+from app.core.config import settings
+
+# Text ftfy and emoji removal leave unchanged: printable ASCII without "&"
+# (HTML entities), tabs and line breaks, and the Devanagari block. Neither
+# can hold an emoji or mojibake, so only NFKC, whitespace and case apply.
+_PLAIN = re.compile(r"[\t\n\r\x20-\x25\x27-\x7eऀ-ॿ]*")
+_WHITESPACE = re.compile(r"\s+")
+
+# Validators normalize the same text several times per request (input and
+# output stages, retries, batch duplicates); keep the latest results.
+normalization_cache = register_cache(
+    LRUCache(
+        name="normalization",
+        max_entries=settings.NORMALIZATION_CACHE_MAX_ENTRIES,
+        max_bytes=settings.NORMALIZATION_CACHE_MAX_BYTES,
+    )
+)
+
+
+def normalize_for_matching(text: str) -> str:
+    """
+    Normalize input text for detection:
+    - remove emojis
+    - fix encoding issues
+    - normalize unicode (NFKC)
+    - lowercase
+    - normalize whitespace
+    """
+    normalized = normalization_cache.get(text)
+    if normalized is None:
+        normalized = _normalize(text)
+        normalization_cache.put(
+            text, normalized, size=sys.getsizeof(text) + sys.getsizeof(normalized)
+        )
+    return normalized
+
+
+def _normalize(text: str) -> str:
+    if not _PLAIN.fullmatch(text):
+        text = emoji.replace_emoji(text, replace="")
+        text = ftfy.fix_text(text)
+    if not text.isascii():
+        text = unicodedata.normalize("NFKC", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    return text.lower()
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """
+    A normalized copy of a text, with the span of the original text each
+    normalized character came from.
+    """
+
+    original: str
+    text: str
+    starts: tuple[int, ...]
+    ends: tuple[int, ...]
+
+    def replace(self, spans: list[tuple[int, int]], replacement: str) -> str:
+        """
+        Replaces the original text under each (start, end) span of the
+        normalized text. Spans that land on the same original characters are
+        replaced once.
+        """
+        return replace_spans(
+            self.original,
+            [(self.starts[start], self.ends[end - 1]) for start, end in spans],
+            replacement,
+        )
+
+
+def replace_spans(text: str, spans: list[tuple[int, int]], replacement: str) -> str:
+    """Replaces each (start, end) span of text; overlapping spans are replaced once."""
+    merged: list[list[int]] = []
+    for start, end in sorted(spans):
+        if merged and start < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    parts = []
+    position = 0
+    for start, end in merged:
+        parts.append(text[position:start])
+        parts.append(replacement)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def normalize_with_offsets(text: str) -> NormalizedText:
+    """
+    Same normalization as normalize_for_matching, tracking where each
+    character came from. Steps that rewrite text in place (ftfy, NFKC) are
+    aligned with a diff, so a character they produced maps to the whole span
+    it replaced. Not memoized.
+    """
+    current = text
+    starts = list(range(len(text)))
+    ends = list(range(1, len(text) + 1))
+
+    if not _PLAIN.fullmatch(current):
+        current, starts, ends = _track(
+            current, starts, ends, emoji.replace_emoji(current, replace="")
+        )
+        current, starts, ends = _track(current, starts, ends, ftfy.fix_text(current))
+    if not current.isascii():
+        current, starts, ends = _track(
+            current, starts, ends, unicodedata.normalize("NFKC", current)
+        )
+
+    # Each whitespace run becomes one space covering the whole run.
+    collapsed, new_starts, new_ends = [], [], []
+    position = 0
+    for match in _WHITESPACE.finditer(current):
+        collapsed.append(current[position : match.start()])
+        new_starts.extend(starts[position : match.start()])
+        new_ends.extend(ends[position : match.start()])
+        collapsed.append(" ")
+        new_starts.append(starts[match.start()])
+        new_ends.append(ends[match.end() - 1])
+        position = match.end()
+    collapsed.append(current[position:])
+    new_starts.extend(starts[position:])
+    new_ends.extend(ends[position:])
+    current, starts, ends = "".join(collapsed), new_starts, new_ends
+
+    stripped = current.strip()
+    if stripped != current:
+        offset = len(current) - len(current.lstrip())
+        starts = starts[offset : offset + len(stripped)]
+        ends = ends[offset : offset + len(stripped)]
+        current = stripped
+
+    lowered = current.lower()
+    if len(lowered) == len(current):
+        current = lowered  # character for character
+    else:
+        current, starts, ends = _track(current, starts, ends, lowered)
+    return NormalizedText(
+        original=text, text=current, starts=tuple(starts), ends=tuple(ends)
+    )
+
+
+def _track(
+    before: str, starts: list[int], ends: list[int], after: str
+) -> tuple[str, list[int], list[int]]:
+    """Carries the original spans of before over to after."""
+    if after == before:
+        return after, starts, ends
+
+    new_starts: list[int] = []
+    new_ends: list[int] = []
+    matcher = SequenceMatcher(None, before, after, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            new_starts.extend(starts[i1:i2])
+            new_ends.extend(ends[i1:i2])
+        elif tag != "delete":
+            if i1 < i2:
+                span = (starts[i1], ends[i2 - 1])
+            else:
+                # Inserted characters sit between two original characters.
+                edge = starts[i1] if i1 < len(starts) else (ends[-1] if ends else 0)
+                span = (edge, edge)
+            new_starts.extend([span[0]] * (j2 - j1))
+            new_ends.extend([span[1]] * (j2 - j1))
+    return after, new_starts, new_ends
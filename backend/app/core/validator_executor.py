@@ -0,0 +1,373 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from guardrails import OnFailAction
+from guardrails.actions.filter import Filter
+from guardrails.actions.reask import ReAsk
+from guardrails.actions.refrain import Refrain
+from guardrails.errors import ValidationError
+from guardrails.validator_service.validator_service_base import ValidatorServiceBase
+from guardrails.validators import FailResult, PassResult, ValidationResult, Validator
+
+# perform_correction is stateless; one instance serves every request.
+_corrections = ValidatorServiceBase()
+
+
+@dataclass
+class ValidatorRunLog:
+    """Outcome of a single validator, shaped like guardrails' ValidatorLogs."""
+
+    validator_name: str
+    value_before_validation: Any
+    value_after_validation: Any = None
+    validation_result: Optional[ValidationResult] = None
+    # Wall time of the run whose result was used; not set by batch runs.
+    latency_ms: Optional[float] = None
+    # The validator was abandoned at its timeout or the request deadline and
+    # has no validation_result.
+    timed_out: bool = False
+
+
+@dataclass
+class ExecutionResult:
+    validated_output: Optional[str]
+    validator_logs: list[ValidatorRunLog] = field(default_factory=list)
+    # Unexpected validator error; only set by BatchValidatorExecutor, which
+    # must not let one text's failure abort the others.
+    error: Optional[Exception] = None
+
+
+class ValidatorExecutor:
+    """
+    Runs validators on a single value with the same fix chaining and on_fail
+    semantics as a guardrails Guard, but awaiting each validator so LLM-backed
+    validators do not block a worker thread.
+
+    Validators without an async implementation run through Validator.async_validate,
+    which hands the sync validate() to the event loop's default executor.
+
+    With concurrent=True consecutive validators are started together on the
+    current text, up to and including the next barrier (barriers holds one flag
+    per validator; by default every validator that can fix the text, i.e. any
+    on_fail other than noop and exception). Nothing after a barrier starts
+    until it has settled, so a later validator (e.g. a remote LLM) never sees
+    text that an earlier fix would have redacted. Results are still consumed
+    in order, and a result is only used if the validator saw the text the
+    sequential path would have given it: when a validator inside a group stops
+    the run (exception), the later runs are cancelled, and when one rewrites
+    the text (rephrase), they are discarded and restarted on the new text.
+    Validators are therefore expected to depend only on the text, not on
+    metadata returned by earlier validators.
+
+    timeouts holds an optional limit in seconds per validator, counted from
+    when its run was started, and deadline an optional time.monotonic() by
+    which the whole run has to end. A validator that is still running at either limit is
+    cancelled (validators running in a thread are abandoned) and logged as
+    timed out. If fail_open is set for it, the run carries on with the value
+    unchanged; otherwise the run stops without an output. Once the deadline has
+    passed, validators that have not finished yet time out immediately.
+
+    Logs of the last run are kept on the executor (like Guard.history) so that
+    callers can still inspect them when a run ends with an exception.
+    """
+
+    def __init__(
+        self,
+        validators: list[Validator],
+        concurrent: bool = True,
+        barriers: Optional[list[bool]] = None,
+        timeouts: Optional[list[Optional[float]]] = None,
+        fail_open: Optional[list[bool]] = None,
+        deadline: Optional[float] = None,
+    ):
+        self.validators = validators
+        self.concurrent = concurrent
+        self.barriers = barriers or [_is_barrier(v) for v in validators]
+        self.timeouts = timeouts or [None] * len(validators)
+        self.fail_open = fail_open or [False] * len(validators)
+        self.deadline = deadline
+        self.validator_logs: list[ValidatorRunLog] = []
+
+    async def async_validate(self, value: str) -> ExecutionResult:
+        self.validator_logs = []
+        metadata: dict = {}
+        # index -> (text the run was started with, running task, start time)
+        runs: dict[int, tuple[Any, asyncio.Task, float]] = {}
+
+        try:
+            for index, validator in enumerate(self.validators):
+                run = runs.pop(index, None)
+                if run is not None and run[0] != value:
+                    _discard([run, *runs.values()])
+                    runs, run = {}, None
+                if run is None:
+                    runs = self._start(index, value, metadata)
+                    run = runs.pop(index)
+
+                log = ValidatorRunLog(
+                    validator_name=validator.__class__.__name__,
+                    value_before_validation=value,
+                )
+                self.validator_logs.append(log)
+
+                try:
+                    result, log.latency_ms = await asyncio.wait_for(
+                        run[1], self._time_left(index, run[2])
+                    )
+                except asyncio.TimeoutError:
+                    if not run[1].cancelled():
+                        raise  # raised by the validator itself
+                    log.timed_out = True
+                    log.latency_ms = (time.monotonic() - run[2]) * 1000
+                    log.value_after_validation = value
+                    if self.fail_open[index]:
+                        continue
+                    return ExecutionResult(
+                        validated_output=None, validator_logs=self.validator_logs
+                    )
+
+                value, stopped = _apply_result(validator, result, value, log)
+                if stopped:
+                    return ExecutionResult(
+                        validated_output=None, validator_logs=self.validator_logs
+                    )
+                if result.metadata is not None:
+                    metadata = result.metadata
+        finally:
+            _discard(runs.values())
+
+        return ExecutionResult(
+            validated_output=_resolve_output(value, self.validator_logs),
+            validator_logs=self.validator_logs,
+        )
+
+    def validate(self, value: str) -> ExecutionResult:
+        """
+        Runs the validators one by one on the calling thread, calling each
+        validator's validate() directly. For callers without an event loop
+        (scripts, evaluations, sync workers); results match async_validate.
+        Timeouts are not applied, as a running sync call cannot be abandoned.
+        """
+        self.validator_logs = []
+        metadata: dict = {}
+
+        for validator in self.validators:
+            log = ValidatorRunLog(
+                validator_name=validator.__class__.__name__,
+                value_before_validation=value,
+            )
+            self.validator_logs.append(log)
+
+            started = time.perf_counter()
+            result = validator.validate(value, metadata)
+            log.latency_ms = (time.perf_counter() - started) * 1000
+
+            value, stopped = _apply_result(validator, result, value, log)
+            if stopped:
+                return ExecutionResult(
+                    validated_output=None, validator_logs=self.validator_logs
+                )
+            if result.metadata is not None:
+                metadata = result.metadata
+
+        return ExecutionResult(
+            validated_output=_resolve_output(value, self.validator_logs),
+            validator_logs=self.validator_logs,
+        )
+
+    def _time_left(self, index: int, started: float) -> Optional[float]:
+        """Seconds validator index may still run for, or None without a limit."""
+        limits = [] if self.deadline is None else [self.deadline]
+        if self.timeouts[index] is not None:
+            limits.append(started + self.timeouts[index])
+        return min(limits) - time.monotonic() if limits else None
+
+    def _start(
+        self, start: int, value: Any, metadata: dict
+    ) -> dict[int, tuple[Any, asyncio.Task, float]]:
+        stop = len(self.validators) if self.concurrent else start + 1
+        stop = next(
+            (index + 1 for index in range(start, stop) if self.barriers[index]),
+            stop,
+        )
+        started = time.monotonic()
+        return {
+            index: (
+                value,
+                asyncio.ensure_future(
+                    _timed(self.validators[index].async_validate(value, metadata))
+                ),
+                started,
+            )
+            for index in range(start, stop)
+        }
+
+
+def _is_barrier(validator: Validator) -> bool:
+    """Whether a validator can fix the text, by its on_fail or on pass."""
+    return (
+        validator.on_fail_descriptor not in (OnFailAction.NOOP, OnFailAction.EXCEPTION)
+        or validator.override_value_on_pass
+    )
+
+
+async def _timed(run) -> tuple[ValidationResult, float]:
+    started = time.perf_counter()
+    result = await run
+    return result, (time.perf_counter() - started) * 1000
+
+
+def _discard(runs) -> None:
+    """Cancel runs whose results will not be used, without leaking their errors."""
+    for _, task, _ in runs:
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+
+
+class BatchValidatorExecutor:
+    """
+    Runs the same validator list over many texts. Each position in the list
+    is run for every text before moving to the next one, so validators that
+    implement validate_batch(values) -> list[ValidationResult] (e.g. PIIRemover)
+    get one batched model call per position; others run per text, at most
+    max_concurrency at a time. Per text, fixes chain exactly as in
+    ValidatorExecutor.
+
+    rows holds one validator list per text, all bound from the same config
+    list, so a batch call on one row's validator is valid for every row.
+    """
+
+    def __init__(self, rows: list[list[Validator]], max_concurrency: int = 16):
+        self.rows = rows
+        self.max_concurrency = max_concurrency
+
+    async def async_validate(self, values: list[str]) -> list[ExecutionResult]:
+        if len(values) != len(self.rows):
+            raise ValueError("Expected one value per validator row.")
+
+        current = list(values)
+        metadata: list[dict] = [{} for _ in values]
+        logs: list[list[ValidatorRunLog]] = [[] for _ in values]
+        stopped = [False] * len(values)
+        errors: list[Optional[Exception]] = [None] * len(values)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(validator: Validator, value: Any, meta: dict):
+            async with semaphore:
+                return await validator.async_validate(value, meta)
+
+        positions = len(self.rows[0]) if self.rows else 0
+        for position in range(positions):
+            active = [i for i in range(len(values)) if not stopped[i]]
+            if not active:
+                break
+
+            lead = self.rows[active[0]][position]
+            results: list[Any] = []
+            batch = getattr(lead, "validate_batch", None)
+            if batch is not None:
+                loop = asyncio.get_running_loop()
+                try:
+                    results = await loop.run_in_executor(
+                        None, batch, [current[i] for i in active]
+                    )
+                except Exception:
+                    # Retry per text so one bad input only fails itself.
+                    results = []
+            if not results:
+                results = await asyncio.gather(
+                    *(
+                        run_one(self.rows[i][position], current[i], metadata[i])
+                        for i in active
+                    ),
+                    return_exceptions=True,
+                )
+
+            for i, result in zip(active, results, strict=True):
+                validator = self.rows[i][position]
+                log = ValidatorRunLog(
+                    validator_name=validator.__class__.__name__,
+                    value_before_validation=current[i],
+                )
+                logs[i].append(log)
+                if isinstance(result, Exception):
+                    errors[i] = result
+                    stopped[i] = True
+                    continue
+                try:
+                    current[i], stopped[i] = _apply_result(
+                        validator, result, current[i], log
+                    )
+                except Exception as exc:
+                    errors[i] = exc
+                    stopped[i] = True
+                    continue
+                if result.metadata is not None:
+                    metadata[i] = result.metadata
+
+        return [
+            ExecutionResult(
+                validated_output=None
+                if stopped[i]
+                else _resolve_output(current[i], logs[i]),
+                validator_logs=logs[i],
+                error=errors[i],
+            )
+            for i in range(len(values))
+        ]
+
+
+def _apply_result(
+    validator: Validator, result: ValidationResult, value: Any, log: ValidatorRunLog
+) -> tuple[Any, bool]:
+    """
+    Records a validator result and applies its on_fail action to the running
+    value, as guardrails' SequentialValidatorService does. Returns the new value
+    and whether the run has to stop without an output (exception, filter,
+    refrain, reask).
+    """
+    log.validation_result = result
+
+    if isinstance(result, FailResult):
+        try:
+            value = _corrections.perform_correction(result, value, validator)
+        except ValidationError:
+            # on_fail=exception: stop here; the fail result is in the logs.
+            log.value_after_validation = value
+            return value, True
+    elif isinstance(result, PassResult):
+        if (
+            validator.override_value_on_pass
+            and result.value_override is not result.ValueOverrideSentinel
+        ):
+            value = result.value_override
+    else:
+        raise RuntimeError(f"Unexpected result type {type(result)}")
+
+    log.value_after_validation = value
+    return value, isinstance(value, (Refrain, Filter, ReAsk))
+
+
+def _resolve_output(value: Any, logs: list[ValidatorRunLog]) -> Optional[str]:
+    """
+    Mirrors how a Guard decides its validated_output: a failure whose input is
+    still the final value (or that was "fixed" to None) is unresolved and fails
+    the call, unless every failure was a noop that left the value untouched.
+    """
+    failed = [log for log in logs if isinstance(log.validation_result, FailResult)]
+    unresolved = any(
+        (value is None and log.value_before_validation is not None)
+        or value == log.value_before_validation
+        for log in failed
+    )
+    if not unresolved:
+        return value
+
+    if all(log.value_after_validation is log.value_before_validation for log in failed):
+        return value
+    return None
@@ -0,0 +1,106 @@
+import threading
+from typing import Any, Optional
+
+from app.core.enum import GuardrailOnFail, ValidatorCostClass
+from app.core.llm_response_cache import is_cache_hit
+from app.core.validator_executor import ValidatorRunLog
+
+# Starting estimates per cost class, in milliseconds. They are an order of
+# magnitude apart so static classes decide the order until enough latencies
+# have been observed for a validator type.
+SEED_LATENCY_MS = {
+    ValidatorCostClass.Lexical: 1.0,
+    ValidatorCostClass.LocalModel: 50.0,
+    ValidatorCostClass.RemoteLLM: 800.0,
+}
+MIN_OBSERVATIONS = 5
+SMOOTHING = 0.2
+
+
+class ValidatorCostModel:
+    """
+    Process-wide latency estimate per validator type: the static cost class
+    until MIN_OBSERVATIONS runs have been seen, then an exponentially weighted
+    moving average of observed run latencies.
+    """
+
+    def __init__(
+        self, min_observations: int = MIN_OBSERVATIONS, smoothing: float = SMOOTHING
+    ):
+        self.min_observations = min_observations
+        self.smoothing = smoothing
+        self._lock = threading.Lock()
+        # validator type -> (observations, average latency in ms)
+        self._observed: dict[str, tuple[int, float]] = {}
+
+    def observe(self, validator_type: str, latency_ms: float) -> None:
+        with self._lock:
+            count, average = self._observed.get(validator_type, (0, latency_ms))
+            average += self.smoothing * (latency_ms - average)
+            self._observed[validator_type] = (count + 1, average)
+
+    def estimate(self, v_item) -> float:
+        with self._lock:
+            count, average = self._observed.get(v_item.type, (0, 0.0))
+        if count >= self.min_observations:
+            return average
+        return SEED_LATENCY_MS[v_item.cost_class]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._observed.clear()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Observed latency per validator type, reported by /utils/cache-stats."""
+        with self._lock:
+            return {
+                validator_type: {
+                    "observations": count,
+                    "average_latency_ms": round(average, 3),
+                    # Whether plan_validators uses the average over the seed.
+                    "used_for_planning": count >= self.min_observations,
+                }
+                for validator_type, (count, average) in self._observed.items()
+            }
+
+
+cost_model = ValidatorCostModel()
+
+
+def plan_validators(validator_items) -> list:
+    """
+    Orders validators cheapest first for fail_fast runs, where semantics allow.
+    Validators that can rewrite the text (on_fail fix or rephrase) keep their
+    requested positions, and only the on_fail=exception validators between
+    two of them are reordered, so no validator moves across a rewrite and
+    none sees text an earlier fix would have changed. The sort is stable, so
+    validators of equal cost keep their requested order.
+    """
+    planned, movable = [], []
+    for v_item in validator_items:
+        if v_item.on_fail == GuardrailOnFail.Exception:
+            movable.append(v_item)
+            continue
+        planned += sorted(movable, key=cost_model.estimate)
+        planned.append(v_item)
+        movable = []
+    return planned + sorted(movable, key=cost_model.estimate)
+
+
+def record_latencies(validator_items, validator_logs: list[ValidatorRunLog]) -> None:
+    """
+    Feeds the latencies of the validators that ran back into the cost model.
+    Results served from the LLM response cache are left out, as they say
+    nothing about what the next miss costs.
+    """
+    for v_item, log in zip(validator_items, validator_logs, strict=False):
+        if log.latency_ms is not None and not is_cache_hit(log.validation_result):
+            cost_model.observe(v_item.type, log.latency_ms)
+
+
+def skipped_validators(
+    validator_items, validator_logs: list[ValidatorRunLog]
+) -> Optional[list[str]]:
+    """Types of the validators a run stopped before reaching, if any."""
+    skipped = [v_item.type for v_item in validator_items[len(validator_logs) :]]
+    return skipped or None
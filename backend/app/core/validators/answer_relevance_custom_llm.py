@@ -10,7 +10,7 @@ from guardrails.validators import (
     Validator,
     register_validator,
 )
-from litellm import completion
+from litellm import acompletion, completion
 
 from app.core.config import settings
 from app.core.constants import (
@@ -56,6 +56,39 @@ class AnswerRelevanceCustomLLM(Validator):
         self.output = output
 
     def _validate(self, value: str, metadata: dict | None = None) -> ValidationResult:
+        prompt = self._build_prompt()
+        if isinstance(prompt, FailResult):
+            return prompt
+
+        try:
+            response = completion(**self._completion_kwargs(prompt))
+            response_text = response.choices[0].message.content.strip().upper()
+        except Exception as e:
+            return FailResult(
+                error_message=ANSWER_RELEVANCE_LLM_CALL_FAILED_TEMPLATE.format(error=e)
+            )
+
+        return self._parse_response(value, response_text)
+
+    async def async_validate(
+        self, value: str, metadata: dict | None = None
+    ) -> ValidationResult:
+        """Same as _validate, but awaits the LLM call instead of blocking a thread."""
+        prompt = self._build_prompt()
+        if isinstance(prompt, FailResult):
+            return prompt
+
+        try:
+            response = await acompletion(**self._completion_kwargs(prompt))
+            response_text = response.choices[0].message.content.strip().upper()
+        except Exception as e:
+            return FailResult(
+                error_message=ANSWER_RELEVANCE_LLM_CALL_FAILED_TEMPLATE.format(error=e)
+            )
+
+        return self._parse_response(value, response_text)
+
+    def _build_prompt(self) -> str | FailResult:
         query = self.input
         answer = self.output
 
@@ -63,7 +96,7 @@ class AnswerRelevanceCustomLLM(Validator):
             return FailResult(error_message=ANSWER_RELEVANCE_EMPTY_FIELDS_ERROR)
 
         try:
-            prompt = self.prompt_template.format(query=query, answer=answer)
+            return self.prompt_template.format(query=query, answer=answer)
         except KeyError as e:
             return FailResult(
                 error_message=ANSWER_RELEVANCE_MISSING_PLACEHOLDER_TEMPLATE.format(
@@ -71,18 +104,14 @@ class AnswerRelevanceCustomLLM(Validator):
                 )
             )
 
-        try:
-            response = completion(
-                model=self.llm_callable,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-            )
-            response_text = response.choices[0].message.content.strip().upper()
-        except Exception as e:
-            return FailResult(
-                error_message=ANSWER_RELEVANCE_LLM_CALL_FAILED_TEMPLATE.format(error=e)
-            )
+    def _completion_kwargs(self, prompt: str) -> dict:
+        return {
+            "model": self.llm_callable,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 10,
+        }
 
+    def _parse_response(self, value: str, response_text: str) -> ValidationResult:
         if response_text.startswith("YES"):
             return PassResult(value=value)
 
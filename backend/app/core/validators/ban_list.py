@@ -0,0 +1,153 @@
+import copy
+from typing import Callable, Optional
+
+from guardrails import OnFailAction
+from guardrails.hub import BanList
+from guardrails.validators import (
+    FailResult,
+    PassResult,
+    ValidationResult,
+    Validator,
+    register_validator,
+)
+
+from app.core.phrase_matcher import FuzzyTokenTrie, TokenTrie
+from app.core.text_normalizer import _normalize, normalize_with_offsets, replace_spans
+
+# Punctuation that closes a clause; a space left before it by a removed word
+# is dropped with the word ("no sonography, please" -> "no, please").
+_CLOSING_PUNCTUATION = ".,!?;:)]}"
+
+
+@register_validator(name="trie-ban-list", data_type="string")
+class TrieBanList(Validator):
+    """
+    Removes banned words and phrases from text in one scan. The list is
+    normalized like the text (case, Unicode forms, whitespace) and compiled
+    into a trie of tokens, so the cost of a check grows with the length of
+    the text, not with the number of banned words.
+
+    With max_distance, words of the text within that many edits of a banned
+    word (fewer for short words, see app.core.deletion_index) match it too.
+    """
+
+    def __init__(
+        self,
+        banned_words: list[str],
+        on_fail: Optional[Callable] = OnFailAction.FIX,
+        max_distance: int = 0,
+    ):
+        # Normalized phrase -> the banned word as listed, first one wins, and
+        # how many distinct listed words normalize to it.
+        phrases: dict[str, str] = {}
+        self._variants: dict[str, int] = {}
+        for word in dict.fromkeys(banned_words):
+            phrase = _normalize(word)
+            if phrase:
+                phrases.setdefault(phrase, word)
+                self._variants[phrase] = self._variants.get(phrase, 0) + 1
+        self._listed = phrases
+        self._matcher = (
+            FuzzyTokenTrie(list(phrases), max_distance)
+            if max_distance
+            else TokenTrie(list(phrases))
+        )
+        super().__init__(on_fail=on_fail)
+
+    def updated(
+        self, banned_words: list[str], added: list[str], removed: list[str]
+    ) -> "TrieBanList":
+        """
+        The validator for banned_words, which is this validator's list with
+        the distinct words added appended and removed taken out, derived
+        without recompiling the whole list.
+        """
+        validator = copy.copy(self)
+        listed = validator._listed = dict(self._listed)
+        variants = validator._variants = dict(self._variants)
+        new_phrases, dropped = [], []
+        for word in removed:
+            phrase = _normalize(word)
+            if phrase not in variants:
+                continue
+            variants[phrase] -= 1
+            if not variants[phrase]:
+                del variants[phrase], listed[phrase]
+                dropped.append(phrase)
+        for word in added:
+            phrase = _normalize(word)
+            if not phrase:
+                continue
+            if phrase not in variants:
+                listed[phrase] = word
+                new_phrases.append(phrase)
+            variants[phrase] = variants.get(phrase, 0) + 1
+        # A phrase still listed through another spelling is shown as that one,
+        # the first in banned_words; one pass finds them all.
+        removed_words = set(removed)
+        respelled = {
+            phrase
+            for phrase in map(_normalize, removed)
+            if listed.get(phrase) in removed_words
+        }
+        for word in banned_words:
+            if not respelled:
+                break
+            phrase = _normalize(word)
+            if phrase in respelled:
+                listed[phrase] = word
+                respelled.discard(phrase)
+        validator._matcher = self._matcher.updated(new_phrases, dropped)
+        return validator
+
+    def _validate(self, value: str, metadata: dict | None = None) -> ValidationResult:
+        normalized = normalize_with_offsets(value)
+        found, spans = self._matcher.find_spans(normalized.text)
+        if not found:
+            return PassResult(value=value)
+
+        spans = [
+            (normalized.starts[start], normalized.ends[end - 1]) for start, end in spans
+        ]
+        return FailResult(
+            error_message=(
+                "Output contains banned words: "
+                f"{', '.join(self._listed[phrase] for phrase in found)}"
+            ),
+            fix_value=replace_spans(value, _with_spacing(value, spans), ""),
+        )
+
+
+def _with_spacing(text: str, spans: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Widens each span by one space, so removing it does not leave two behind."""
+    widened = []
+    for start, end in spans:
+        before = text[start - 1] if start > 0 else ""
+        after = text[end] if end < len(text) else ""
+        if before.isspace() and (
+            not after or after.isspace() or after in _CLOSING_PUNCTUATION
+        ):
+            start -= 1
+        elif not before and after.isspace():
+            end += 1
+        widened.append((start, end))
+    return widened
+
+
+def build_ban_list(
+    banned_words: list[str],
+    engine: str,
+    on_fail: Optional[Callable] = None,
+    max_distance: Optional[int] = None,
+) -> Validator:
+    """
+    The ban list validator for an engine: "hub" or "trie". max_distance
+    defaults to each engine's own (1 for the hub, exact matching for the trie).
+    """
+    if engine == "trie":
+        return TrieBanList(
+            banned_words=banned_words, on_fail=on_fail, max_distance=max_distance or 0
+        )
+    if max_distance is None:
+        return BanList(banned_words=banned_words, on_fail=on_fail)
+    return BanList(banned_words=banned_words, max_l_dist=max_distance, on_fail=on_fail)
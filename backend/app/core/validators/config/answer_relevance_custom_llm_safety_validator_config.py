@@ -1,13 +1,17 @@
-from typing import Literal
+from typing import ClassVar, Literal, Set
 from uuid import UUID
 
 from app.core.config import settings
+from app.core.enum import TimeoutPolicy, ValidatorCostClass
 from app.core.validators.answer_relevance_custom_llm import AnswerRelevanceCustomLLM
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 
 class AnswerRelevanceCustomLLMSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["answer_relevance_custom_llm"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.RemoteLLM
+    cacheable_result: ClassVar[bool] = False
+    timeout_policy: ClassVar[TimeoutPolicy] = TimeoutPolicy.FailOpen
     llm_callable: str = settings.ANSWER_RELEVANCE_LLM_MODEL
     # Inline prompt template with {query} and {answer} placeholders.
     # If None, the validator uses its built-in default.
@@ -18,6 +22,12 @@ class AnswerRelevanceCustomLLMSafetyValidatorConfig(BaseValidatorConfig):
     input: str = ""
     output: str = ""
 
+    # input/output are baked into the validator, so it is built per request.
+    cacheable: ClassVar[bool] = False
+
+    def referenced_config_ids(self) -> Set[UUID]:
+        return {self.custom_prompt_id} if self.custom_prompt_id else set()
+
     def build(self):
         if not settings.OPENAI_API_KEY:
             raise ValueError(
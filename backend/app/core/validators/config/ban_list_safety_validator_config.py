@@ -1,16 +1,29 @@
-from typing import List, Literal, Optional
+from typing import Any, ClassVar, Dict, List, Literal, Optional, Set
 from uuid import UUID
 
-from guardrails.hub import BanList
-from pydantic import model_validator
+from pydantic import Field, PrivateAttr, model_validator
 
+from app.core.ban_list_cache import CompiledBanList
+from app.core.config import settings
+from app.core.enum import ValidatorCostClass
+from app.core.validators.ban_list import build_ban_list
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 
 class BanListSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["ban_list"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.Lexical
+    streamable: ClassVar[bool] = True
     banned_words: Optional[List[str]] = None  # list of banned words to be redacted
     ban_list_id: Optional[UUID] = None
+    # "hub" (Guardrails Hub BanList, fuzzy) or "trie" (exact words and phrases
+    # in one scan, for large lists); defaults to BAN_LIST_ENGINE.
+    engine: Optional[Literal["hub", "trie"]] = None
+    # Edits a word may be away from a banned word and still match; defaults to
+    # 1 for "hub" and exact matching for "trie".
+    max_distance: Optional[int] = Field(default=None, ge=0, le=2)
+    # Set when banned_words were resolved from a stored ban list.
+    _compiled: Optional[CompiledBanList] = PrivateAttr(default=None)
 
     @model_validator(mode="after")
     def validate_ban_list_source(self):
@@ -18,8 +31,31 @@ class BanListSafetyValidatorConfig(BaseValidatorConfig):
             raise ValueError("Either banned_words or ban_list_id must be provided.")
         return self
 
+    def resolve_engine(self) -> str:
+        return self.engine or settings.BAN_LIST_ENGINE
+
+    def use_compiled(self, compiled: CompiledBanList) -> None:
+        """Resolves this config to a compiled version of its stored ban list."""
+        self._compiled = compiled
+        self.banned_words = compiled.banned_words
+
+    def referenced_config_ids(self) -> Set[UUID]:
+        return {self.ban_list_id} if self.ban_list_id else set()
+
+    def cache_dump(self, exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
+        data = super().cache_dump(exclude)
+        if self._compiled is not None:
+            # The version identifies the words without hashing all of them.
+            data.pop("banned_words", None)
+            data["ban_list_version"] = self._compiled.updated_at.isoformat()
+        return data
+
     def build(self):
-        return BanList(
-            banned_words=self.banned_words or [],
+        if self._compiled is not None:
+            return self.bind(self._compiled.validator)
+        return build_ban_list(
+            self.banned_words or [],
+            self.resolve_engine(),
             on_fail=self.resolve_on_fail(),
+            max_distance=self.max_distance,
         )
@@ -1,11 +1,19 @@
-from typing import Any, Dict, Optional
+import copy
+from typing import Any, ClassVar, Dict, Optional, Set
+from uuid import UUID
 
 from guardrails import OnFailAction
 from guardrails.validators import FailResult, Validator
-from pydantic import ConfigDict, PrivateAttr
+from pydantic import ConfigDict, Field, PrivateAttr
 from sqlmodel import SQLModel
 
-from app.core.enum import GuardrailOnFail, ValidatorType
+from app.core.config import settings
+from app.core.enum import (
+    GuardrailOnFail,
+    TimeoutPolicy,
+    ValidatorCostClass,
+    ValidatorType,
+)
 from app.core.on_fail_actions import rephrase_query_on_fail
 
 
@@ -13,8 +21,33 @@ class BaseValidatorConfig(SQLModel):
     model_config = ConfigDict(extra="forbid", arbitrary_types_allowed=True)
 
     on_fail: GuardrailOnFail = GuardrailOnFail.Fix
+    # Longest this validator may run, in ms; defaults to VALIDATOR_TIMEOUT_MS.
+    timeout_ms: Optional[int] = Field(default=None, gt=0)
     _validator_metadata: Optional[Dict[str, Any]] = PrivateAttr(default=None)
 
+    # Whether the built validator can be reused across requests. Configs that
+    # carry per-request data into build() must opt out.
+    cacheable: ClassVar[bool] = True
+
+    # Whether the outcome of a request running this validator may be served
+    # from the result cache. Remote models can give the same text a different
+    # verdict, so they opt out.
+    cacheable_result: ClassVar[bool] = True
+
+    # Rough cost of one run, used to order validators in fail_fast mode
+    # (lexical < local model < remote LLM). Refined at runtime from observed
+    # latencies, see app.core.validator_planner.
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.LocalModel
+
+    # Whether the validator judges each sentence on its own, so that it can run
+    # on an output stream one segment at a time (POST /guardrails/stream).
+    streamable: ClassVar[bool] = False
+
+    # What a timeout means for the request: safety checks fail closed (the
+    # request fails), quality checks that cannot leak content fail open (the
+    # validator is skipped). Overridable per type with VALIDATOR_TIMEOUT_POLICY.
+    timeout_policy: ClassVar[TimeoutPolicy] = TimeoutPolicy.FailClosed
+
     def _on_fix(self, value: str, fail_result: FailResult):
         fix_value = fail_result.fix_value if fail_result else None
         if not fix_value:
@@ -43,5 +76,41 @@ class BaseValidatorConfig(SQLModel):
             "Expected one of: exception, fix, rephrase."
         )
 
+    def resolve_timeout_ms(self) -> Optional[int]:
+        if self.timeout_ms is not None:
+            return self.timeout_ms
+        return settings.VALIDATOR_TIMEOUT_MS.get(self.type)  # type: ignore[attr-defined]
+
+    def resolve_timeout_policy(self) -> TimeoutPolicy:
+        policy = settings.VALIDATOR_TIMEOUT_POLICY.get(self.type)  # type: ignore[attr-defined]
+        return TimeoutPolicy(policy) if policy is not None else self.timeout_policy
+
+    def cache_dump(self, exclude: Optional[Set[str]] = None) -> Dict[str, Any]:
+        """
+        The config as JSON for cache keys. Configs resolved from a stored
+        config may stand in the stored config's version for the data resolved
+        from it.
+        """
+        return self.model_dump(mode="json", exclude=exclude)
+
+    def bind(self, prototype: Validator) -> Validator:
+        """
+        Shallow-copy a built validator and attach this config's on_fail
+        handler, so fix metadata is recorded on this request's config object.
+        """
+        validator = copy.copy(prototype)
+        on_fail = self.resolve_on_fail()
+        if isinstance(on_fail, OnFailAction):
+            validator.on_fail_descriptor = on_fail
+            validator.on_fail_method = None
+        else:
+            validator.on_fail_descriptor = OnFailAction.CUSTOM
+            validator._set_on_fail_method(on_fail)
+        return validator
+
+    def referenced_config_ids(self) -> Set[UUID]:
+        """Ids of stored configs (ban lists, prompt configs) this config was resolved from."""
+        return set()
+
     def build(self) -> Validator:
         raise NotImplementedError(f"{self.__class__.__name__} must implement build()")
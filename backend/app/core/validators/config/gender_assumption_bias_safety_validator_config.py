@@ -1,12 +1,13 @@
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
-from app.core.enum import BiasCategories
+from app.core.enum import BiasCategories, ValidatorCostClass
 from app.core.validators.gender_assumption_bias import GenderAssumptionBias
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 
 class GenderAssumptionBiasSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["gender_assumption_bias"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.Lexical
     categories: Optional[List[BiasCategories]] = [
         BiasCategories.All
     ]  # preferred category (based on sector)
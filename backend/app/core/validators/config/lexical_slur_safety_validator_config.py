@@ -1,20 +1,28 @@
-from typing import List, Literal
+from typing import ClassVar, List, Literal
 
-from app.core.enum import SlurSeverity
+from app.core.enum import SlurSeverity, ValidatorCostClass
 from app.core.validators.lexical_slur import LexicalSlur
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 
 class LexicalSlurSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["uli_slur_match"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.Lexical
+    streamable: ClassVar[bool] = True
     languages: List[str] = ["en", "hi"]  # list of languages to check slurs in
     severity: Literal[
         "low", "medium", "high", "all"
     ] = "all"  # severity level of slurs to check
+    redact_original: bool = False  # redact the text as sent, not its normalized copy
+    match_variants: bool = (
+        False  # also match spaced-out, leetspeak and transliterated spellings
+    )
 
     def build(self):
         return LexicalSlur(
             languages=self.languages,
             severity=SlurSeverity(self.severity),
             on_fail=self.resolve_on_fail(),
+            redact_original=self.redact_original,
+            match_variants=self.match_variants,
         )
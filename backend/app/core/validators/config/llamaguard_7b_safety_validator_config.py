@@ -1,7 +1,8 @@
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from guardrails.hub import LlamaGuard7B
 
+from app.core.enum import ValidatorCostClass
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 POLICY_NAME_MAP = {
@@ -16,6 +17,8 @@ POLICY_NAME_MAP = {
 
 class LlamaGuard7BSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["llamaguard_7b"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.RemoteLLM
+    cacheable_result: ClassVar[bool] = False
     policies: Optional[List[str]] = None
 
     def _resolve_policies(self) -> Optional[List[str]]:
@@ -1,15 +1,17 @@
-from typing import Literal
+from typing import ClassVar, Literal
 
 from guardrails.hub import LLMCritic
 
 from app.core.config import settings
 from app.core.constants import LLM_CRITIC_REPHRASE_MESSAGE
-from app.core.enum import GuardrailOnFail
+from app.core.enum import GuardrailOnFail, ValidatorCostClass
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 
 class LLMCriticSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["llm_critic"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.RemoteLLM
+    cacheable_result: ClassVar[bool] = False
     metrics: dict
     max_score: int
     llm_callable: str
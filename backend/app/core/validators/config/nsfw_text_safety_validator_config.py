@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import ClassVar, Literal, Optional
 
 from guardrails.hub import NSFWText
 
@@ -7,6 +7,7 @@ from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 class NSFWTextSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["nsfw_text"]
+    streamable: ClassVar[bool] = True
     threshold: float = 0.8
     validation_method: str = "sentence"
     device: Optional[str] = "cpu"
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import List, Literal, Optional
+from typing import ClassVar, List, Literal, Optional
 
 from app.core.validators.pii_remover import PIIRemover
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
@@ -7,12 +7,16 @@ from app.core.validators.config.base_validator_config import BaseValidatorConfig
 
 class PIIRemoverSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["pii_remover"]
+    streamable: ClassVar[bool] = True
     entity_types: Optional[List[str]] = None  # list of PII entity types to remove
     threshold: float = 0.5  # confidence threshold for PII detection
+    # spaCy model tier; the deployment's PII_SPACY_MODEL when unset
+    spacy_model: Optional[Literal["sm", "md", "lg", "trf"]] = None
 
     def build(self):
         return PIIRemover(
             entity_types=self.entity_types,
             threshold=self.threshold,
             on_fail=self.resolve_on_fail(),
+            spacy_model=self.spacy_model,
         )
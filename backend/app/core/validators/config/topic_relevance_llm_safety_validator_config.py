@@ -1,20 +1,31 @@
-from typing import Literal, Optional
+from typing import ClassVar, Literal, Optional, Set
 from uuid import UUID
 
 from pydantic import Field
 
 from app.core.config import settings
+from app.core.enum import TimeoutPolicy, ValidatorCostClass
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 from app.core.validators.topic_relevance_llm import TopicRelevanceLLM
 
 
 class TopicRelevanceLLMSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["topic_relevance_llm"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.RemoteLLM
+    cacheable_result: ClassVar[bool] = False
+    timeout_policy: ClassVar[TimeoutPolicy] = TimeoutPolicy.FailOpen
     configuration: Optional[str] = None
     llm_callable: str = settings.DEFAULT_LLM_CALLABLE
     threshold: int = Field(default=settings.TOPIC_RELEVANCE_LLM_THRESHOLD, ge=1, le=3)
     prompt_schema_version: int = Field(default=1, ge=1)
     topic_relevance_config_id: Optional[UUID] = None
+    # Reuse the LLM's verdict for a repeated query (see LLM_RESPONSE_CACHE_*)
+    cache_responses: bool = True
+
+    def referenced_config_ids(self) -> Set[UUID]:
+        if self.topic_relevance_config_id is None:
+            return set()
+        return {self.topic_relevance_config_id}
 
     def build(self):
         if not settings.OPENAI_API_KEY:
@@ -28,4 +39,5 @@ class TopicRelevanceLLMSafetyValidatorConfig(BaseValidatorConfig):
             threshold=self.threshold,
             prompt_schema_version=self.prompt_schema_version,
             on_fail=self.resolve_on_fail(),
+            cache_responses=self.cache_responses,
         )
@@ -1,17 +1,28 @@
-from typing import Literal, Optional
+from typing import ClassVar, Literal, Optional, Set
 from uuid import UUID
 
 from app.core.config import settings
+from app.core.enum import TimeoutPolicy, ValidatorCostClass
 from app.core.validators.config.base_validator_config import BaseValidatorConfig
 from app.core.validators.topic_relevance import TopicRelevance
 
 
 class TopicRelevanceSafetyValidatorConfig(BaseValidatorConfig):
     type: Literal["topic_relevance"]
+    cost_class: ClassVar[ValidatorCostClass] = ValidatorCostClass.RemoteLLM
+    cacheable_result: ClassVar[bool] = False
+    timeout_policy: ClassVar[TimeoutPolicy] = TimeoutPolicy.FailOpen
     configuration: Optional[str] = None
     prompt_schema_version: Optional[int] = None
     llm_callable: str = settings.DEFAULT_LLM_CALLABLE
     topic_relevance_config_id: Optional[UUID] = None
+    # Reuse the LLM's verdict for a repeated query (see LLM_RESPONSE_CACHE_*)
+    cache_responses: bool = True
+
+    def referenced_config_ids(self) -> Set[UUID]:
+        if self.topic_relevance_config_id is None:
+            return set()
+        return {self.topic_relevance_config_id}
 
     def build(self):
         if not settings.OPENAI_API_KEY:
@@ -24,4 +35,5 @@ class TopicRelevanceSafetyValidatorConfig(BaseValidatorConfig):
             prompt_schema_version=self.prompt_schema_version or 1,
             llm_callable=self.llm_callable,
             on_fail=self.resolve_on_fail(),
+            cache_responses=self.cache_responses,
         )
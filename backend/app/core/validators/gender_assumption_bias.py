@@ -14,6 +14,8 @@ from guardrails.validators import (
 from app.core.config import Settings
 from app.core.enum import BiasCategories
 
+_WORD = re.compile(r"\w")
+
 
 @register_validator(name="gender-assumption-bias", data_type="string")
 class GenderAssumptionBias(Validator):
@@ -21,32 +23,32 @@ class GenderAssumptionBias(Validator):
     Validate text for the presence of gender assumption in LLM generated outputs.
     """
 
+    # Lexicon and compiled rewriter per category list, shared by every
+    # instance in the process.
+    _REWRITER_CACHE: dict = {}
+
     def __init__(
         self,
         categories: Optional[List[BiasCategories]] = None,
         on_fail: Optional[Callable] = OnFailAction.FIX,
     ):
         self.categories = categories or [BiasCategories.All]
-        self.gender_bias_list = self.load_gender_bias_list(self.categories)
+        cache_key = tuple(
+            category.value if hasattr(category, "value") else str(category)
+            for category in self.categories
+        )
+        rewriter = self._REWRITER_CACHE.get(cache_key)
+        if rewriter is None:
+            rewriter = BiasRewriter(self.load_gender_bias_list(self.categories))
+            self._REWRITER_CACHE[cache_key] = rewriter
+        self.gender_bias_list = rewriter.entries
+        self._rewriter = rewriter
         super().__init__(on_fail=on_fail)
 
     def _validate(self, value: str, metadata: dict | None = None) -> ValidationResult:
-        detected_biased_words = []
-        bias_check = False
-
-        for entry in self.gender_bias_list:
-            word = entry["word"]
-            neutral_term = entry["neutral-term"]
-
-            pattern = rf"\b{re.escape(word)}\b"
-
-            if re.search(pattern, value, flags=re.IGNORECASE):
-                detected_biased_words.append(word)
+        detected_biased_words, value = self._rewriter.rewrite(value)
 
-                value = re.sub(pattern, neutral_term, value, flags=re.IGNORECASE)
-                bias_check = True
-
-        if bias_check:
+        if detected_biased_words:
             return FailResult(
                 error_message=f"Detected gender assumption bias: {detected_biased_words}",
                 fix_value=value,
@@ -81,3 +83,125 @@ class GenderAssumptionBias(Validator):
                     {"word": row["word"], neutral_term_col: row[neutral_term_col]}
                 )
         return gender_bias_list
+
+
+class BiasRewriter:
+    """
+    Replaces every lexicon word with its neutral term in one pass over the
+    text, with the same result as substituting each entry in list order:
+
+        for entry in entries:
+            if re.search(rf"\\b{re.escape(word)}\\b", text, re.IGNORECASE):
+                text = re.sub(...)
+
+    Entries are tried in list order at each position. A neutral term that a
+    later entry matches again (midwife -> "birth attendant" -> attendant) is
+    rewritten ahead of time, so chained entries are reported as well.
+
+    Devanagari vowel signs are non-word characters to \\b, so a replacement
+    can move a word boundary, or two words can overlap inside one. When a
+    match touches such a character, the text is rewritten entry by entry
+    instead.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self.entries = entries
+        first: dict[str, int] = {}
+        for index, entry in enumerate(entries):
+            first.setdefault(entry["word"], index)
+
+        self._patterns = [
+            re.compile(rf"\b{re.escape(entry['word'])}\b", re.IGNORECASE)
+            for entry in entries
+        ]
+        self._words = list(first)
+        self._alternatives = {word: n for n, word in enumerate(self._words)}
+        # (replacement, entries it counts as detected) per word
+        self._replacements = [self._chain(index) for index in first.values()]
+        # Non-word characters used inside words (vowel signs, nukta, virama).
+        self._marks = {char for word in first for char in word if not _WORD.match(char)}
+        self._marked = [any(char in self._marks for char in word) for word in first]
+        self._longest = max(map(len, first), default=0)
+
+        self._pattern = None
+        if first:
+            # Checking the first character before trying each word is what
+            # keeps one alternation faster than many separate patterns.
+            initials = re.escape("".join(sorted({word[0] for word in first})))
+            alternatives = "|".join(re.escape(word) for word in first)
+            self._pattern = re.compile(
+                rf"\b(?=[{initials}])(?:{alternatives})\b", re.IGNORECASE
+            )
+
+    def _chain(self, index: int) -> tuple[str, list[int]]:
+        text = self.entries[index]["neutral-term"]
+        detected = [index]
+        for later in range(index + 1, len(self.entries)):
+            if self._patterns[later].search(text):
+                detected.append(later)
+                text = self._substitute(later, text)
+        return text, detected
+
+    def _substitute(self, index: int, text: str) -> str:
+        neutral_term = self.entries[index]["neutral-term"]
+        return self._patterns[index].sub(lambda _: neutral_term, text)
+
+    def rewrite(self, text: str) -> tuple[list[str], str]:
+        """Returns the detected words, in lexicon order, and the rewritten text."""
+        if self._pattern is None:
+            return [], text
+
+        detected: set[int] = set()
+        exact = True
+
+        def replace(match: re.Match) -> str:
+            nonlocal exact
+            start, end = match.span()
+            word = self._alternative(match.group())
+            if exact and not self._isolated(text, start, end, word):
+                exact = False
+            replacement, indices = self._replacements[word]
+            detected.update(indices)
+            return replacement
+
+        rewritten = self._pattern.sub(replace, text)
+        if not exact:
+            return self._rewrite_sequentially(text)
+        return [self.entries[index]["word"] for index in sorted(detected)], rewritten
+
+    def _alternative(self, matched: str) -> int:
+        """The first word that matches, as the alternation tried them."""
+        word = self._alternatives.get(matched.lower())
+        if word is None:
+            word = next(
+                n
+                for n, candidate in enumerate(self._words)
+                if re.fullmatch(re.escape(candidate), matched, re.IGNORECASE)
+            )
+        return word
+
+    def _isolated(self, text: str, start: int, end: int, word: int) -> bool:
+        """
+        Whether replacing text[start:end] leaves every other entry's matches
+        as they were: both neighbours are plain separators, and no other word
+        starts inside this one.
+        """
+        for position in (start - 1, end):
+            if 0 <= position < len(text) and (
+                _WORD.match(text, position) or text[position] in self._marks
+            ):
+                return False
+        if self._marked[word]:
+            # Any word starting inside this one ends before the search limit.
+            inner = self._pattern.search(text, start + 1, end + self._longest + 1)
+            if inner is not None and inner.start() < end:
+                return False
+        return True
+
+    def _rewrite_sequentially(self, text: str) -> tuple[list[str], str]:
+        detected = []
+        for index, entry in enumerate(self.entries):
+            if self._patterns[index].search(text):
+                detected.append(entry["word"])
+                text = self._substitute(index, text)
+        return detected, text
@@ -1,11 +1,14 @@
+import hashlib
+import json
+import logging
+import os
 import re
 import string
-import unicodedata
+import tempfile
+from pathlib import Path
 from typing import Callable, Optional
 
 import emoji
-import ftfy
-import pandas
 from guardrails import OnFailAction
 from guardrails.validators import (
     FailResult,
@@ -15,8 +18,21 @@ from guardrails.validators import (
     Validator,
 )
 
-from app.core.config import Settings
+from app.core.config import Settings, settings
 from app.core.enum import SlurSeverity
+from app.core.phrase_matcher import PhraseMatcher
+from app.core.text_normalizer import (
+    normalize_for_matching,
+    normalize_with_offsets,
+    replace_spans,
+)
+from app.core.variant_folding import VariantIndex
+
+logger = logging.getLogger(__name__)
+
+_DEVANAGARI = re.compile(r"[\u0900-\u097f]")
+# Bump when the layout of the on-disk lexicon artifacts changes.
+_ARTIFACT_VERSION = 2
 
 
 @register_validator(name="lexical-slur", data_type="string")
@@ -25,36 +41,53 @@ class LexicalSlur(Validator):
     Validate text for the presence of lexical slurs using a predefined list.
     """
 
+    # (severity, languages) -> slur list, and slur list -> compiled matcher,
+    # shared by every instance in the process.
     _SLUR_CACHE: dict = {}
+    _MATCHER_CACHE: dict = {}
+    _VARIANT_CACHE: dict = {}
 
     def __init__(
         self,
         severity: SlurSeverity = SlurSeverity.All,
         languages: Optional[list] = None,
         on_fail: Optional[Callable] = OnFailAction.FIX,
+        redact_original: bool = False,
+        match_variants: bool = False,
     ):
         self.severity = severity
         self.languages = languages or ["en", "hi"]
+        # Redact slurs in the text as sent (case, emojis and spacing kept)
+        # instead of returning the normalized copy with redactions.
+        self.redact_original = redact_original
+        # Also match spelling variants of listed slurs ("k u t t a", "kutt@",
+        # Devanagari spellings of romanized entries and the other way round).
+        self.match_variants = match_variants
         self.slur_list = self.load_slur_list()
         self._compile_slur_patterns()
         super().__init__(on_fail=on_fail, search_words=self.slur_list)
 
     def _validate(self, value: str, metadata: dict | None = None) -> ValidationResult:
         original_text = value
-        normalized_text = self.normalize_for_matching(value)
-        detected_slurs = []
+        if self.redact_original:
+            normalized = normalize_with_offsets(value)
+            normalized_text = normalized.text
+        else:
+            normalized_text = self.normalize_for_matching(value)
 
-        for slur, pattern in self._slur_patterns:
-            if pattern.search(normalized_text):
-                detected_slurs.append(slur)
+        detected_slurs, spans = self._slur_matcher.find_spans(normalized_text)
+        if self.match_variants:
+            variants, variant_spans = self._variant_index.find_spans(normalized_text)
+            detected_slurs += [slur for slur in variants if slur not in detected_slurs]
+            spans += variant_spans
 
         if not detected_slurs:
             return PassResult(value=original_text)
 
-        redacted_text = normalized_text
-        for slur, pattern in self._slur_patterns:
-            if slur in detected_slurs:
-                redacted_text = pattern.sub("[REDACTED_SLUR]", redacted_text)
+        if self.redact_original:
+            redacted_text = normalized.replace(spans, "[REDACTED_SLUR]")
+        else:
+            redacted_text = replace_spans(normalized_text, spans, "[REDACTED_SLUR]")
 
         return FailResult(
             error_message=f"Mentioned toxic words: {', '.join(detected_slurs)}",
@@ -69,12 +102,11 @@ class LexicalSlur(Validator):
         - normalize unicode (NFKC)
         - lowercase
         - normalize whitespace
+
+        Results are memoized, and ftfy and emoji removal are skipped for
+        text they cannot change (see app.core.text_normalizer).
         """
-        text = self.remove_emojis(text)
-        text = ftfy.fix_text(text)
-        text = unicodedata.normalize("NFKC", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text.lower()
+        return normalize_for_matching(text)
 
     def remove_emojis(self, text):
         """
@@ -84,30 +116,47 @@ class LexicalSlur(Validator):
 
     def _compile_slur_patterns(self):
         """
-        Compile regex patterns for all slurs.
+        Compile all slurs into one matcher that finds them in a single pass.
         Uses Unicode-safe boundaries and longest-match-first ordering.
         """
-        self._slur_patterns = []
-
-        for slur in self.slur_list:
-            escaped = re.escape(slur)
-            pattern = rf"(?<!\w){escaped}(?!\w)"
-            compiled = re.compile(pattern, re.IGNORECASE)
-            self._slur_patterns.append((slur, compiled))
+        key = tuple(self.slur_list)
+        matcher = self._MATCHER_CACHE.get(key)
+        if matcher is None:
+            matcher = self._MATCHER_CACHE[key] = PhraseMatcher(self.slur_list)
+        self._slur_matcher = matcher
 
-        self._slur_patterns.sort(key=lambda x: len(x[0]), reverse=True)
+        if self.match_variants:
+            index = self._VARIANT_CACHE.get(key)
+            if index is None:
+                index = self._VARIANT_CACHE[key] = VariantIndex(self.slur_list)
+            self._variant_index = index
 
     def load_slur_list(self):
-        cache_key = (
+        severity = (
             self.severity.value
             if hasattr(self.severity, "value")
             else str(self.severity)
         )
+        cache_key = (severity, tuple(sorted(set(self.languages))))
 
         if cache_key in self._SLUR_CACHE:
             return self._SLUR_CACHE[cache_key]
 
         file_path = Settings.SLUR_LIST_FILEPATH
+        artifact_path = _artifact_path(file_path, cache_key)
+
+        slurs = _read_artifact(artifact_path) if artifact_path else None
+        if slurs is None:
+            slurs = self._read_slur_csv(file_path)
+            if artifact_path:
+                _write_artifact(artifact_path, slurs)
+
+        self._SLUR_CACHE[cache_key] = slurs
+        return slurs
+
+    def _read_slur_csv(self, file_path) -> list[str]:
+        # Only needed when no stored lexicon can be used.
+        import pandas
 
         try:
             df = pandas.read_csv(file_path)
@@ -126,13 +175,82 @@ class LexicalSlur(Validator):
         df["label"] = df["label"].str.lower()
 
         if self.severity == SlurSeverity.Low:
-            slurs = df[df["severity"].isin(["L", "M", "H"])]["label"].tolist()
+            df = df[df["severity"].isin(["L", "M", "H"])]
         elif self.severity == SlurSeverity.Medium:
-            slurs = df[df["severity"].isin(["M", "H"])]["label"].tolist()
+            df = df[df["severity"].isin(["M", "H"])]
         elif self.severity == SlurSeverity.High:
-            slurs = df[df["severity"] == "H"]["label"].tolist()
-        else:
-            slurs = df["label"].tolist()
+            df = df[df["severity"] == "H"]
 
-        self._SLUR_CACHE[cache_key] = slurs
-        return slurs
+        languages = set(self.languages)
+        tagged = (
+            df["language"]
+            if "language" in df.columns
+            else pandas.Series(None, index=df.index)
+        )
+        keep = [
+            bool(_entry_languages(label, language) & languages)
+            for label, language in zip(df["label"], tagged, strict=True)
+        ]
+        return df[keep]["label"].tolist()
+
+
+def _entry_languages(label: str, language) -> set[str]:
+    """
+    Languages a slur list entry belongs to: its language column when set,
+    otherwise its script. Latin-script entries count as both English and
+    Hindi, since romanized Hindi cannot be told apart from English by script.
+    """
+    if isinstance(language, str) and language:
+        return {language}
+    if _DEVANAGARI.search(label):
+        return {"hi"}
+    return {"en", "hi"}
+
+
+def _artifact_path(file_path: Path, cache_key: tuple) -> Path | None:
+    """
+    Where the filtered slur list for cache_key over this slur list file is
+    stored, or None when the on-disk cache is off. The name covers the file
+    contents, so an edited list never loads a stale artifact.
+    """
+    if not settings.SLUR_LEXICON_CACHE_DIR:
+        return None
+    try:
+        source = hashlib.sha256(Path(file_path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+    key = hashlib.sha256(
+        repr((_ARTIFACT_VERSION, source, cache_key)).encode()
+    ).hexdigest()
+    return Path(settings.SLUR_LEXICON_CACHE_DIR) / f"slur_lexicon_{key}.json"
+
+
+def _read_artifact(path: Path) -> list[str] | None:
+    # Plain JSON, never unpickled: the directory may be shared between
+    # containers, and the matcher is rebuilt from the words.
+    try:
+        with open(path, encoding="utf-8") as f:
+            slurs = json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable slur lexicon artifact {path}: {e}")
+        return None
+    if not isinstance(slurs, list) or not all(isinstance(s, str) for s in slurs):
+        logger.warning(f"Ignoring malformed slur lexicon artifact {path}")
+        return None
+    return slurs
+
+
+def _write_artifact(path: Path, slurs: list[str]) -> None:
+    # Written to a temporary file first so concurrent workers never read a
+    # partial artifact.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(slurs, f, ensure_ascii=False)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.warning(f"Could not write slur lexicon artifact {path}: {e}")
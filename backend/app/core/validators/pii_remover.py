@@ -1,5 +1,11 @@
 from __future__ import annotations
+import copy
 import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
 from typing import Callable, Optional
 
 from guardrails import OnFailAction
@@ -10,8 +16,14 @@ from guardrails.validators import (
     ValidationResult,
     Validator,
 )
-from presidio_analyzer import AnalyzerEngine
-from presidio_analyzer.nlp_engine import NlpEngineProvider
+import spacy
+from spacy.lookups import load_lookups
+from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine, RecognizerResult
+from presidio_analyzer.nlp_engine import (
+    NlpArtifacts,
+    NlpEngineProvider,
+    SpacyNlpEngine,
+)
 from presidio_anonymizer import AnonymizerEngine
 from presidio_analyzer.predefined_recognizers.country_specific.india.in_aadhaar_recognizer import (
     InAadhaarRecognizer,
@@ -29,6 +41,10 @@ from presidio_analyzer.predefined_recognizers.country_specific.india.in_voter_re
     InVoterRecognizer,
 )
 
+from app.core.cache import LRUCache, estimate_size, register_cache
+from app.core.config import settings
+from app.core.stream_segmenter import StreamSegmenter
+
 os.environ["TOKENIZERS_PARALLELISM"] = "false"
 
 ALL_ENTITY_TYPES = [
@@ -49,14 +65,40 @@ ALL_ENTITY_TYPES = [
     "IN_VOTER",
 ]
 
-CONFIGURATION = {
-    "nlp_engine_name": "spacy",
-    "models": [{"lang_code": "en", "model_name": "en_core_web_lg"}],
+# Entity types found by spaCy's named entity recognizer. Every other type comes
+# from pattern, checksum or phone number recognizers, which need no model.
+NER_ENTITY_TYPES = {"LOCATION", "NRP", "PERSON"}
+
+# spaCy English pipelines by tier, smallest and fastest first; trf is the most
+# accurate and needs spacy-transformers. Any other model name is loaded as
+# given: an installed pipeline package or the path of a saved pipeline.
+SPACY_MODEL_TIERS = {
+    "sm": "en_core_web_sm",
+    "md": "en_core_web_md",
+    "lg": "en_core_web_lg",
+    "trf": "en_core_web_trf",
 }
 
-_GLOBAL_NLP_ENGINE = None
+_NLP_ENGINES = {}
+_ANONYMIZER = None
+_TOKENIZER_NLP_ENGINE = None
 _ANALYZER_CACHE = {}
 
+# Analyzer results per text and analysis (model, entity types, threshold).
+# The PII validators of a request share one analysis, and the same text is
+# often checked again (input and output stages, retries, batch duplicates).
+pii_analysis_cache = register_cache(
+    LRUCache(
+        name="pii_analysis",
+        max_entries=settings.PII_ANALYSIS_CACHE_MAX_ENTRIES,
+        max_bytes=settings.PII_ANALYSIS_CACHE_MAX_BYTES,
+    )
+)
+# Per analysis key being computed: its lock and how many threads hold or wait
+# for it, so validators started together analyze a text once.
+_IN_FLIGHT: dict = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
 
 INDIA_RECOGNIZERS = {
     "IN_AADHAAR": InAadhaarRecognizer,
@@ -67,12 +109,129 @@ INDIA_RECOGNIZERS = {
 }
 
 
-def _build_analyzer(entity_types: list[str]) -> AnalyzerEngine:
-    global _GLOBAL_NLP_ENGINE
-    if _GLOBAL_NLP_ENGINE is None:
-        provider = NlpEngineProvider(nlp_configuration=CONFIGURATION)
-        _GLOBAL_NLP_ENGINE = provider.create_engine()
-    analyzer = AnalyzerEngine(nlp_engine=_GLOBAL_NLP_ENGINE)
+# Entity type lists whose analyzers are built at worker startup: the default
+# (every type), the same without the India-specific recognizers, and the
+# pattern-only types.
+WARMUP_ENTITY_TYPES = [
+    ALL_ENTITY_TYPES,
+    [t for t in ALL_ENTITY_TYPES if t not in INDIA_RECOGNIZERS],
+    [t for t in ALL_ENTITY_TYPES if t not in NER_ENTITY_TYPES],
+]
+WARMUP_TEXT = (
+    "My name is Priya Sharma from Pune, call me on 9876543210 "
+    "or write to priya.sharma@example.com."
+)
+
+
+class TokenizerNlpEngine(SpacyNlpEngine):
+    """
+    Presidio NLP engine that only tokenizes, with spaCy's English tokenizer
+    and no trained pipeline (no tagger, parser or NER). Pattern recognizers
+    use the NLP results only to find context words around a match; lemmas
+    come from spaCy's English lookup table (spacy-lookups-data), the same
+    tables the trained pipeline's lemmatizer is built from, so the context
+    enhancer sees "number" for "numbers" and "be" for "were" either way.
+    """
+
+    def load(self) -> None:
+        self.nlp = {"en": spacy.blank("en")}
+        self._lemma_lookup = load_lookups("en", ["lemma_lookup"]).get_table(
+            "lemma_lookup"
+        )
+
+    def _doc_to_nlp_artifact(self, doc, language: str) -> NlpArtifacts:
+        return NlpArtifacts(
+            entities=[],
+            tokens=doc,
+            tokens_indices=[token.idx for token in doc],
+            lemmas=[
+                self._lemma_lookup.get(token.lower_, token.lower_) for token in doc
+            ],
+            nlp_engine=self,
+            language=language,
+        )
+
+
+def needs_ner(entity_types: list[str]) -> bool:
+    return any(t in NER_ENTITY_TYPES for t in entity_types)
+
+
+def resolve_spacy_model(spacy_model: Optional[str] = None) -> str:
+    """The pipeline for a tier or model name, PII_SPACY_MODEL when not given."""
+    model = spacy_model or settings.PII_SPACY_MODEL
+    return SPACY_MODEL_TIERS.get(model, model)
+
+
+def is_installed(model_name: str) -> bool:
+    return spacy.util.is_package(model_name) or Path(model_name).exists()
+
+
+def nlp_configuration(model_name: str) -> dict:
+    return {
+        "nlp_engine_name": "spacy",
+        "models": [{"lang_code": "en", "model_name": model_name}],
+    }
+
+
+def _get_nlp_engine(spacy_model: Optional[str] = None):
+    model_name = resolve_spacy_model(spacy_model)
+    if model_name not in _NLP_ENGINES:
+        # Presidio downloads a missing model on load; workers must not reach
+        # out to the internet mid-request, so a model has to be installed.
+        if not is_installed(model_name):
+            raise OSError(f"spaCy model '{model_name}' is not installed")
+        provider = NlpEngineProvider(nlp_configuration=nlp_configuration(model_name))
+        _NLP_ENGINES[model_name] = provider.create_engine()
+    return _NLP_ENGINES[model_name]
+
+
+def _get_tokenizer_engine() -> TokenizerNlpEngine:
+    global _TOKENIZER_NLP_ENGINE
+    if _TOKENIZER_NLP_ENGINE is None:
+        _TOKENIZER_NLP_ENGINE = TokenizerNlpEngine()
+        _TOKENIZER_NLP_ENGINE.load()
+    return _TOKENIZER_NLP_ENGINE
+
+
+def _get_anonymizer() -> AnonymizerEngine:
+    global _ANONYMIZER
+    if _ANONYMIZER is None:
+        _ANONYMIZER = AnonymizerEngine()
+    return _ANONYMIZER
+
+
+@contextmanager
+def _single_flight(key):
+    with _IN_FLIGHT_LOCK:
+        lock, holders = _IN_FLIGHT.get(key, (None, 0))
+        lock = lock or threading.Lock()
+        _IN_FLIGHT[key] = (lock, holders + 1)
+    try:
+        with lock:
+            yield
+    finally:
+        with _IN_FLIGHT_LOCK:
+            lock, holders = _IN_FLIGHT[key]
+            if holders == 1:
+                del _IN_FLIGHT[key]
+            else:
+                _IN_FLIGHT[key] = (lock, holders - 1)
+
+
+def _build_analyzer(
+    entity_types: list[str], nlp_engine=None, spacy_model: Optional[str] = None
+) -> AnalyzerEngine:
+    """
+    Analyzer for entity_types on spacy_model's pipeline. Without an NER-backed
+    type it runs on the tokenizer-only engine, skipping the model entirely.
+    """
+    if nlp_engine is None:
+        nlp_engine = (
+            _get_nlp_engine(spacy_model)
+            if needs_ner(entity_types)
+            else _get_tokenizer_engine()
+        )
+    analyzer = AnalyzerEngine(nlp_engine=nlp_engine)
 
     for entity_type, recognizer_cls in INDIA_RECOGNIZERS.items():
         if entity_type in entity_types:
@@ -80,13 +239,179 @@ def _build_analyzer(entity_types: list[str]) -> AnalyzerEngine:
     return analyzer
 
 
-def _get_cached_analyzer(entity_types: list[str]) -> AnalyzerEngine:
-    recognizer_key = tuple(sorted(t for t in entity_types if t in INDIA_RECOGNIZERS))
+def _get_cached_analyzer(
+    entity_types: list[str], spacy_model: Optional[str] = None
+) -> AnalyzerEngine:
+    recognizer_key = (
+        resolve_spacy_model(spacy_model) if needs_ner(entity_types) else None,
+        tuple(sorted(t for t in entity_types if t in INDIA_RECOGNIZERS)),
+    )
     if recognizer_key not in _ANALYZER_CACHE:
-        _ANALYZER_CACHE[recognizer_key] = _build_analyzer(entity_types)
+        _ANALYZER_CACHE[recognizer_key] = _build_analyzer(
+            entity_types, spacy_model=spacy_model
+        )
     return _ANALYZER_CACHE[recognizer_key]
 
 
+def _analyze_batch(
+    analyzer: AnalyzerEngine,
+    texts: list[str],
+    entity_types: list[str],
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+    score_threshold: Optional[float] = None,
+) -> list[list[RecognizerResult]]:
+    return BatchAnalyzerEngine(analyzer_engine=analyzer).analyze_iterator(
+        texts=texts,
+        language="en",
+        batch_size=batch_size or settings.PII_BATCH_SIZE,
+        n_process=n_process or settings.PII_BATCH_N_PROCESS,
+        entities=entity_types,
+        score_threshold=score_threshold,
+    )
+
+
+def _windows(text: str) -> list[tuple[int, int, int, int]]:
+    """
+    (start, end, owned_start, owned_end) of the windows text is analyzed in.
+    A text of up to PII_CHUNK_CHARS is one window. A longer one is split into
+    runs of whole sentences of at most PII_CHUNK_CHARS, each starting at least
+    PII_CHUNK_OVERLAP_CHARS before the previous one ends (sentences longer
+    than that are cut at whitespace). A window owns the text from the middle
+    of the overlap with the previous window to the middle of the overlap with
+    the next, so an entity is kept once, from a window that also saw the
+    context words around it.
+    """
+    max_chars = settings.PII_CHUNK_CHARS
+    if len(text) <= max_chars:
+        return [(0, len(text), 0, len(text))]
+
+    overlap = settings.PII_CHUNK_OVERLAP_CHARS
+    # Fed piece by piece so the segmenter's buffer stays small.
+    segmenter = StreamSegmenter(overlap)
+    cuts = [0]
+    for offset in range(0, len(text), overlap):
+        for segment in segmenter.feed(text[offset : offset + overlap]):
+            cuts.append(cuts[-1] + len(segment))
+    for segment in segmenter.flush():
+        cuts.append(cuts[-1] + len(segment))
+
+    spans = []
+    first = 0
+    while True:
+        last = first + 1
+        while last + 1 < len(cuts) and cuts[last + 1] - cuts[first] <= max_chars:
+            last += 1
+        spans.append((cuts[first], cuts[last]))
+        if last == len(cuts) - 1:
+            break
+        next_first = last - 1
+        while next_first - 1 > first and cuts[last] - cuts[next_first] < overlap:
+            next_first -= 1
+        first = max(next_first, first + 1)
+
+    bounds = (
+        [0]
+        + [
+            (start + end) // 2
+            for (_, end), (start, _) in zip(spans, spans[1:], strict=False)
+        ]
+        + [len(text)]
+    )
+    return [
+        (start, end, owned_start, owned_end)
+        for (start, end), owned_start, owned_end in zip(
+            spans, bounds, bounds[1:], strict=False
+        )
+    ]
+
+
+def _merge_window_results(
+    windows: list[tuple[int, int, int, int]],
+    window_results: list[list[RecognizerResult]],
+) -> list[RecognizerResult]:
+    """The results of each window moved to text offsets, each kept by one window."""
+    if len(windows) == 1:
+        return window_results[0]
+    merged = []
+    for (start, _, owned_start, owned_end), results in zip(
+        windows, window_results, strict=True
+    ):
+        for result in results:
+            result.start += start
+            result.end += start
+            if owned_start <= result.start < owned_end:
+                merged.append(result)
+    return merged
+
+
+def analyze_batch(
+    texts: list[str],
+    entity_types: Optional[list[str]] = None,
+    batch_size: Optional[int] = None,
+    n_process: Optional[int] = None,
+    spacy_model: Optional[str] = None,
+    score_threshold: Optional[float] = None,
+) -> list[list[RecognizerResult]]:
+    """
+    Detected entities of each text, with the cached analyzer for entity_types
+    and the texts run through spaCy's nlp.pipe in batches of batch_size over
+    n_process processes (PII_BATCH_SIZE and PII_BATCH_N_PROCESS by default).
+    """
+    entity_types = entity_types or ALL_ENTITY_TYPES
+    return _analyze_batch(
+        _get_cached_analyzer(entity_types, spacy_model),
+        list(texts),
+        entity_types,
+        batch_size,
+        n_process,
+        score_threshold,
+    )
+
+
+def share_pii_analysis(validators: list[Validator]) -> None:
+    """
+    Lets the PII validators of one request share one analysis per text: each
+    analyzes for the union of their entity types at the lowest of their
+    thresholds, and keeps its own types and threshold from the results.
+    Validators on different spaCy models do not share.
+    """
+    groups: dict[str, list[PIIRemover]] = {}
+    for validator in validators:
+        if isinstance(validator, PIIRemover):
+            groups.setdefault(resolve_spacy_model(validator.spacy_model), []).append(
+                validator
+            )
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        entity_types = sorted({t for v in group for t in v.entity_types})
+        threshold = min(v.threshold for v in group)
+        for validator in group:
+            validator._use_analysis(entity_types, threshold)
+
+
+def warm_up() -> dict[str, float]:
+    """
+    Loads the PII_SPACY_MODEL pipeline, builds the analyzers for
+    WARMUP_ENTITY_TYPES and runs one analysis through each, so a worker's first
+    PII request does not pay for any of it. Returns the time of each step in ms.
+    """
+    started = time.perf_counter()
+    _get_nlp_engine()
+    loaded = time.perf_counter()
+    for entity_types in WARMUP_ENTITY_TYPES:
+        _get_cached_analyzer(entity_types).analyze(
+            text=WARMUP_TEXT, entities=entity_types, language="en"
+        )
+    _get_anonymizer()
+    finished = time.perf_counter()
+    return {
+        "model_load_ms": round((loaded - started) * 1000, 1),
+        "warmup_ms": round((finished - loaded) * 1000, 1),
+    }
+
+
 @register_validator(name="pii-remover", data_type="string")
 class PIIRemover(Validator):
     """
@@ -100,20 +425,121 @@ class PIIRemover(Validator):
         entity_types=None,
         threshold=0.5,
         on_fail: Optional[Callable] = OnFailAction.FIX,
+        spacy_model: Optional[str] = None,
     ):
         super().__init__(on_fail=on_fail)
 
         self.entity_types = entity_types or ALL_ENTITY_TYPES
         self.threshold = threshold
         self.on_fail = on_fail
-        self.analyzer = _get_cached_analyzer(self.entity_types)
-        self.anonymizer = AnonymizerEngine()
+        self.spacy_model = spacy_model
+        self.anonymizer = _get_anonymizer()
+        self._use_analysis(self.entity_types, threshold)
+
+    def _use_analysis(self, entity_types: list[str], threshold: float) -> None:
+        """Analyzes texts for entity_types at threshold; see share_pii_analysis."""
+        self.analysis_entity_types = entity_types
+        self.analysis_threshold = threshold
+        self.analyzer = _get_cached_analyzer(entity_types, self.spacy_model)
+        self._analysis_key = (
+            (
+                resolve_spacy_model(self.spacy_model)
+                if needs_ner(entity_types)
+                else None
+            ),
+            tuple(sorted(entity_types)),
+            threshold,
+        )
 
     def _validate(self, value: str, metadata: dict | None = None) -> ValidationResult:
         text = value
-        results = self.analyzer.analyze(
-            text=text, entities=self.entity_types, language="en"
+        key = (text, self._analysis_key)
+        with _single_flight(key):
+            results = pii_analysis_cache.get(key)
+            if results is None:
+                results = self._analyze(text)
+                self._cache_results(key, results)
+        return self._anonymize(text, self._own_results(results))
+
+    def _analyze(self, text: str) -> list[RecognizerResult]:
+        windows = _windows(text)
+        if len(windows) == 1:
+            return self.analyzer.analyze(
+                text=text,
+                entities=self.analysis_entity_types,
+                language="en",
+                score_threshold=self.analysis_threshold,
+            )
+        # Long texts are analyzed window by window, through nlp.pipe.
+        return _merge_window_results(
+            windows,
+            _analyze_batch(
+                self.analyzer,
+                [text[start:end] for start, end, _, _ in windows],
+                self.analysis_entity_types,
+                score_threshold=self.analysis_threshold,
+            ),
+        )
+
+    def _cache_results(self, key, results: list[RecognizerResult]) -> None:
+        pii_analysis_cache.put(
+            key, results, size=sys.getsizeof(key[0]) + estimate_size(results)
         )
+
+    def _own_results(self, results: list[RecognizerResult]) -> list[RecognizerResult]:
+        """
+        The shared results for this validator's entity types and threshold,
+        copied because the anonymizer adjusts the results it is given.
+        """
+        return [
+            copy.copy(result)
+            for result in results
+            if result.entity_type in self.entity_types
+            and result.score >= self.threshold
+        ]
+
+    def validate_batch(
+        self,
+        values: list[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> list[ValidationResult]:
+        """
+        Analyzes the texts without cached results in batched spaCy nlp.pipe
+        calls, then anonymizes each.
+        """
+        found = {}
+        for text in values:
+            if text not in found:
+                found[text] = pii_analysis_cache.get((text, self._analysis_key))
+        missing = [text for text, results in found.items() if results is None]
+
+        windows = [_windows(text) for text in missing]
+        window_results = iter(
+            _analyze_batch(
+                self.analyzer,
+                [
+                    text[start:end]
+                    for text, text_windows in zip(missing, windows, strict=True)
+                    for start, end, _, _ in text_windows
+                ],
+                self.analysis_entity_types,
+                batch_size,
+                n_process,
+                self.analysis_threshold,
+            )
+        )
+        for text, text_windows in zip(missing, windows, strict=True):
+            found[text] = _merge_window_results(
+                text_windows, [next(window_results) for _ in text_windows]
+            )
+            self._cache_results((text, self._analysis_key), found[text])
+
+        return [
+            self._anonymize(text, self._own_results(found[text])) for text in values
+        ]
+
+    def _anonymize(self, text: str, results) -> ValidationResult:
         anonymized = self.anonymizer.anonymize(text=text, analyzer_results=results)
         anonymized_text = anonymized.text
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
@@ -16,6 +17,11 @@ from guardrails.validators import (
 
 from app.core.config import settings
 from app.core.constants import EMPTY_MESSAGE_ERROR, TOPIC_OUT_OF_SCOPE_ERROR
+from app.core.llm_response_cache import (
+    llm_response_cache,
+    llm_response_key,
+    mark_cache_hit,
+)
 from app.core.validators.llm_utils import (
     JSON_OBJECT_RESPONSE_FORMAT,
     supports_response_format,
@@ -63,6 +69,9 @@ class TopicRelevance(Validator):
 
     If the message is clearly within scope → PassResult
     If partially related or outside scope → FailResult
+
+    With cache_responses, the critic's verdict on a message is reused for the
+    same model, prompt and normalized message (see app.core.llm_response_cache).
     """
 
     def __init__(
@@ -71,6 +80,7 @@ class TopicRelevance(Validator):
         prompt_schema_version: int = 1,
         llm_callable: str = settings.DEFAULT_LLM_CALLABLE,
         on_fail: Optional[Callable] = OnFailAction.NOOP,
+        cache_responses: bool = True,
     ):
         """Build the LLMCritic with a scope_violation metric from the topic configuration."""
         super().__init__(on_fail=on_fail)
@@ -78,6 +88,7 @@ class TopicRelevance(Validator):
         self.topic_config = topic_config
         self.prompt_schema_version = prompt_schema_version
         self.llm_callable = llm_callable
+        self.cache_responses = cache_responses
         self._invalid_config_reason: Optional[str] = None
 
         if not topic_config or not topic_config.strip():
@@ -85,13 +96,14 @@ class TopicRelevance(Validator):
             self._critic = None
             return
 
+        self._metric_prompt = _build_metric_prompt(
+            prompt_schema_version=prompt_schema_version,
+            topic_config=topic_config,
+        )
         self._critic = LLMCritic(
             metrics={
                 "scope_violation": {
-                    "description": _build_metric_prompt(
-                        prompt_schema_version=prompt_schema_version,
-                        topic_config=topic_config,
-                    ),
+                    "description": self._metric_prompt,
                     "threshold": 2,
                 }
             },
@@ -115,21 +127,40 @@ class TopicRelevance(Validator):
         if not value or not value.strip():
             return FailResult(error_message=EMPTY_MESSAGE_ERROR)
 
+        key = (
+            llm_response_key(
+                self.llm_callable,
+                self._metric_prompt,
+                self.prompt_schema_version,
+                value,
+            )
+            if self.cache_responses
+            else None
+        )
+        cached = llm_response_cache.lookup(key) if key else None
+        if cached is not None:
+            return mark_cache_hit(
+                self._verdict(value, cached["passed"], cached["score"])
+            )
+
         try:
+            started = time.perf_counter()
             result = self._critic.validate(value, metadata)
             score = None
 
             if getattr(result, "metadata", None):
                 score = result.metadata.get("scope_violation")
 
-            if isinstance(result, PassResult):
-                return PassResult(value=value, metadata={"scope_score": score})
-
-            if isinstance(result, FailResult):
-                return FailResult(
-                    error_message=TOPIC_OUT_OF_SCOPE_ERROR,
-                    metadata={"scope_score": score},
-                )
+            if isinstance(result, (PassResult, FailResult)):
+                passed = isinstance(result, PassResult)
+                # Only verdicts the critic scored are reused.
+                if key is not None and score is not None:
+                    llm_response_cache.store(
+                        key,
+                        {"passed": passed, "score": score},
+                        time.perf_counter() - started,
+                    )
+                return self._verdict(value, passed, score)
 
         except Exception as e:
             return FailResult(
@@ -137,3 +168,11 @@ class TopicRelevance(Validator):
             )
 
         return FailResult(error_message="Topic relevance validation failed.")
+
+    def _verdict(self, value: str, passed: bool, score) -> ValidationResult:
+        if passed:
+            return PassResult(value=value, metadata={"scope_score": score})
+        return FailResult(
+            error_message=TOPIC_OUT_OF_SCOPE_ERROR,
+            metadata={"scope_score": score},
+        )
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import time
 from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
@@ -13,10 +14,15 @@ from guardrails.validators import (
     Validator,
     register_validator,
 )
-from litellm import completion
+from litellm import acompletion, completion
 
 from app.core.config import settings
 from app.core.constants import EMPTY_MESSAGE_ERROR, TOPIC_OUT_OF_SCOPE_ERROR
+from app.core.llm_response_cache import (
+    llm_response_cache,
+    llm_response_key,
+    mark_cache_hit,
+)
 from app.core.validators.llm_utils import (
     JSON_OBJECT_RESPONSE_FORMAT,
     supports_response_format,
@@ -61,6 +67,13 @@ def _load_prompt_template(prompt_schema_version: int) -> str:
     return prompt_file.read_text(encoding="utf-8")
 
 
+def _cacheable(key: Optional[str], result: ValidationResult) -> bool:
+    """Only replies that carried a valid score are worth reusing."""
+    return (
+        key is not None and bool(result.metadata) and "scope_score" in result.metadata
+    )
+
+
 @register_validator(name="topic-relevance-llm", data_type="string")
 class TopicRelevanceLLM(Validator):
     """
@@ -79,6 +92,9 @@ class TopicRelevanceLLM(Validator):
       v1 = allowed topics only
       v2 = forbidden topics only
       v3 = combined allowed + forbidden (checks forbidden first)
+
+    With ``cache_responses``, the model's reply to a query is reused for the
+    same model, prompt and normalized query (see app.core.llm_response_cache).
     """
 
     def __init__(
@@ -88,11 +104,14 @@ class TopicRelevanceLLM(Validator):
         threshold: int = settings.TOPIC_RELEVANCE_LLM_THRESHOLD,
         prompt_schema_version: int = 1,
         on_fail: Optional[Callable] = OnFailAction.NOOP,
+        cache_responses: bool = True,
     ):
         super().__init__(on_fail=on_fail)
 
         self.llm_callable = llm_callable
         self.threshold = threshold
+        self.prompt_schema_version = prompt_schema_version
+        self.cache_responses = cache_responses
         self._invalid_config_reason: Optional[str] = None
         self._system_prompt: Optional[str] = None
         self._supports_response_format: bool = False
@@ -113,29 +132,90 @@ class TopicRelevanceLLM(Validator):
     def _validate(
         self, value: str, metadata: Optional[dict] = None
     ) -> ValidationResult:
-        if self._invalid_config_reason:
-            return FailResult(error_message=self._invalid_config_reason)
+        invalid = self._check_request(value)
+        if invalid is not None:
+            return invalid
 
-        if not value or not value.strip():
-            return FailResult(error_message=EMPTY_MESSAGE_ERROR)
+        key = self._response_key(value)
+        cached = llm_response_cache.lookup(key) if key else None
+        if cached is not None:
+            return mark_cache_hit(self._parse_response(value, cached))
+
+        started = time.perf_counter()
+        try:
+            response = completion(**self._completion_kwargs(value))
+            content = response.choices[0].message.content.strip()
+        except Exception as e:
+            return FailResult(error_message=f"LLM call failed: {e}")
+
+        return self._parse_and_cache(value, content, key, started)
+
+    async def async_validate(
+        self, value: str, metadata: Optional[dict] = None
+    ) -> ValidationResult:
+        """Same as _validate, but awaits the LLM call instead of blocking a thread."""
+        invalid = self._check_request(value)
+        if invalid is not None:
+            return invalid
 
+        key = self._response_key(value)
+        cached = await llm_response_cache.async_lookup(key) if key else None
+        if cached is not None:
+            return mark_cache_hit(self._parse_response(value, cached))
+
+        started = time.perf_counter()
         try:
-            kwargs = {
-                "model": self.llm_callable,
-                "messages": [
-                    {"role": "system", "content": self._system_prompt},
-                    {"role": "user", "content": value},
-                ],
-                "max_tokens": _MAX_TOKENS,
-            }
-            if self._supports_response_format:
-                kwargs["response_format"] = JSON_OBJECT_RESPONSE_FORMAT
-
-            response = completion(**kwargs)
+            response = await acompletion(**self._completion_kwargs(value))
             content = response.choices[0].message.content.strip()
         except Exception as e:
             return FailResult(error_message=f"LLM call failed: {e}")
 
+        result = self._parse_response(value, content)
+        if _cacheable(key, result):
+            await llm_response_cache.async_store(
+                key, content, time.perf_counter() - started
+            )
+        return result
+
+    def _check_request(self, value: str) -> Optional[FailResult]:
+        if self._invalid_config_reason:
+            return FailResult(error_message=self._invalid_config_reason)
+
+        if not value or not value.strip():
+            return FailResult(error_message=EMPTY_MESSAGE_ERROR)
+
+        return None
+
+    def _response_key(self, value: str) -> Optional[str]:
+        if not self.cache_responses:
+            return None
+        return llm_response_key(
+            self.llm_callable, self._system_prompt, self.prompt_schema_version, value
+        )
+
+    def _parse_and_cache(
+        self, value: str, content: str, key: Optional[str], started: float
+    ) -> ValidationResult:
+        """Parses a fresh reply, and caches it when it carried a valid score."""
+        result = self._parse_response(value, content)
+        if _cacheable(key, result):
+            llm_response_cache.store(key, content, time.perf_counter() - started)
+        return result
+
+    def _completion_kwargs(self, value: str) -> dict:
+        kwargs = {
+            "model": self.llm_callable,
+            "messages": [
+                {"role": "system", "content": self._system_prompt},
+                {"role": "user", "content": value},
+            ],
+            "max_tokens": _MAX_TOKENS,
+        }
+        if self._supports_response_format:
+            kwargs["response_format"] = JSON_OBJECT_RESPONSE_FORMAT
+        return kwargs
+
+    def _parse_response(self, value: str, content: str) -> ValidationResult:
         try:
             data = _extract_first_json_object(content)
             score = data.get("scope_violation")
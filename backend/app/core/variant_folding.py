@@ -0,0 +1,295 @@
+import re
+import unicodedata
+from dataclasses import dataclass
+
+from app.core.phrase_matcher import PhraseMatcher
+from app.core.text_normalizer import NormalizedText, normalize_for_matching
+
+# Lookalike letters from other scripts, and leetspeak symbols. Symbols are
+# only read as letters inside a word that has a letter (so "10 baje" and a
+# closing "!" stay as they are).
+_HOMOGLYPHS = {
+    **dict(zip("аеікмнорстухјѕԁɡ", "aeikmhopctyxjsdg", strict=True)),
+    **dict(zip("αβεικνορτυχω", "abeiknoptuxw", strict=True)),
+    "ı": "i",
+    "ł": "l",
+    "ø": "o",
+}
+_LEET = {
+    "@": "a",
+    "4": "a",
+    "3": "e",
+    "€": "e",
+    "1": "i",
+    "!": "i",
+    "|": "l",
+    "0": "o",
+    "5": "s",
+    "$": "s",
+    "7": "t",
+    "+": "t",
+    "8": "b",
+    "9": "g",
+}
+_TRAILING_PUNCTUATION = ".,!?;:'\")]}"
+_TOKEN = re.compile(r"\S+")
+# Three or more single letters with short separators between them: "k u t t a",
+# "k.u.t.t.a", "k-u-t-t-a".
+_SPACED = re.compile(r"(?<![^\W_])[^\W_](?:[\s.\-_*]{1,3}[^\W_](?![^\W_])){2,}")
+_SEPARATOR = re.compile(r"[\s.\-_*]")
+
+_CONSONANTS = dict(
+    zip(
+        "कखगघङचछजझञटठडढणतथदधनपफबभमयरलवशषसहळ",
+        "k kh g gh n ch chh j jh n t th d dh n t th d dh n "
+        "p ph b bh m y r l v sh sh s h l".split(),
+        strict=True,
+    )
+)
+_VOWELS = dict(
+    zip(
+        "अआइईउऊएऐओऔऍऑ",
+        ["a", "a", "i", "i", "u", "u", "e", "e", "o", "o", "e", "o"],
+        strict=True,
+    )
+)
+_MATRAS = dict(
+    zip(
+        "ािीुूेैोौॅॉ",
+        ["a", "i", "i", "u", "u", "e", "e", "o", "o", "e", "o"],
+        strict=True,
+    )
+)
+_VIRAMA = "्"
+_NUKTA = "़"
+_NUKTA_CONSONANTS = {"ज": "z", "फ": "f"}
+_NASALS = "ंँ"
+_DIGITS = dict(zip("०१२३४५६७८९", "0123456789", strict=True))
+
+# Spelling differences that do not change how a romanized word is read.
+# Aspiration is kept: "gadhi" and "gaadi" are different words.
+_LATIN = {"w": "v", "z": "j", "q": "k", "f": "p"}
+# Shorter folded phrases collide with everyday words ("bai" folds to "be"),
+# so those phrases are only matched as listed.
+_MIN_KEY_LENGTH = 4
+
+
+@dataclass(frozen=True)
+class FoldedText(NormalizedText):
+    """
+    A folded copy of a text. breaks holds the positions in text where
+    separators between spaced-out letters were removed; a match may start or
+    end there as if at a word boundary.
+    """
+
+    breaks: frozenset[int] = frozenset()
+
+
+def fold_variants(text: str) -> FoldedText:
+    """
+    Folds a normalized (lowercased) text to the key used to match spelling
+    variants:
+    - lookalike letters and leetspeak to Latin letters ("kutt@" -> "kutta")
+    - spaced-out letters joined ("k u t t a" -> "kutta")
+    - Devanagari transliterated to Latin ("कुत्ता" -> "kutta")
+    - romanization differences folded ("ee"/"oo", "ai", "w"/"v", ...)
+    - repeated letters collapsed ("kuttaaa" -> "kuta")
+    Every folded character keeps the span of text it came from.
+    """
+    units = _spaced_out(_substitute(text))
+    units = _fold_latin(_transliterate(units))
+    chars, starts, ends, breaks = units
+    return FoldedText(
+        original=text,
+        text="".join(chars),
+        starts=tuple(starts),
+        ends=tuple(ends),
+        breaks=frozenset(i for i, brk in enumerate(breaks) if brk),
+    )
+
+
+def _substitute(text: str) -> str:
+    """Character for character replacements, so offsets are unchanged."""
+    chars = [_HOMOGLYPHS.get(char) or _strip_accent(char) for char in text]
+    tokens = [token.span() for token in _TOKEN.finditer(text)]
+    for k, (start, end) in enumerate(tokens):
+        while end > start and text[end - 1] in _TRAILING_PUNCTUATION:
+            end -= 1
+        if any(chars[i].isalpha() for i in range(start, end)) or (
+            # A lone symbol among spaced-out letters: "k u t t @"
+            end - start == 1
+            and any(
+                0 <= n < len(tokens)
+                and tokens[n][1] - tokens[n][0] == 1
+                and chars[tokens[n][0]].isalpha()
+                for n in (k - 1, k + 1)
+            )
+        ):
+            for i in range(start, end):
+                chars[i] = _LEET.get(chars[i], chars[i])
+    return "".join(chars)
+
+
+def _strip_accent(char: str) -> str:
+    if char.isascii() or not char.isalpha():
+        return char
+    base = unicodedata.normalize("NFKD", char)[0]
+    return base if base.isascii() else char
+
+
+def _spaced_out(text: str):
+    """Units of text, with the separators inside spaced-out words dropped."""
+    chars, starts, ends, breaks = [], [], [], []
+    position = 0
+    for run in _SPACED.finditer(text):
+        for i in range(position, run.start()):
+            chars.append(text[i])
+            starts.append(i)
+            ends.append(i + 1)
+            breaks.append(False)
+        for i in range(run.start(), run.end()):
+            if not _SEPARATOR.match(text, i):
+                chars.append(text[i])
+                starts.append(i)
+                ends.append(i + 1)
+                breaks.append(True)
+        position = run.end()
+    for i in range(position, len(text)):
+        chars.append(text[i])
+        starts.append(i)
+        ends.append(i + 1)
+        breaks.append(False)
+    return chars, starts, ends, breaks
+
+
+def _transliterate(units):
+    """Devanagari words to Latin, dropping the inherent vowels Hindi does not say."""
+    chars, starts, ends, breaks = units
+    out_chars, out_starts, out_ends, out_breaks = [], [], [], []
+    i = 0
+    while i < len(chars):
+        if not ("ऀ" <= chars[i] <= "ॿ"):
+            out_chars.append(chars[i])
+            out_starts.append(starts[i])
+            out_ends.append(ends[i])
+            out_breaks.append(breaks[i])
+            i += 1
+            continue
+
+        j = i
+        while j < len(chars) and "ऀ" <= chars[j] <= "ॿ":
+            j += 1
+        for latin, start, end, brk in _devanagari_word(
+            chars[i:j], starts[i:j], ends[i:j], breaks[i:j]
+        ):
+            for char in latin:
+                out_chars.append(char)
+                out_starts.append(start)
+                out_ends.append(end)
+                out_breaks.append(brk)
+                brk = False
+        i = j
+    return out_chars, out_starts, out_ends, out_breaks
+
+
+def _devanagari_word(chars, starts, ends, breaks):
+    # Phones as [kind, latin, start, end, break]; kind is "C" (consonant),
+    # "A" (inherent vowel), "V" (vowel) or "O" (anything else).
+    phones: list[list] = []
+    previous = ""
+    for char, start, end, brk in zip(chars, starts, ends, breaks, strict=True):
+        if char in _CONSONANTS:
+            phones.append(["C", _CONSONANTS[char], start, end, brk])
+            phones.append(["A", "a", start, end, False])
+        elif char in _MATRAS and phones and phones[-1][0] == "A":
+            phones[-1] = ["V", _MATRAS[char], phones[-1][2], end, False]
+        elif char == _VIRAMA and phones and phones[-1][0] == "A":
+            phones.pop()
+        elif char == _NUKTA and previous in _CONSONANTS:
+            # The consonant is followed by its inherent vowel at this point.
+            phones[-2][1] = _NUKTA_CONSONANTS.get(previous, phones[-2][1])
+            phones[-2][3] = end
+        elif char in _VOWELS:
+            phones.append(["V", _VOWELS[char], start, end, brk])
+        elif char in _NASALS:
+            phones.append(["O", "n", start, end, brk])
+        else:
+            phones.append(["O", _DIGITS.get(char, char), start, end, brk])
+        previous = char
+
+    # Schwa deletion: the inherent vowel is silent at the end of a word and
+    # between a vowel-consonant and a consonant-vowel ("madarchod", not
+    # "madarachoda"). Applied right to left, as each deletion changes the
+    # context of the one before it.
+    if phones and phones[-1][0] == "A" and len(phones) > 2:
+        phones.pop()
+    for k in range(len(phones) - 3, 1, -1):
+        if (
+            phones[k][0] == "A"
+            and phones[k - 1][0] == "C"
+            and phones[k - 2][0] in "AV"
+            and phones[k + 1][0] == "C"
+            and phones[k + 2][0] in "AV"
+        ):
+            del phones[k]
+    return [(latin, start, end, brk) for _, latin, start, end, brk in phones]
+
+
+def _fold_latin(units):
+    """Folds romanization differences, merging dropped letters into the previous one."""
+    chars, starts, ends, breaks = units
+    out_chars, out_starts, out_ends, out_breaks = [], [], [], []
+    previous = ""  # the letter before folding, for runs and digraphs
+    for char, start, end, brk in zip(chars, starts, ends, breaks, strict=True):
+        char = _LATIN.get(char, char)
+        folded = None
+        if out_chars and char.isascii() and char.isalpha():
+            last = out_chars[-1]
+            if char == "h" and previous == "c":
+                folded = "c"  # "ch", while a "c" on its own reads as "k"
+            elif char == last:
+                # Repeats collapse; a doubled "e"/"o" reads as "i"/"u".
+                folded = {"e": "i", "o": "u"}.get(char, char)
+            elif char == previous:
+                folded = last  # the rest of an "ee"/"oo" run
+            elif char == "i" and last == "a":
+                folded = "e"  # "ai" -> "e"
+        if folded is not None:
+            out_chars[-1] = folded
+            out_ends[-1] = end
+        else:
+            out_chars.append("k" if char == "c" else char)
+            out_starts.append(start)
+            out_ends.append(end)
+            out_breaks.append(brk)
+        previous = char
+    return out_chars, out_starts, out_ends, out_breaks
+
+
+class VariantIndex:
+    """
+    Matches a phrase list against spelling variants of it: phrases and texts
+    are both folded with fold_variants, and the folded phrases are found in
+    the folded text in one scan.
+    """
+
+    def __init__(self, phrases: list[str]):
+        self.phrases = list(phrases)
+        self._entries: dict[str, list[str]] = {}
+        for phrase in self.phrases:
+            key = fold_variants(normalize_for_matching(phrase)).text
+            if len(key) >= _MIN_KEY_LENGTH:
+                self._entries.setdefault(key, []).append(phrase)
+        self._matcher = PhraseMatcher(list(self._entries))
+
+    def find_spans(self, text: str) -> tuple[list[str], list[tuple[int, int]]]:
+        """
+        Returns the phrases with a variant in text and the (start, end) span
+        of text each variant covers. Spans may overlap.
+        """
+        folded = fold_variants(text)
+        keys, spans = self._matcher.find_spans(folded.text, breaks=folded.breaks)
+        found = [phrase for key in keys for phrase in self._entries[key]]
+        return found, [
+            (folded.starts[start], folded.ends[end - 1]) for start, end in spans
+        ]
@@ -0,0 +1,65 @@
+import logging
+import os
+import resource
+import sys
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.core.validators import pii_remover
+
+logger = logging.getLogger(__name__)
+
+# What GET /utils/ready reports for this worker.
+_readiness: dict[str, Any] = {"ready": False, "warmup": None, "error": None}
+
+
+def rss_bytes() -> int:
+    """Resident memory of this process, or its peak where /proc is not available."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def warm_up() -> None:
+    """
+    Startup hook: preloads the PII models when PII_WARMUP_ON_STARTUP is set
+    and records the outcome for the readiness check. A failed warm-up is
+    logged and leaves the worker not ready; PII requests then load the models
+    on first use as before.
+    """
+    if not settings.PII_WARMUP_ON_STARTUP:
+        _readiness.update(ready=True, warmup=None, error=None)
+        return
+
+    rss_before = rss_bytes()
+    started = time.perf_counter()
+    try:
+        timings = pii_remover.warm_up()
+    except Exception as exc:
+        logger.exception("PII warm-up failed")
+        _readiness.update(ready=False, warmup=None, error=str(exc))
+        return
+
+    rss_after = rss_bytes()
+    warmup = {
+        **timings,
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        "rss_bytes": rss_after,
+        "rss_delta_bytes": rss_after - rss_before,
+    }
+    _readiness.update(ready=True, warmup=warmup, error=None)
+    logger.info(
+        "PII warm-up done in %.0f ms (spaCy model %.0f ms), RSS %.0f MB (+%.0f MB)",
+        warmup["total_ms"],
+        warmup["model_load_ms"],
+        rss_after / 2**20,
+        warmup["rss_delta_bytes"] / 2**20,
+    )
+
+
+def readiness() -> dict[str, Any]:
+    return dict(_readiness)
@@ -1,12 +1,20 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Sequence
 from uuid import UUID
 
 from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from app.core.ban_list_cache import apply_ban_list_change
+from app.core.cache import invalidate_config
 from app.models.config.ban_list import BanList
-from app.schemas.ban_list import BanListCreate, BanListUpdate
+from app.schemas.ban_list import (
+    MAX_STORED_BANNED_WORDS,
+    BanListCreate,
+    BanListUpdate,
+    BanListWordsResponse,
+)
 from app.utils import now
 
 
@@ -57,6 +65,35 @@ class BanListCrud:
 
         return ban_list
 
+    def get_version(
+        self,
+        session: Session,
+        id: UUID,
+        organization_id: int,
+        project_id: int,
+        require_owner: bool = False,
+    ) -> datetime:
+        """
+        The updated_at of a ban list the caller may read, with the same checks
+        as get() but without loading its words.
+        """
+        row = session.exec(
+            select(
+                BanList.updated_at,
+                BanList.is_public,
+                BanList.organization_id,
+                BanList.project_id,
+            ).where(BanList.id == id)
+        ).first()
+
+        if row is None:
+            raise HTTPException(status_code=404, detail="Ban list not found")
+
+        if require_owner or not row.is_public:
+            self.check_owner(row, organization_id, project_id)
+
+        return row.updated_at
+
     def list(
         self,
         session: Session,
@@ -121,9 +158,115 @@ class BanListCrud:
             raise
 
         session.refresh(ban_list)
+        invalidate_config(ban_list.id)
         return ban_list
 
+    def update_words(
+        self,
+        session: Session,
+        id: UUID,
+        organization_id: int,
+        project_id: int,
+        add: Sequence[str] = (),
+        remove: Sequence[str] = (),
+    ) -> BanListWordsResponse:
+        """
+        Appends the words of add that are not listed yet and removes every
+        occurrence of the words of remove. The row is locked while the new
+        list is written, so concurrent edits are applied one after another.
+        """
+        ban_list = self._get_for_update(session, id, organization_id, project_id)
+        previous_updated_at = ban_list.updated_at
+        listed = set(ban_list.banned_words)
+        added = [word for word in dict.fromkeys(add) if word not in listed]
+        removed = [word for word in dict.fromkeys(remove) if word in listed]
+        if not added and not removed:
+            session.rollback()
+            return self._words_response(ban_list)
+
+        dropped = set(removed)
+        banned_words = [
+            word for word in ban_list.banned_words if word not in dropped
+        ] + added
+        self._write_words(session, ban_list, banned_words)
+        apply_ban_list_change(
+            ban_list.id,
+            previous_updated_at,
+            ban_list.updated_at,
+            banned_words,
+            added,
+            removed,
+        )
+        return self._words_response(ban_list, added, removed)
+
+    def replace_words(
+        self,
+        session: Session,
+        id: UUID,
+        organization_id: int,
+        project_id: int,
+        words: Sequence[str],
+    ) -> BanListWordsResponse:
+        ban_list = self._get_for_update(session, id, organization_id, project_id)
+        banned_words = list(dict.fromkeys(words))
+        self._write_words(session, ban_list, banned_words)
+        invalidate_config(ban_list.id)
+        return self._words_response(ban_list)
+
+    def _get_for_update(
+        self,
+        session: Session,
+        id: UUID,
+        organization_id: int,
+        project_id: int,
+    ) -> BanList:
+        ban_list = session.exec(
+            select(BanList).where(BanList.id == id).with_for_update()
+        ).first()
+
+        if ban_list is None:
+            raise HTTPException(status_code=404, detail="Ban list not found")
+
+        self.check_owner(ban_list, organization_id, project_id)
+        return ban_list
+
+    def _write_words(
+        self, session: Session, ban_list: BanList, banned_words: List[str]
+    ) -> None:
+        if len(banned_words) > MAX_STORED_BANNED_WORDS:
+            session.rollback()
+            raise HTTPException(
+                400,
+                f"Ban list cannot hold more than {MAX_STORED_BANNED_WORDS} words",
+            )
+
+        ban_list.banned_words = banned_words
+        ban_list.updated_at = now()
+        session.add(ban_list)
+        try:
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        session.refresh(ban_list)
+
+    def _words_response(
+        self,
+        ban_list: BanList,
+        added: Sequence[str] = (),
+        removed: Sequence[str] = (),
+    ) -> BanListWordsResponse:
+        return BanListWordsResponse(
+            id=ban_list.id,
+            updated_at=ban_list.updated_at,
+            word_count=len(ban_list.banned_words),
+            added=list(added),
+            removed=list(removed),
+        )
+
     def delete(self, session: Session, ban_list: BanList):
+        ban_list_id = ban_list.id
         session.delete(ban_list)
         try:
             session.commit()
@@ -131,6 +274,8 @@ class BanListCrud:
             session.rollback()
             raise
 
+        invalidate_config(ban_list_id)
+
     def check_owner(
         self, ban_list: BanList, organization_id: int, project_id: int
     ) -> None:
@@ -4,6 +4,7 @@ from fastapi import HTTPException
 from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from app.core.cache import invalidate_config
 from app.core.constants import DUPLICATE_LLM_PROMPT_CONFIG_ERROR
 from app.core.enum import LLMValidatorName
 from app.models.config.llm_prompt_config import LLMPromptConfig
@@ -120,9 +121,11 @@ class LLMPromptConfigCrud:
             raise
 
         session.refresh(obj)
+        invalidate_config(obj.id)
         return obj
 
     def delete(self, session: Session, obj: LLMPromptConfig) -> None:
+        obj_id = obj.id
         session.delete(obj)
         try:
             session.commit()
@@ -130,5 +133,7 @@ class LLMPromptConfigCrud:
             session.rollback()
             raise
 
+        invalidate_config(obj_id)
+
 
 llm_prompt_config_crud = LLMPromptConfigCrud()
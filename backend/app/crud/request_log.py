@@ -1,5 +1,6 @@
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlmodel import Session
 
 from app.models.logging.request_log import RequestLog, RequestLogUpdate, RequestStatus
@@ -25,6 +26,11 @@ class RequestLogCrud:
         self.session.refresh(create_request_log)
         return create_request_log
 
+    def create_many(self, request_logs: list[RequestLog]) -> None:
+        """Inserts the request logs of a batch in a single commit."""
+        self.session.add_all(request_logs)
+        self.session.commit()
+
     def update(
         self,
         request_log_id: UUID,
@@ -47,5 +53,25 @@ class RequestLogCrud:
 
         return request_log
 
+    def update_many(
+        self,
+        updates: list[tuple[UUID, RequestStatus, RequestLogUpdate]],
+    ) -> None:
+        """Finalizes the request logs of a batch with one bulk UPDATE by primary key."""
+        if not updates:
+            return
+        timestamp = now()
+        rows = [
+            {
+                "id": request_log_id,
+                "status": request_status,
+                "updated_at": timestamp,
+                **request_log_update.model_dump(exclude_unset=True),
+            }
+            for request_log_id, request_status, request_log_update in updates
+        ]
+        self.session.execute(update(RequestLog), rows)
+        self.session.commit()
+
     def get(self, request_log_id: UUID) -> RequestLog | None:
         return self.session.get(RequestLog, request_log_id)
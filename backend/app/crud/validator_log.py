@@ -16,3 +16,13 @@ class ValidatorLogCrud:
         self.session.commit()
         self.session.refresh(log)
         return log
+
+    def create_many(self, logs: list[ValidatorLog]) -> None:
+        """Inserts all validator logs of one request in a single commit."""
+        if not logs:
+            return
+        timestamp = now()
+        for log in logs:
+            log.updated_at = timestamp
+        self.session.add_all(logs)
+        self.session.commit()
@@ -1,9 +1,11 @@
+import random
 from pathlib import Path
 
 import pandas as pd
 from guardrails.hub import BanList
 from guardrails.validators import FailResult
 
+from app.core.validators.ban_list import build_ban_list
 from app.evaluation.common.helper import (
     build_evaluation_report,
     Profiler,
@@ -29,6 +31,15 @@ BAN_LIST_EVALUATIONS = [
     # },
 ]
 
+# Matchers compared on each config: (name, engine, max_distance).
+MATCHERS = [
+    ("hub", "hub", None),
+    ("trie", "trie", None),
+    ("trie_fuzzy_1", "trie", 1),
+    ("trie_fuzzy_2", "trie", 2),
+]
+TYPO_SEED = 7
+
 
 def run_evaluation(config: dict):
     """
@@ -102,10 +113,124 @@ def run_evaluation(config: dict):
     print(f"Completed {name} evaluation")
 
 
+def misspell(word: str, rng: random.Random) -> str:
+    """
+    One random edit (drop, double, swap or replace a letter) inside word.
+    Words under three letters have no inside and are returned unchanged.
+    """
+    if len(word) < 3:
+        return word
+    i = rng.randrange(1, len(word) - 1)
+    edit = rng.choice(["drop", "double", "swap", "replace"])
+    if edit == "drop":
+        return word[:i] + word[i + 1 :]
+    if edit == "double":
+        return word[:i] + word[i] + word[i:]
+    if edit == "swap":
+        return word[:i] + word[i + 1] + word[i] + word[i + 2 :]
+    return word[:i] + rng.choice("aeiourstn") + word[i + 1 :]
+
+
+def with_typos(texts: list[str], banned_words: list[str]) -> list[str]:
+    """
+    Copies of the texts that mention a banned word, with the longest word of
+    each mention misspelled once. Texts whose mentions are all too short to
+    misspell are left out.
+    """
+    rng = random.Random(TYPO_SEED)
+    misspelled = []
+    for text in texts:
+        lowered = text.lower()
+        mentioned = [word for word in banned_words if word.lower() in lowered]
+        if not mentioned:
+            continue
+        original_text = text
+        for phrase in mentioned:
+            start = lowered.find(phrase.lower())
+            if start < 0:
+                continue  # inside a mention misspelled already
+            longest = max(phrase.split(), key=len)
+            offset = start + phrase.lower().index(longest.lower())
+            original = text[offset : offset + len(longest)]
+            text = (
+                text[:offset] + misspell(original, rng) + text[offset + len(longest) :]
+            )
+            lowered = text.lower()
+        if text != original_text:
+            misspelled.append(text)
+    return misspelled
+
+
+def compare_matchers(config: dict):
+    """
+    Runs the config's banned words through every matcher in MATCHERS, on the
+    dataset and on misspelled copies of its rows that mention a banned word,
+    and writes precision/recall and latency per matcher.
+    """
+    name = config["name"]
+    banned_words = config["banned_words"]
+
+    dataset = pd.read_csv(DATASET_PATH)
+    texts = dataset["source_text"].astype(str).tolist()
+    if "label" in dataset.columns:
+        labels = dataset["label"].astype(int).tolist()
+    else:
+        labels = (
+            (dataset["source_text"].astype(str) != dataset["target_text"].astype(str))
+            .astype(int)
+            .tolist()
+        )
+    typo_texts = with_typos(
+        [text for text, label in zip(texts, labels, strict=True) if label], banned_words
+    )
+
+    reports = {}
+    for matcher, engine, max_distance in MATCHERS:
+        validator = build_ban_list(banned_words, engine, max_distance=max_distance)
+
+        def flagged(text: str, validator=validator) -> int:
+            return int(isinstance(validator.validate(text, {}), FailResult))
+
+        with Profiler() as p:
+            predictions = [p.record(flagged, text) for text in texts]
+        with Profiler() as typo_p:
+            typo_predictions = [typo_p.record(flagged, text) for text in typo_texts]
+
+        reports[matcher] = build_evaluation_report(
+            guardrail=f"ban_list_{matcher}",
+            num_samples=len(texts),
+            profiler=p,
+            engine=engine,
+            max_distance=max_distance,
+            metrics=compute_binary_metrics(labels, predictions),
+            misspelled={
+                "num_samples": len(typo_texts),
+                "recall": (
+                    round(sum(typo_predictions) / len(typo_texts), 2)
+                    if typo_texts
+                    else 0.0
+                ),
+                "performance": build_evaluation_report(
+                    guardrail=f"ban_list_{matcher}_misspelled",
+                    num_samples=len(typo_texts),
+                    profiler=typo_p,
+                )["performance"],
+            },
+        )
+
+    write_json(
+        {"banned_words": banned_words, "matchers": reports},
+        OUT_DIR / f"{name}-matchers.json",
+    )
+
+    print(f"Completed {name} matcher comparison")
+
+
 def main():
     """Iterate over all entries in BAN_LIST_EVALUATIONS and run each evaluation in sequence."""
     for config in BAN_LIST_EVALUATIONS:
         run_evaluation(config)
+        compare_matchers(config)
 
 
 if __name__ == "__main__":
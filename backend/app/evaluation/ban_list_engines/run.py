@@ -0,0 +1,96 @@
+import random
+from pathlib import Path
+
+from guardrails.validators import FailResult
+
+from app.core.validators.ban_list import build_ban_list
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    compute_binary_metrics,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "ban_list_engines"
+
+LIST_SIZES = [100, 1_000, 10_000, 50_000, 200_000]
+# The hub engine searches for every word separately, so larger lists are
+# not run against it.
+HUB_MAX_WORDS = 10_000
+NUM_TEXTS = 200
+PHRASE_RATE = 0.2
+SEED = 23
+
+SYLLABLES = [
+    "ab", "ce", "do", "fi", "ga", "hu", "ki", "lo", "ma", "ne", "pi", "ra",
+    "sol", "tan", "vex", "zol", "mid", "pra", "xin", "dor",
+]  # fmt: skip
+SENTENCES = [
+    "Please tell me the dose for my mother.",
+    "Is this tablet safe during pregnancy?",
+    "The clinic is open from nine to five on weekdays.",
+    "Mujhe iske side effects ke baare mein batao.",
+    "Can I buy this from the pharmacy near the bus stand?",
+    "Doctor ne din mein do baar lene ko kaha hai.",
+]
+
+
+def banned_terms(size: int, rng: random.Random) -> list[str]:
+    """Drug and brand name like terms, some of them two-word phrases."""
+    terms: set[str] = set()
+    while len(terms) < size:
+        term = "".join(rng.choices(SYLLABLES, k=rng.randint(3, 5)))
+        if rng.random() < PHRASE_RATE:
+            term += " " + "".join(rng.choices(SYLLABLES, k=2))
+        terms.add(term)
+    return sorted(terms)
+
+
+def sample_texts(terms: list[str], rng: random.Random) -> tuple[list[str], list[int]]:
+    texts, labels = [], []
+    for _ in range(NUM_TEXTS):
+        sentences = rng.sample(SENTENCES, 3)
+        label = int(rng.random() < 0.5)
+        if label:
+            sentences.insert(1, f"What about {rng.choice(terms).title()}?")
+        texts.append(" ".join(sentences))
+        labels.append(label)
+    return texts, labels
+
+
+def evaluate(engine: str, terms: list[str], texts: list[str], labels: list[int]):
+    with Profiler() as build:
+        validator = build.record(build_ban_list, terms, engine)
+
+    def flagged(text: str) -> int:
+        return int(isinstance(validator.validate(text, {}), FailResult))
+
+    with Profiler() as p:
+        predictions = [p.record(flagged, text) for text in texts]
+
+    return build_evaluation_report(
+        guardrail=f"ban_list_{engine}",
+        num_samples=len(texts),
+        profiler=p,
+        build=build_evaluation_report(
+            guardrail=f"ban_list_{engine}_build", num_samples=1, profiler=build
+        )["performance"],
+        metrics=compute_binary_metrics(labels, predictions),
+    )
+
+
+rng = random.Random(SEED)
+reports = []
+for size in LIST_SIZES:
+    terms = banned_terms(size, rng)
+    texts, labels = sample_texts(terms, rng)
+    report = {
+        "list_size": size,
+        "trie": evaluate("trie", terms, texts, labels),
+    }
+    if size <= HUB_MAX_WORDS:
+        report["hub"] = evaluate("hub", terms, texts, labels)
+    reports.append(report)
+
+write_json({"list_sizes": reports}, OUT_DIR / "metrics.json")
@@ -31,6 +31,11 @@ def summarize_latency(latencies: list[float]) -> dict[str, float]:
     }
 
 
+def texts_per_second(num_texts: int, profiler: "Profiler") -> float:
+    total_ms = sum(profiler.latencies)
+    return round(num_texts / (total_ms / 1000), 1) if total_ms else 0.0
+
+
 def build_performance_payload(profiler: "Profiler") -> dict[str, Any]:
     return {
         "latency_ms": summarize_latency(profiler.latencies),
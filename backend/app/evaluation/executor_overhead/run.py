@@ -0,0 +1,106 @@
+import tracemalloc
+from pathlib import Path
+
+from guardrails import Guard
+
+from app.core.guardrail_controller import build_validators
+from app.core.validator_executor import ValidatorExecutor
+from app.core.validators.config.gender_assumption_bias_safety_validator_config import (
+    GenderAssumptionBiasSafetyValidatorConfig,
+)
+from app.core.validators.config.lexical_slur_safety_validator_config import (
+    LexicalSlurSafetyValidatorConfig,
+)
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "executor_overhead"
+
+NUM_REQUESTS = 2000
+WARMUP_REQUESTS = 50
+TEXTS = [
+    "How do I register my child for the vaccination camp?",
+    "The chairman said he will call the nurse and her team tomorrow.",
+    "Mujhe apne bachche ke liye school admission ki jaankari chahiye.",
+    "Please share the helpline number for the scholarship scheme.",
+]
+
+# Local validators only, so the numbers show the per-request cost of the
+# execution path rather than model or network time.
+VALIDATOR_CONFIGS = [
+    LexicalSlurSafetyValidatorConfig(type="uli_slur_match"),
+    GenderAssumptionBiasSafetyValidatorConfig(type="gender_assumption_bias"),
+]
+
+
+def guard_path(validators):
+    def run(text):
+        return Guard().use(*validators).validate(text).validated_output
+
+    return run
+
+
+def executor_path(validators):
+    def run(text):
+        return (
+            ValidatorExecutor(validators, concurrent=False)
+            .validate(text)
+            .validated_output
+        )
+
+    return run
+
+
+def measure(run) -> tuple[Profiler, list[float], list]:
+    """Per-request latency and allocation high-water mark (KiB above baseline)."""
+    for i in range(WARMUP_REQUESTS):
+        run(TEXTS[i % len(TEXTS)])
+
+    allocations_kib = []
+    outputs = []
+    with Profiler() as p:
+        for i in range(NUM_REQUESTS):
+            text = TEXTS[i % len(TEXTS)]
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            outputs.append(p.record(run, text))
+            _, peak = tracemalloc.get_traced_memory()
+            allocations_kib.append((peak - baseline) / 1024)
+    return p, allocations_kib, outputs
+
+
+def allocation_summary(allocations_kib: list[float]) -> dict[str, float]:
+    ordered = sorted(allocations_kib)
+    return {
+        "mean_kib": round(sum(ordered) / len(ordered), 2),
+        "p95_kib": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+    }
+
+
+validators = build_validators(VALIDATOR_CONFIGS)
+guard, guard_allocations, guard_outputs = measure(guard_path(validators))
+executor, executor_allocations, executor_outputs = measure(executor_path(validators))
+
+write_json(
+    {
+        "validators": [v_item.type for v_item in VALIDATOR_CONFIGS],
+        "outputs_match": guard_outputs == executor_outputs,
+        "guard": build_evaluation_report(
+            guardrail="guard_validate",
+            num_samples=NUM_REQUESTS,
+            profiler=guard,
+            per_request_allocation=allocation_summary(guard_allocations),
+        ),
+        "executor": build_evaluation_report(
+            guardrail="validator_executor",
+            num_samples=NUM_REQUESTS,
+            profiler=executor,
+            per_request_allocation=allocation_summary(executor_allocations),
+        ),
+    },
+    OUT_DIR / "metrics.json",
+)
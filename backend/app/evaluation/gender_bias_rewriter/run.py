@@ -0,0 +1,93 @@
+import random
+import re
+from pathlib import Path
+
+import pandas as pd
+
+from app.core.config import Settings
+from app.core.enum import BiasCategories
+from app.core.validators.gender_assumption_bias import GenderAssumptionBias
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "gender_bias_rewriter"
+
+# Approximate characters per LLM output.
+OUTPUT_LENGTHS = [500, 2_000, 8_000, 32_000]
+NUM_TEXTS = 50
+SEED = 5
+
+SENTENCES = [
+    "The doctor explained the treatment plan to the family in simple words.",
+    "He said the headmaster will share the admission list on Monday.",
+    "Please ask the midwife about the vaccination schedule for the baby.",
+    "Uska naam register mein hai, aur woh kal centre aayegi.",
+    "The salesman offered a discount, but she asked for the receipt.",
+    "वह कल स्कूल गया था और शिक्षक से मिला।",
+    "Students should bring their documents to the front desk.",
+    "The policeman helped them fill the complaint form.",
+]
+
+
+def sequential_request(text: str):
+    """A request before the shared rewriter: read the CSV, then one sub per entry."""
+    df = pd.read_csv(Settings.GENDER_BIAS_LIST_FILEPATH)
+    df["word"] = df["word"].str.lower()
+    df["neutral-term"] = df["neutral-term"].str.lower()
+
+    detected = []
+    for row in df.to_dict(orient="records"):
+        pattern = rf"\b{re.escape(row['word'])}\b"
+        if re.search(pattern, text, flags=re.IGNORECASE):
+            detected.append(row["word"])
+            text = re.sub(pattern, row["neutral-term"], text, flags=re.IGNORECASE)
+    return detected, text
+
+
+def single_pass_request(text: str):
+    validator = GenderAssumptionBias(categories=[BiasCategories.All])
+    return validator._rewriter.rewrite(text)
+
+
+def sample_texts(length: int, rng: random.Random) -> list[str]:
+    texts = []
+    for _ in range(NUM_TEXTS):
+        sentences = []
+        while sum(len(sentence) + 1 for sentence in sentences) < length:
+            sentences.append(rng.choice(SENTENCES))
+        texts.append(" ".join(sentences))
+    return texts
+
+
+rng = random.Random(SEED)
+reports = []
+for length in OUTPUT_LENGTHS:
+    texts = sample_texts(length, rng)
+
+    with Profiler() as before:
+        before_outputs = [before.record(sequential_request, text) for text in texts]
+    with Profiler() as after:
+        after_outputs = [after.record(single_pass_request, text) for text in texts]
+
+    reports.append(
+        {
+            "output_chars": length,
+            "outputs_match": before_outputs == after_outputs,
+            "sequential": build_evaluation_report(
+                guardrail="gender_assumption_bias_sequential",
+                num_samples=len(texts),
+                profiler=before,
+            ),
+            "single_pass": build_evaluation_report(
+                guardrail="gender_assumption_bias_single_pass",
+                num_samples=len(texts),
+                profiler=after,
+            ),
+        }
+    )
+
+write_json({"outputs": reports}, OUT_DIR / "metrics.json")
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+import pandas as pd
+from presidio_anonymizer import AnonymizerEngine
+
+from app.core.validators.pii_remover import (
+    ALL_ENTITY_TYPES,
+    NER_ENTITY_TYPES,
+    _build_analyzer,
+    _get_nlp_engine,
+)
+from app.evaluation.common.helper import Profiler, build_evaluation_report, write_json
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "pii_remover"
+
+# Entity types with no NER-backed type, which PIIRemover analyzes without
+# the spaCy model.
+PATTERN_ENTITY_TYPES = [t for t in ALL_ENTITY_TYPES if t not in NER_ENTITY_TYPES]
+# Mismatching rows written to the report, for inspection.
+MAX_MISMATCHES = 20
+
+df = pd.read_csv(BASE_DIR / "datasets" / "pii_detection_testing_dataset.csv")
+texts = df["source_text"].astype(str).tolist()
+
+analyzers = {
+    "spacy_pipeline": _build_analyzer(
+        PATTERN_ENTITY_TYPES, nlp_engine=_get_nlp_engine()
+    ),
+    "tokenizer_only": _build_analyzer(PATTERN_ENTITY_TYPES),
+}
+anonymizer = AnonymizerEngine()
+
+
+def detections(analyzer, text: str) -> list:
+    return analyzer.analyze(text=text, entities=PATTERN_ENTITY_TYPES, language="en")
+
+
+def as_set(results) -> set:
+    return {(r.entity_type, r.start, r.end, round(r.score, 6)) for r in results}
+
+
+reports, found = {}, {}
+for name, analyzer in analyzers.items():
+    detections(analyzer, texts[0])  # first call outside the timings
+    with Profiler() as p:
+        found[name] = [p.record(detections, analyzer, text) for text in texts]
+    reports[name] = build_evaluation_report(
+        guardrail=f"pii_remover_{name}", num_samples=len(texts), profiler=p
+    )
+
+mismatches = []
+for text, full, fast in zip(
+    texts, found["spacy_pipeline"], found["tokenizer_only"], strict=True
+):
+    same_detections = as_set(full) == as_set(fast)
+    same_text = (
+        anonymizer.anonymize(text=text, analyzer_results=full).text
+        == anonymizer.anonymize(text=text, analyzer_results=fast).text
+    )
+    if not (same_detections and same_text):
+        mismatches.append(
+            {
+                "text": text,
+                "same_anonymized_text": same_text,
+                "spacy_pipeline": sorted(map(str, as_set(full))),
+                "tokenizer_only": sorted(map(str, as_set(fast))),
+            }
+        )
+
+mean = {name: r["performance"]["latency_ms"]["mean"] for name, r in reports.items()}
+write_json(
+    {
+        "entity_types": PATTERN_ENTITY_TYPES,
+        "num_samples": len(texts),
+        "identical_rate": round(1 - len(mismatches) / len(texts), 4) if texts else 1.0,
+        "speedup": (
+            round(mean["spacy_pipeline"] / mean["tokenizer_only"], 1)
+            if mean["tokenizer_only"]
+            else None
+        ),
+        "analyzers": reports,
+        "mismatches": mismatches[:MAX_MISMATCHES],
+    },
+    OUT_DIR / "fast_path.json",
+)
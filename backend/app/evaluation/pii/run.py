@@ -1,50 +1,157 @@
+import argparse
 from pathlib import Path
 import pandas as pd
 from guardrails.validators import FailResult
 
-from app.core.validators.pii_remover import PIIRemover
+from app.core.validators.pii_remover import (
+    SPACY_MODEL_TIERS,
+    PIIRemover,
+    _get_nlp_engine,
+    is_installed,
+)
+from app.core.warmup import rss_bytes
 from app.evaluation.common.helper import (
     Profiler,
     build_evaluation_report,
+    texts_per_second,
     write_csv,
     write_json,
 )
-from app.evaluation.pii.entity_metrics import compute_entity_metrics
+from app.evaluation.pii.entity_metrics import (
+    compute_entity_metrics,
+    finalize_entity_metrics,
+)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 OUT_DIR = BASE_DIR / "outputs" / "pii_remover"
 
-df = pd.read_csv(BASE_DIR / "datasets" / "pii_detection_testing_dataset.csv")
+# nlp.pipe batch sizes and process counts the batched run is timed with.
+BATCH_SIZES = [8, 32, 128]
+N_PROCESSES = [1, 2]
 
-validator = PIIRemover()
 
-
-def run_pii(text: str) -> str:
-    result = validator._validate(text)
+def anonymized(text: str, result) -> str:
     if isinstance(result, FailResult):
         return result.fix_value
     return text
 
 
-with Profiler() as p:
-    df["anonymized"] = (
-        df["source_text"].astype(str).apply(lambda x: p.record(run_pii, x))
+def run_single(validator: PIIRemover, texts: list[str]) -> tuple[list[str], Profiler]:
+    def run_pii(text: str) -> str:
+        return anonymized(text, validator._validate(text))
+
+    with Profiler() as p:
+        predictions = [p.record(run_pii, text) for text in texts]
+    return predictions, p
+
+
+def overall_metrics(entity_report: dict) -> dict:
+    """Micro-averaged precision, recall and F1 over all entity types."""
+    counts = ("true_positive", "false_positive", "false_negative")
+    totals = {c: sum(m[c] for m in entity_report.values()) for c in counts}
+    return finalize_entity_metrics({"overall": totals})["overall"]
+
+
+def evaluate(df: pd.DataFrame):
+    texts = df["source_text"].astype(str).tolist()
+    validator = PIIRemover()
+
+    df["anonymized"], p = run_single(validator, texts)
+
+    batch_runs = []
+    for n_process in N_PROCESSES:
+        for batch_size in BATCH_SIZES:
+            with Profiler() as batch:
+                results = batch.record(
+                    validator.validate_batch, texts, batch_size, n_process
+                )
+            batch_runs.append(
+                {
+                    "batch_size": batch_size,
+                    "n_process": n_process,
+                    "texts_per_sec": texts_per_second(len(texts), batch),
+                    "same_as_single": [
+                        anonymized(text, result)
+                        for text, result in zip(texts, results, strict=True)
+                    ]
+                    == df["anonymized"].tolist(),
+                    "memory_mb": round(batch.peak_memory_mb, 2),
+                }
+            )
+
+    entity_report = compute_entity_metrics(
+        df["target_text"],
+        df["anonymized"],
     )
 
-entity_report = compute_entity_metrics(
-    df["target_text"],
-    df["anonymized"],
-)
+    # ---- Save outputs ----
+    write_csv(df, OUT_DIR / "predictions.csv")
 
-# ---- Save outputs ----
-write_csv(df, OUT_DIR / "predictions.csv")
-
-write_json(
-    build_evaluation_report(
-        guardrail="pii_remover",
-        num_samples=len(df),
-        profiler=p,
-        entity_metrics=entity_report,
-    ),
-    OUT_DIR / "metrics.json",
-)
+    write_json(
+        build_evaluation_report(
+            guardrail="pii_remover",
+            num_samples=len(df),
+            profiler=p,
+            entity_metrics=entity_report,
+            throughput={
+                "single_texts_per_sec": texts_per_second(len(texts), p),
+                "batched": batch_runs,
+            },
+        ),
+        OUT_DIR / "metrics.json",
+    )
+
+
+def evaluate_tiers(df: pd.DataFrame):
+    """Runs the dataset through every installed spaCy model tier."""
+    texts = df["source_text"].astype(str).tolist()
+    tiers, not_installed = {}, []
+    for tier, model_name in SPACY_MODEL_TIERS.items():
+        if not is_installed(model_name):
+            not_installed.append(tier)
+            continue
+
+        rss_before = rss_bytes()
+        with Profiler() as load:
+            load.record(_get_nlp_engine, tier)
+        model_rss_mb = (rss_bytes() - rss_before) / 2**20
+
+        predictions, p = run_single(PIIRemover(spacy_model=tier), texts)
+        entity_report = compute_entity_metrics(df["target_text"], predictions)
+        tiers[tier] = build_evaluation_report(
+            guardrail=f"pii_remover_{tier}",
+            num_samples=len(texts),
+            profiler=p,
+            model=model_name,
+            overall=overall_metrics(entity_report),
+            entity_metrics=entity_report,
+            model_load={
+                "latency_ms": round(load.latencies[0], 2),
+                "rss_mb": round(model_rss_mb, 2),
+            },
+        )
+
+    write_json(
+        {"tiers": tiers, "not_installed": not_installed},
+        OUT_DIR / "model_tiers.json",
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--tiers",
+        action="store_true",
+        help="Compare every installed spaCy model tier instead of the default run.",
+    )
+    args = parser.parse_args()
+
+    df = pd.read_csv(BASE_DIR / "datasets" / "pii_detection_testing_dataset.csv")
+    if args.tiers:
+        evaluate_tiers(df)
+    else:
+        evaluate(df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import random
+import re
+import time
+from pathlib import Path
+
+from app.core.phrase_matcher import PhraseMatcher
+from app.core.validators.lexical_slur import LexicalSlur
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "slur_matcher"
+
+LEXICON_SIZES = [1_000, 10_000, 100_000]
+NUM_TEXTS = 200
+# The per-pattern loop takes seconds per text on the largest lexicons.
+MAX_REGEX_TEXTS = 20
+SEED = 13
+
+FILLER = (
+    "the vaccine camp is on monday please share the helpline number "
+    "mujhe school admission ki jaankari chahiye aur form kab milega "
+    "कृपया मुझे छात्रवृत्ति योजना के बारे में बताएं"
+).split()
+SYLLABLES = ["ka", "ra", "ma", "chu", "ti", "bha", "lo", "di", "ya", "ga", "na"]
+DEVANAGARI = ["क", "र", "म", "चु", "ति", "भ", "लो", "दी", "या", "ग", "ना"]
+
+
+def regional_lexicon(base: list[str], size: int, rng: random.Random) -> list[str]:
+    """The shipped lexicon padded with made-up Latin and Devanagari entries."""
+    lexicon = list(base)
+    seen = set(lexicon)
+    while len(lexicon) < size:
+        syllables = rng.choice([SYLLABLES, DEVANAGARI])
+        word = "".join(rng.choices(syllables, k=rng.randint(2, 4)))
+        entry = word if rng.random() < 0.8 else f"{word} {rng.choice(FILLER)}"
+        if entry not in seen:
+            seen.add(entry)
+            lexicon.append(entry)
+    return lexicon
+
+
+def sample_texts(lexicon: list[str], rng: random.Random) -> list[str]:
+    texts = []
+    for i in range(NUM_TEXTS):
+        words = rng.choices(FILLER, k=rng.randint(8, 30))
+        if i % 3 == 0:
+            words.insert(rng.randrange(len(words)), rng.choice(lexicon))
+        texts.append(" ".join(words))
+    return texts
+
+
+def per_pattern(lexicon: list[str]):
+    """The matcher LexicalSlur used before: one regex per entry, longest first."""
+    patterns = sorted(
+        (
+            (slur, re.compile(rf"(?<!\w){re.escape(slur)}(?!\w)", re.IGNORECASE))
+            for slur in lexicon
+        ),
+        key=lambda x: len(x[0]),
+        reverse=True,
+    )
+
+    def run(text):
+        found = [slur for slur, pattern in patterns if pattern.search(text)]
+        redacted = text
+        for slur, pattern in patterns:
+            if slur in found:
+                redacted = pattern.sub("[REDACTED_SLUR]", redacted)
+        return found, redacted
+
+    return run
+
+
+def automaton(lexicon: list[str]):
+    matcher = PhraseMatcher(lexicon)
+    return lambda text: matcher.redact(text, "[REDACTED_SLUR]")
+
+
+def measure(build, lexicon: list[str], texts: list[str]):
+    started = time.perf_counter()
+    run = build(lexicon)
+    build_ms = (time.perf_counter() - started) * 1000
+    with Profiler() as p:
+        outputs = [p.record(run, text) for text in texts]
+    return build_ms, p, outputs
+
+
+rng = random.Random(SEED)
+base = LexicalSlur().slur_list
+reports = []
+for size in [len(base), *LEXICON_SIZES]:
+    lexicon = regional_lexicon(base, size, rng)
+    texts = sample_texts(lexicon, rng)
+    regex_texts = texts[:MAX_REGEX_TEXTS] if size > 10_000 else texts
+
+    regex_build_ms, regex, regex_outputs = measure(per_pattern, lexicon, regex_texts)
+    matcher_build_ms, matcher, matcher_outputs = measure(automaton, lexicon, texts)
+
+    reports.append(
+        {
+            "lexicon_size": size,
+            "outputs_match": matcher_outputs[: len(regex_outputs)] == regex_outputs,
+            "per_pattern": build_evaluation_report(
+                guardrail="per_pattern_regex",
+                num_samples=len(regex_texts),
+                profiler=regex,
+                build_ms=round(regex_build_ms, 2),
+            ),
+            "automaton": build_evaluation_report(
+                guardrail="phrase_matcher",
+                num_samples=len(texts),
+                profiler=matcher,
+                build_ms=round(matcher_build_ms, 2),
+            ),
+        }
+    )
+
+write_json({"lexicons": reports}, OUT_DIR / "metrics.json")
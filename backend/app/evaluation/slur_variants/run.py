@@ -0,0 +1,116 @@
+import random
+from pathlib import Path
+
+from app.core.validators.lexical_slur import LexicalSlur
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "slur_variants"
+
+NUM_CLEAN_TEXTS = 500
+SEED = 17
+
+SENTENCES = [
+    "Mujhe apne bachche ke liye school admission ki jaankari chahiye.",
+    "Vaccination camp kab lagega aur kahan jaana hoga?",
+    "Please share the helpline number for the scholarship scheme.",
+    "Gaadi kharab ho gayi hai, aaj centre nahi aa paayenge.",
+    "The doctor said to take the medicine twice a day.",
+    "Aapka appointment kal subah 10 baje confirm ho gaya hai.",
+    "Can you explain the eligibility criteria in simple words?",
+    "मुझे अपने बच्चे के लिए स्कूल में दाख़िले की जानकारी चाहिए।",
+    "टीकाकरण शिविर कब लगेगा और कहाँ जाना होगा?",
+    "Bhai, form bharne ki last date kya hai?",
+]
+LEET = {"a": "@", "i": "1", "e": "3", "o": "0", "s": "$"}
+HOMOGLYPHS = {"a": "а", "o": "о", "e": "е", "c": "с", "p": "р"}
+
+
+def spaced(word, rng):
+    return rng.choice([" ", ".", "-"]).join(word)
+
+
+def leet(word, rng):
+    return "".join(LEET.get(char, char) for char in word)
+
+
+def repeated(word, rng):
+    vowels = [i for i, char in enumerate(word) if char in "aeiou"]
+    if not vowels:
+        return word
+    i = rng.choice(vowels)
+    return word[:i] + word[i] * 3 + word[i + 1 :]
+
+
+def homoglyph(word, rng):
+    return "".join(HOMOGLYPHS.get(char, char) for char in word)
+
+
+OBFUSCATIONS = {
+    "spaced": spaced,
+    "leetspeak": leet,
+    "repeated": repeated,
+    "homoglyph": homoglyph,
+}
+
+
+def run(validator, texts):
+    with Profiler() as p:
+        flagged = [
+            p.record(lambda text: validator._validate(text).outcome == "fail", text)
+            for text in texts
+        ]
+    return p, sum(flagged) / len(texts)
+
+
+rng = random.Random(SEED)
+exact = LexicalSlur()
+variants = LexicalSlur(match_variants=True)
+lexicon = [slur for slur in exact.slur_list if slur.isascii() and " " not in slur]
+
+clean = [" ".join(rng.sample(SENTENCES, 2)) for _ in range(NUM_CLEAN_TEXTS)]
+reports = {}
+for name, obfuscate in OBFUSCATIONS.items():
+    texts = [
+        f"{rng.choice(SENTENCES)} {obfuscate(slur, rng)} {rng.choice(SENTENCES)}"
+        for slur in lexicon
+    ]
+    exact_profiler, exact_recall = run(exact, texts)
+    variant_profiler, variant_recall = run(variants, texts)
+    reports[name] = {
+        "exact": build_evaluation_report(
+            guardrail="uli_slur_match",
+            num_samples=len(texts),
+            profiler=exact_profiler,
+            recall=round(exact_recall, 3),
+        ),
+        "match_variants": build_evaluation_report(
+            guardrail="uli_slur_match_variants",
+            num_samples=len(texts),
+            profiler=variant_profiler,
+            recall=round(variant_recall, 3),
+        ),
+    }
+
+exact_profiler, exact_fpr = run(exact, clean)
+variant_profiler, variant_fpr = run(variants, clean)
+reports["clean"] = {
+    "exact": build_evaluation_report(
+        guardrail="uli_slur_match",
+        num_samples=len(clean),
+        profiler=exact_profiler,
+        false_positive_rate=round(exact_fpr, 3),
+    ),
+    "match_variants": build_evaluation_report(
+        guardrail="uli_slur_match_variants",
+        num_samples=len(clean),
+        profiler=variant_profiler,
+        false_positive_rate=round(variant_fpr, 3),
+    ),
+}
+
+write_json(reports, OUT_DIR / "metrics.json")
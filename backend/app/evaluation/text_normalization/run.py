@@ -0,0 +1,115 @@
+import random
+import re
+import unicodedata
+from pathlib import Path
+
+import emoji
+import ftfy
+
+from app.core.text_normalizer import (
+    _PLAIN,
+    _normalize,
+    normalization_cache,
+    normalize_for_matching,
+)
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "text_normalization"
+
+NUM_TEXTS = 500
+# Sentences per text: single chat messages, and long LLM answers.
+LENGTHS = {"message": (1, 3), "llm_output": (15, 40)}
+# Share of texts that repeat an earlier one (retries, input/output stages).
+REPEAT_RATE = 0.3
+EMOJI_RATE = 0.1
+SEED = 11
+
+CORPORA = {
+    "hinglish": [
+        "Mujhe apne bachche ke liye school admission ki jaankari chahiye.",
+        "Vaccination camp kab lagega aur kahan jaana hoga?",
+        "Scholarship form bharne ki last date kya hai?",
+        "Aapka appointment kal subah 10 baje confirm ho gaya hai.",
+        "Please apna Aadhaar number aur mobile number share karein.",
+        "Doctor ne kaha hai ki din mein do baar dawai leni hai.",
+    ],
+    "devanagari": [
+        "मुझे अपने बच्चे के लिए स्कूल में दाख़िले की जानकारी चाहिए।",
+        "टीकाकरण शिविर कब लगेगा और कहाँ जाना होगा?",
+        "छात्रवृत्ति का फ़ॉर्म भरने की आख़िरी तारीख़ क्या है?",
+        "आपका अपॉइंटमेंट कल सुबह 10 बजे पक्का हो गया है।",
+        "कृपया अपना आधार नंबर और मोबाइल नंबर साझा करें।",
+        "डॉक्टर ने कहा है कि दिन में दो बार दवा लेनी है।",
+    ],
+}
+EMOJIS = ["🙏", "👍🏽", "😊", "❤️"]
+
+
+def full_pipeline(text: str) -> str:
+    """Every step on every text, as LexicalSlur normalized before the fast path."""
+    text = emoji.replace_emoji(text, replace="")
+    text = ftfy.fix_text(text)
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.lower()
+
+
+def build_texts(sentences: list[str], length: tuple[int, int], rng) -> list[str]:
+    texts: list[str] = []
+    for _ in range(NUM_TEXTS):
+        if texts and rng.random() < REPEAT_RATE:
+            texts.append(rng.choice(texts))
+            continue
+        text = " ".join(rng.choices(sentences, k=rng.randint(*length)))
+        if rng.random() < EMOJI_RATE:
+            text += " " + rng.choice(EMOJIS)
+        texts.append(text)
+    return texts
+
+
+def measure(normalize, texts: list[str]) -> tuple[Profiler, list[str]]:
+    with Profiler() as p:
+        outputs = [p.record(normalize, text) for text in texts]
+    return p, outputs
+
+
+rng = random.Random(SEED)
+reports = []
+for corpus, sentences in CORPORA.items():
+    for length_name, length in LENGTHS.items():
+        texts = build_texts(sentences, length, rng)
+
+        full, full_outputs = measure(full_pipeline, texts)
+        fast, fast_outputs = measure(_normalize, texts)
+        normalization_cache.clear()
+        memo, memo_outputs = measure(normalize_for_matching, texts)
+
+        reports.append(
+            {
+                "corpus": corpus,
+                "texts": length_name,
+                "fast_path_share": round(
+                    sum(bool(_PLAIN.fullmatch(text)) for text in texts) / len(texts), 2
+                ),
+                "outputs_match": full_outputs == fast_outputs == memo_outputs,
+                "full_pipeline": build_evaluation_report(
+                    guardrail="full_pipeline", num_samples=len(texts), profiler=full
+                ),
+                "fast_path": build_evaluation_report(
+                    guardrail="fast_path", num_samples=len(texts), profiler=fast
+                ),
+                "fast_path_memoized": build_evaluation_report(
+                    guardrail="fast_path_memoized",
+                    num_samples=len(texts),
+                    profiler=memo,
+                    cache=normalization_cache.stats(),
+                ),
+            }
+        )
+
+write_json({"corpora": reports}, OUT_DIR / "metrics.json")
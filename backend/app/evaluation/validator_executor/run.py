@@ -0,0 +1,115 @@
+import asyncio
+import time
+from pathlib import Path
+
+from guardrails.validators import PassResult, Validator, register_validator
+
+from app.core.enum import GuardrailOnFail
+from app.core.guardrail_controller import is_barrier
+from app.core.validator_executor import ValidatorExecutor
+from app.evaluation.common.helper import (
+    Profiler,
+    build_evaluation_report,
+    write_json,
+)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+OUT_DIR = BASE_DIR / "outputs" / "validator_executor"
+
+NUM_REQUESTS = 20
+TEXT = "How do I register my child for the vaccination camp?"
+
+# Simulated round-trips for the validators of a typical LLM-heavy request:
+# pii_remover, topic_relevance_llm, answer_relevance_custom_llm, llamaguard_7b.
+SIMULATED_LATENCIES_MS = {
+    "pii_remover": 50,
+    "topic_relevance_llm": 400,
+    "answer_relevance_custom_llm": 300,
+    "llamaguard_7b": 500,
+}
+
+# on_fail per validator, as a request to the API can set them.
+SCENARIOS = {
+    "all_exception": {
+        name: GuardrailOnFail.Exception for name in SIMULATED_LATENCIES_MS
+    },
+    "all_rephrase": {name: GuardrailOnFail.Rephrase for name in SIMULATED_LATENCIES_MS},
+    # The config default.
+    "all_fix": {name: GuardrailOnFail.Fix for name in SIMULATED_LATENCIES_MS},
+    "pii_fix_then_exception": {
+        name: GuardrailOnFail.Fix
+        if name == "pii_remover"
+        else GuardrailOnFail.Exception
+        for name in SIMULATED_LATENCIES_MS
+    },
+}
+
+
+@register_validator(name="evaluation/simulated_remote", data_type="string")
+class SimulatedRemoteValidator(Validator):
+    """Waits like a remote (LLM / hosted model) validator, then passes."""
+
+    def __init__(self, latency_ms: int, **kwargs):
+        super().__init__(latency_ms=latency_ms, **kwargs)
+        self.latency_ms = latency_ms
+
+    def _validate(self, value, metadata):
+        time.sleep(self.latency_ms / 1000)
+        return PassResult()
+
+    async def async_validate(self, value, metadata):
+        await asyncio.sleep(self.latency_ms / 1000)
+        return PassResult()
+
+
+def build_executor(on_fail: dict, concurrent: bool) -> ValidatorExecutor:
+    # The validators always pass, so only the barriers an on_fail implies (as
+    # the API derives them) change how they are scheduled.
+    return ValidatorExecutor(
+        [
+            SimulatedRemoteValidator(latency_ms=latency)
+            for latency in SIMULATED_LATENCIES_MS.values()
+        ],
+        concurrent=concurrent,
+        barriers=[is_barrier(on_fail[name]) for name in SIMULATED_LATENCIES_MS],
+    )
+
+
+def run(on_fail: dict, concurrent: bool) -> Profiler:
+    executor = build_executor(on_fail, concurrent)
+    with Profiler() as p:
+        for _ in range(NUM_REQUESTS):
+            p.record(lambda: asyncio.run(executor.async_validate(TEXT)))
+    return p
+
+
+def main():
+    reports = {}
+    for scenario, on_fail in SCENARIOS.items():
+        reports[scenario] = {
+            "on_fail": {name: value.value for name, value in on_fail.items()},
+            "sequential": build_evaluation_report(
+                guardrail=f"validator_executor_{scenario}_sequential",
+                num_samples=NUM_REQUESTS,
+                profiler=run(on_fail, concurrent=False),
+            ),
+            "concurrent": build_evaluation_report(
+                guardrail=f"validator_executor_{scenario}_concurrent",
+                num_samples=NUM_REQUESTS,
+                profiler=run(on_fail, concurrent=True),
+            ),
+        }
+
+    write_json(
+        {
+            "simulated_latencies_ms": SIMULATED_LATENCIES_MS,
+            "sum_ms": sum(SIMULATED_LATENCIES_MS.values()),
+            "max_ms": max(SIMULATED_LATENCIES_MS.values()),
+            "scenarios": reports,
+        },
+        OUT_DIR / "metrics.json",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from asgi_correlation_id.middleware import CorrelationIdMiddleware
 import sentry_sdk
 from fastapi import FastAPI
@@ -6,7 +9,9 @@ from fastapi.routing import APIRoute
 from app.api.main import api_router
 from app.core.config import settings
 from app.core.exception_handlers import register_exception_handlers
+from app.core.llm_response_cache import prune_periodically
 from app.core.middleware import http_request_logger
+from app.core.warmup import warm_up
 from app.load_env import load_environment
 
 # Load environment variables
@@ -21,8 +26,27 @@ def custom_generate_unique_id(route: APIRoute) -> str:
 if settings.SENTRY_DSN and settings.ENVIRONMENT != "local":
     sentry_sdk.init(dsn=str(settings.SENTRY_DSN), enable_tracing=True)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Runs in each worker before it accepts connections, so with several
+    # workers no request reaches one that is still loading models.
+    warm_up()
+    pruning = (
+        asyncio.create_task(prune_periodically())
+        if settings.LLM_RESPONSE_CACHE_DIR
+        else None
+    )
+    yield
+    if pruning is not None:
+        pruning.cancel()
+        with suppress(asyncio.CancelledError):
+            await pruning
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
+    lifespan=lifespan,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
 )
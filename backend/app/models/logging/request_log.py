@@ -83,3 +83,5 @@ class RequestLog(SQLModel, table=True):
 class RequestLogUpdate(SQLModel):
     response_text: str
     response_id: UUID
+    # Set when the output is only known at the end (streamed output).
+    output_text: Optional[str] = None
@@ -10,6 +10,7 @@ from app.utils import now
 class ValidatorOutcome(str, Enum):
     PASS = "PASS"
     FAIL = "FAIL"
+    TIMEOUT = "TIMEOUT"
 
 
 class ValidatorLog(SQLModel, table=True):
@@ -62,7 +63,7 @@ class ValidatorLog(SQLModel, table=True):
     outcome: ValidatorOutcome = Field(
         nullable=False,
         sa_column_kwargs={
-            "comment": "Validator outcome (whether the validation failed or passed)"
+            "comment": "Validator outcome (whether the validation failed, passed or timed out)"
         },
     )
 
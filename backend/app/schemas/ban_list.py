@@ -1,13 +1,16 @@
 from datetime import datetime
 from uuid import UUID
-from typing import Annotated, Optional
+from typing import Annotated, Literal, Optional
 
 from pydantic import StringConstraints
 from sqlmodel import Field
 from sqlmodel import SQLModel
 
 MAX_BANNED_WORD_LENGTH = 100
+# Words per request body; larger lists are built with the words endpoints
+# or imported from a file, up to MAX_STORED_BANNED_WORDS.
 MAX_BANNED_WORDS_ITEMS = 1000
+MAX_STORED_BANNED_WORDS = 100_000
 MAX_BAN_LIST_NAME_LENGTH = 100
 MAX_BAN_LIST_DESCRIPTION_LENGTH = 500
 
@@ -35,6 +38,7 @@ BannedWord = Annotated[
     ),
 ]
 BannedWords = Annotated[list[BannedWord], Field(max_length=MAX_BANNED_WORDS_ITEMS)]
+BanListWordsFormat = Literal["csv", "ndjson"]
 
 
 class BanListBase(SQLModel):
@@ -61,3 +65,15 @@ class BanListResponse(BanListBase):
     id: UUID
     created_at: datetime
     updated_at: datetime
+
+
+class BanListWordsUpdate(SQLModel):
+    words: Annotated[BannedWords, Field(min_length=1)]
+
+
+class BanListWordsResponse(SQLModel):
+    id: UUID
+    updated_at: datetime
+    word_count: int
+    added: list[str] = []
+    removed: list[str] = []
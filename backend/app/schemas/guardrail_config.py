@@ -1,4 +1,4 @@
-from typing import Annotated, List, Optional, Union
+from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 from uuid import UUID
 
 from pydantic import ConfigDict, model_validator
@@ -60,6 +60,51 @@ ValidatorConfigItem = Annotated[
 ]
 
 
+def normalize_validator_payload(data):
+    """
+    Accept validator payloads coming from validator-config endpoints and
+    map them into runtime validator-config shape expected by Guardrails.
+    """
+    if not isinstance(data, dict):
+        return data
+
+    validators = data.get("validators")
+    if not isinstance(validators, list):
+        return data
+
+    normalized_payload = dict(data)
+    normalized_validators = []
+
+    # Strip persistence/system fields before handing a stored validator
+    # config to Guardrails. Reuse the shared system-field set, but keep
+    # `type` (the discriminator) and `on_fail_action` (remapped below),
+    # and add the DB-only columns.
+    drop_fields = (VALIDATOR_CONFIG_SYSTEM_FIELDS - {"type", "on_fail_action"}) | {
+        "id",
+        "created_at",
+        "updated_at",
+    }
+
+    for validator in validators:
+        if not isinstance(validator, dict):
+            normalized_validators.append(validator)
+            continue
+
+        normalized_validator = {
+            key: value
+            for key, value in validator.items()
+            if key not in drop_fields and key != "on_fail_action"
+        }
+
+        if "on_fail" not in normalized_validator and "on_fail_action" in validator:
+            normalized_validator["on_fail"] = validator["on_fail_action"]
+
+        normalized_validators.append(normalized_validator)
+
+    normalized_payload["validators"] = normalized_validators
+    return normalized_payload
+
+
 class GuardrailRequest(SQLModel):
     model_config = ConfigDict(extra="forbid")
     request_id: str
@@ -68,55 +113,90 @@ class GuardrailRequest(SQLModel):
     input: str
     output: Optional[str] = None
     validators: List[ValidatorConfigItem]
+    # Run validators cheapest first and stop at the first terminal failure.
+    fail_fast: bool = False
+    # Time budget for running the validators; those still running when it is
+    # spent are abandoned and handled per their timeout policy.
+    deadline_ms: Optional[int] = Field(default=None, gt=0)
 
     @model_validator(mode="before")
     @classmethod
     def normalize_validators_from_config_api(cls, data):
-        """
-        Accept validator payloads coming from validator-config endpoints and
-        map them into runtime validator-config shape expected by Guardrails.
-        """
-        if not isinstance(data, dict):
-            return data
-
-        validators = data.get("validators")
-        if not isinstance(validators, list):
-            return data
-
-        normalized_payload = dict(data)
-        normalized_validators = []
-
-        # Strip persistence/system fields before handing a stored validator
-        # config to Guardrails. Reuse the shared system-field set, but keep
-        # `type` (the discriminator) and `on_fail_action` (remapped below),
-        # and add the DB-only columns.
-        drop_fields = (VALIDATOR_CONFIG_SYSTEM_FIELDS - {"type", "on_fail_action"}) | {
-            "id",
-            "created_at",
-            "updated_at",
-        }
+        return normalize_validator_payload(data)
+
+
+class GuardrailResponse(SQLModel):
+    response_id: UUID
+    rephrase_needed: bool = False
+    safe_text: Optional[str] = None
+    # fail_fast only: validator types not run because an earlier one stopped the request.
+    skipped_validators: Optional[List[str]] = None
+    # Validator types abandoned at their timeout or the request deadline.
+    timed_out_validators: Optional[List[str]] = None
 
-        for validator in validators:
-            if not isinstance(validator, dict):
-                normalized_validators.append(validator)
-                continue
 
-            normalized_validator = {
-                key: value
-                for key, value in validator.items()
-                if key not in drop_fields and key != "on_fail_action"
-            }
+MAX_BATCH_ITEMS = 5000
 
-            if "on_fail" not in normalized_validator and "on_fail_action" in validator:
-                normalized_validator["on_fail"] = validator["on_fail_action"]
 
-            normalized_validators.append(normalized_validator)
+class GuardrailBatchItem(SQLModel):
+    model_config = ConfigDict(extra="forbid")
+    request_id: str
+    input: str
+    output: Optional[str] = None
 
-        normalized_payload["validators"] = normalized_validators
-        return normalized_payload
 
+class GuardrailBatchRequest(SQLModel):
+    model_config = ConfigDict(extra="forbid")
+    organization_id: int
+    project_id: int
+    validators: List[ValidatorConfigItem]
+    items: List[GuardrailBatchItem] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
 
-class GuardrailResponse(SQLModel):
-    response_id: UUID
-    rephrase_needed: bool = False
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_validators_from_config_api(cls, data):
+        return normalize_validator_payload(data)
+
+
+class GuardrailBatchItemResponse(SQLModel):
+    request_id: str
+    success: bool
+    data: Optional[GuardrailResponse] = None
+    error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+
+
+class GuardrailStreamRequest(SQLModel):
+    """First NDJSON line of POST /guardrails/stream; the output text follows as deltas."""
+
+    model_config = ConfigDict(extra="forbid")
+    request_id: str
+    organization_id: int
+    project_id: int
+    input: str = ""
+    validators: List[ValidatorConfigItem]
+
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_validators_from_config_api(cls, data):
+        return normalize_validator_payload(data)
+
+
+class GuardrailStreamDelta(SQLModel):
+    model_config = ConfigDict(extra="forbid")
+    delta: str
+
+
+class GuardrailStreamEvent(SQLModel):
+    """
+    One NDJSON line of the stream response: a "chunk" of validated output, or
+    the closing "done" event with the outcome of the whole stream.
+    """
+
+    type: Literal["chunk", "done"]
+    index: Optional[int] = None
     safe_text: Optional[str] = None
+    success: Optional[bool] = None
+    response_id: Optional[UUID] = None
+    error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
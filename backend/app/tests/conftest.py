@@ -2,6 +2,8 @@
 import os
 
 os.environ["ENVIRONMENT"] = "testing"
+# Test clients start the app; they should not load the spaCy model each time.
+os.environ.setdefault("PII_WARMUP_ON_STARTUP", "false")
 
 import pytest
 from fastapi import Header
@@ -17,6 +19,8 @@ from app.api.deps import (
 )
 from app.core.config import settings
 from app.core.enum import GuardrailOnFail, Stage, ValidatorType
+from app.core.llm_response_cache import llm_response_cache
+from app.core.result_cache import result_cache
 from app.models.config.ban_list import BanList
 from app.models.config.validator_config import ValidatorConfig
 from app.tests.seed_data import (
@@ -82,6 +86,22 @@ def clean_db():
         session.commit()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def clear_result_cache():
+    # Tests reuse request texts; a cached outcome would skip the mocked executor.
+    result_cache.clear()
+    yield
+    result_cache.clear()
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_llm_response_cache():
+    # Tests reuse queries with different mocked LLM replies.
+    llm_response_cache.clear()
+    yield
+    llm_response_cache.clear()
+
+
 @pytest.fixture(scope="function", autouse=True)
 def override_dependencies():
     app.dependency_overrides[verify_bearer_token] = lambda: True
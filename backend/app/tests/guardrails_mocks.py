@@ -1,3 +1,5 @@
 class MockResult:
-    def __init__(self, validated_output=None):
+    def __init__(self, validated_output=None, validator_logs=None, error=None):
         self.validated_output = validated_output
+        self.validator_logs = validator_logs or []
+        self.error = error
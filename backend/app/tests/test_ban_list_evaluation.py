@@ -0,0 +1,20 @@
+import random
+
+from app.evaluation.ban_list.run import misspell, with_typos
+
+
+def test_misspell_leaves_words_under_three_letters_alone():
+    rng = random.Random(0)
+
+    assert misspell("ok", rng) == "ok"
+    assert misspell("न", rng) == "न"
+    assert misspell("pill", rng) != "pill"
+
+
+def test_with_typos_skips_texts_with_only_short_mentions():
+    texts = ["It is ok.", "Is a sonography ok?"]
+
+    misspelled = with_typos(texts, ["ok", "sonography"])
+
+    assert len(misspelled) == 1
+    assert "sonography" not in misspelled[0]
@@ -0,0 +1,27 @@
+import pytest
+
+from app.core.ban_list_words import format_words, parse_word
+
+
+@pytest.mark.parametrize("format", ["csv", "ndjson"])
+def test_export_reads_back(format):
+    words = ["sonography", "gender, check", 'say "no"', "दवा"]
+
+    lines = "".join(format_words(words, format)).splitlines()
+    parsed = [parse_word(line, format, first=i == 0) for i, line in enumerate(lines)]
+
+    assert [word for word in parsed if word is not None] == words
+
+
+def test_csv_takes_first_column_and_strips():
+    assert parse_word("\ufeffword", "csv", first=True) is None
+    assert parse_word("  sonography , ignored", "csv") == "sonography"
+
+
+@pytest.mark.parametrize(
+    "line,format",
+    [('""', "csv"), ("a" * 101, "csv"), ('"bad"', "ndjson"), ("{", "ndjson")],
+)
+def test_invalid_lines_raise(line, format):
+    with pytest.raises(ValueError):
+        parse_word(line, format)
@@ -6,13 +6,16 @@ from sqlmodel import Session
 
 from app.api.deps import TenantContext
 from app.api.routes.ban_lists import (
+    add_ban_list_words,
     create_ban_list,
+    export_ban_list_words,
     list_ban_lists,
     get_ban_list,
+    remove_ban_list_words,
     update_ban_list,
     delete_ban_list,
 )
-from app.schemas.ban_list import BanListUpdate
+from app.schemas.ban_list import BanListUpdate, BanListWordsUpdate
 from app.tests.seed_data import (
     BAN_LIST_TEST_ID,
     BAN_LIST_TEST_ORGANIZATION_ID,
@@ -130,3 +133,40 @@ def test_delete_success(mock_session, sample_ban_list, auth_context):
         )
         crud.delete.assert_called_once_with(mock_session, sample_ban_list)
         assert result.success is True
+
+
+@pytest.mark.parametrize(
+    "route,delta",
+    [(add_ban_list_words, "add"), (remove_ban_list_words, "remove")],
+)
+def test_word_changes_apply_delta(mock_session, auth_context, route, delta):
+    with patch("app.api.routes.ban_lists.ban_list_crud") as crud:
+        result = route(
+            id=BAN_LIST_TEST_ID,
+            payload=BanListWordsUpdate(words=[" bad ", "worse"]),
+            session=mock_session,
+            auth=auth_context,
+        )
+
+        crud.update_words.assert_called_once_with(
+            mock_session,
+            id=BAN_LIST_TEST_ID,
+            organization_id=BAN_LIST_TEST_ORGANIZATION_ID,
+            project_id=BAN_LIST_TEST_PROJECT_ID,
+            **{delta: ["bad", "worse"]},
+        )
+        assert result.data == crud.update_words.return_value
+
+
+def test_export_streams_words(mock_session, sample_ban_list, auth_context):
+    with patch("app.api.routes.ban_lists.ban_list_crud") as crud:
+        crud.get.return_value = sample_ban_list
+
+        response = export_ban_list_words(
+            id=BAN_LIST_TEST_ID,
+            session=mock_session,
+            auth=auth_context,
+            format="ndjson",
+        )
+
+        assert response.media_type == "application/x-ndjson"
@@ -1,3 +1,4 @@
+import json
 import uuid
 import pytest
 from app.schemas.ban_list import (
@@ -41,6 +42,26 @@ class BaseBanListTest:
     def delete(self, client, id, api_key=DEFAULT_API_KEY):
         return client.delete(f"{BASE_URL}{id}/", headers=self._headers(api_key))
 
+    def change_words(self, client, id, action, words, api_key=DEFAULT_API_KEY):
+        return client.post(
+            f"{BASE_URL}{id}/words/{action}",
+            json={"words": words},
+            headers=self._headers(api_key),
+        )
+
+    def import_words(self, client, id, body, api_key=DEFAULT_API_KEY, **params):
+        return client.put(
+            f"{BASE_URL}{id}/words",
+            content=body,
+            params=params,
+            headers=self._headers(api_key),
+        )
+
+    def export_words(self, client, id, api_key=DEFAULT_API_KEY, **params):
+        return client.get(
+            f"{BASE_URL}{id}/words", params=params, headers=self._headers(api_key)
+        )
+
 
 class TestCreateBanList(BaseBanListTest):
     def test_create_success(self, integration_client, clear_database):
@@ -295,3 +316,90 @@ class TestDeleteBanList(BaseBanListTest):
         assert response.status_code == 403
         assert body["success"] is False
         assert "permission" in body["error"].lower()
+
+
+class TestBanListWords(BaseBanListTest):
+    def test_add_and_remove_words(self, integration_client, clear_database):
+        ban_id = self.create(integration_client, "minimal").json()["data"]["id"]
+
+        added = self.change_words(integration_client, ban_id, "add", ["bad", "worse"])
+        removed = self.change_words(
+            integration_client, ban_id, "remove", ["bad", "missing"]
+        )
+
+        assert added.json()["data"]["added"] == ["worse"]
+        assert added.json()["data"]["word_count"] == 2
+        assert removed.json()["data"]["removed"] == ["bad"]
+        data = self.get(integration_client, ban_id).json()["data"]
+        assert data["banned_words"] == ["worse"]
+        assert data["updated_at"] == removed.json()["data"]["updated_at"]
+
+    def test_change_words_wrong_owner(self, integration_client, clear_database):
+        ban_id = self.create(integration_client, "public").json()["data"]["id"]
+
+        response = self.change_words(
+            integration_client, ban_id, "add", ["x"], api_key=ALT_API_KEY_999
+        )
+
+        assert response.status_code == 403
+
+    def test_import_and_export_large_list(self, integration_client, clear_database):
+        ban_id = self.create(integration_client, "minimal").json()["data"]["id"]
+        words = [f"term{i}" for i in range(MAX_BANNED_WORDS_ITEMS * 3)]
+        body = "word\n" + "\n".join(words + words[:10]) + "\n"
+
+        response = self.import_words(integration_client, ban_id, body)
+        exported = self.export_words(integration_client, ban_id, format="ndjson")
+
+        assert response.status_code == 200
+        assert response.json()["data"]["word_count"] == len(words)
+        assert exported.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line)["word"] for line in exported.text.splitlines()] == (
+            words
+        )
+
+    def test_import_append(self, integration_client, clear_database):
+        ban_id = self.create(integration_client, "minimal").json()["data"]["id"]
+
+        response = self.import_words(
+            integration_client,
+            ban_id,
+            '{"word": "bad"}\n{"word": "worse"}\n',
+            format="ndjson",
+            mode="append",
+        )
+
+        assert response.json()["data"]["added"] == ["worse"]
+        exported = self.export_words(integration_client, ban_id)
+        assert exported.text == "word\nbad\nworse\n"
+
+    def test_import_wrong_owner_is_refused_before_the_body_is_parsed(
+        self, integration_client, clear_database
+    ):
+        ban_id = self.create(integration_client, "public").json()["data"]["id"]
+
+        response = self.import_words(
+            integration_client,
+            ban_id,
+            "word\n" + "a" * 101 + "\n",
+            api_key=ALT_API_KEY_999,
+        )
+
+        assert response.status_code == 403
+
+    def test_import_unknown_ban_list(self, integration_client, clear_database):
+        response = self.import_words(integration_client, uuid.uuid4(), "word\nok\n")
+
+        assert response.status_code == 404
+
+    def test_import_invalid_line(self, integration_client, clear_database):
+        ban_id = self.create(integration_client, "minimal").json()["data"]["id"]
+
+        response = self.import_words(
+            integration_client, ban_id, "word\nok\n" + "a" * 101 + "\n"
+        )
+
+        assert response.status_code == 400
+        assert "Line 3" in response.json()["error"]
+        data = self.get(integration_client, ban_id).json()["data"]
+        assert data["banned_words"] == ["bad"]
@@ -1,7 +1,28 @@
 import pytest
 from unittest.mock import Mock, patch
-
-from app.core.guardrail_controller import build_guard
+from uuid import uuid4
+
+from guardrails import OnFailAction
+
+from app.core.cache import invalidate_config
+from app.core.config import settings
+from app.core.enum import GuardrailOnFail
+from app.core.guardrail_controller import (
+    _guard_cache,
+    build_executor,
+    build_guard,
+    build_validators,
+    is_barrier,
+)
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
+from app.core.validators.config.pii_remover_safety_validator_config import (
+    PIIRemoverSafetyValidatorConfig,
+)
+from app.core.validators.config.topic_relevance_llm_safety_validator_config import (
+    TopicRelevanceLLMSafetyValidatorConfig,
+)
 
 
 def test_build_guard_with_validators():
@@ -73,3 +94,157 @@ def test_build_guard_use_failure():
     ):
         with pytest.raises(RuntimeError, match="guard failure"):
             build_guard([cfg])
+
+
+class _FakeValidator:
+    def __init__(self):
+        self.on_fail_descriptor = None
+        self.on_fail_method = None
+
+    def _set_on_fail_method(self, on_fail):
+        self.on_fail_method = on_fail
+
+
+@pytest.fixture
+def clear_guard_cache():
+    _guard_cache.clear()
+    yield
+    _guard_cache.clear()
+
+
+def _ban_list_config(**overrides):
+    data = {"type": "ban_list", "banned_words": ["foo"], **overrides}
+    return BanListSafetyValidatorConfig(**data)
+
+
+def test_build_validators_reuses_cached_validators(clear_guard_cache):
+    hits = _guard_cache.stats()["hits"]
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ) as build:
+        first = build_validators([_ban_list_config()])
+        second = build_validators([_ban_list_config()])
+
+    build.assert_called_once()
+    assert first[0] is not second[0]
+    assert _guard_cache.stats()["hits"] == hits + 1
+
+
+def test_build_validators_binds_on_fail_to_current_config(clear_guard_cache):
+    first_cfg = _ban_list_config()
+    second_cfg = _ban_list_config()
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ):
+        build_validators([first_cfg])
+        (validator,) = build_validators([second_cfg])
+
+    validator.on_fail_method("foo", None)
+
+    assert second_cfg._validator_metadata is not None
+    assert first_cfg._validator_metadata is None
+
+
+def test_build_validators_cache_key_ignores_on_fail(clear_guard_cache):
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ) as build:
+        build_validators([_ban_list_config(on_fail="fix")])
+        (validator,) = build_validators([_ban_list_config(on_fail="exception")])
+
+    build.assert_called_once()
+    assert validator.on_fail_descriptor == OnFailAction.EXCEPTION
+
+
+def test_build_validators_rebuilds_on_config_change(clear_guard_cache):
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ) as build:
+        build_validators([_ban_list_config(banned_words=["foo"])])
+        build_validators([_ban_list_config(banned_words=["bar"])])
+
+    assert build.call_count == 2
+
+
+def test_invalidate_config_drops_entries_built_from_it(clear_guard_cache):
+    ban_list_id = uuid4()
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ) as build:
+        build_validators([_ban_list_config(ban_list_id=ban_list_id)])
+        invalidate_config(ban_list_id)
+        build_validators([_ban_list_config(ban_list_id=ban_list_id)])
+
+    assert build.call_count == 2
+    assert _guard_cache.stats()["invalidations"] == 1
+
+
+def test_build_executor_resolves_timeouts_and_policies(clear_guard_cache):
+    configs = [
+        _ban_list_config(timeout_ms=250),
+        TopicRelevanceLLMSafetyValidatorConfig(
+            type="topic_relevance_llm", configuration="health", on_fail="rephrase"
+        ),
+    ]
+
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ), patch.object(
+        TopicRelevanceLLMSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ), patch.dict(
+        settings.VALIDATOR_TIMEOUT_MS, {"topic_relevance_llm": 3000}
+    ):
+        executor = build_executor(configs, deadline=123.0)
+
+    assert executor.timeouts == [0.25, 3.0]
+    assert executor.fail_open == [False, True]
+    assert executor.barriers == [True, False]
+    assert executor.deadline == 123.0
+
+
+def test_only_fixes_are_barriers_unless_fail_fast():
+    assert is_barrier(GuardrailOnFail.Fix)
+    assert not is_barrier(GuardrailOnFail.Exception)
+    assert not is_barrier(GuardrailOnFail.Rephrase)
+    assert is_barrier(GuardrailOnFail.Exception, fail_fast=True)
+    assert not is_barrier(GuardrailOnFail.Rephrase, fail_fast=True)
+
+
+def test_timeout_policy_can_be_overridden_per_type():
+    config = _ban_list_config()
+
+    with patch.dict(settings.VALIDATOR_TIMEOUT_POLICY, {"ban_list": "fail_open"}):
+        assert config.resolve_timeout_policy().value == "fail_open"
+    assert config.resolve_timeout_policy().value == "fail_closed"
+
+
+def test_build_validators_cache_key_ignores_timeout_ms(clear_guard_cache):
+    with patch.object(
+        BanListSafetyValidatorConfig, "build", side_effect=_FakeValidator
+    ) as build:
+        build_validators([_ban_list_config()])
+        build_validators([_ban_list_config(timeout_ms=100)])
+
+    build.assert_called_once()
+
+
+def test_build_validators_shares_pii_analysis_within_a_request(clear_guard_cache):
+    configs = [
+        PIIRemoverSafetyValidatorConfig(
+            type="pii_remover", entity_types=["PHONE_NUMBER"]
+        ),
+        BanListSafetyValidatorConfig(type="ban_list", banned_words=["foo"]),
+        PIIRemoverSafetyValidatorConfig(
+            type="pii_remover", entity_types=["EMAIL_ADDRESS"], threshold=0.3
+        ),
+    ]
+
+    phone, _, email = build_validators(configs)
+    prototype = build_validators(configs[:1])[0]
+
+    assert phone.analysis_entity_types == ["EMAIL_ADDRESS", "PHONE_NUMBER"]
+    assert email.analysis_entity_types == ["EMAIL_ADDRESS", "PHONE_NUMBER"]
+    assert phone.analysis_threshold == email.analysis_threshold == 0.3
+    assert prototype.analysis_entity_types == ["PHONE_NUMBER"]
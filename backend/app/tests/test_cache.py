@@ -0,0 +1,70 @@
+from unittest.mock import patch
+
+from app.core.cache import LRUCache
+
+
+def test_lru_cache_evicts_least_recently_used_by_count():
+    cache = LRUCache(name="test", max_entries=2, max_bytes=1_000)
+    cache.put("a", 1, size=1)
+    cache.put("b", 2, size=1)
+    cache.get("a")
+    cache.put("c", 3, size=1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_cache_evicts_by_size():
+    cache = LRUCache(name="test", max_entries=10, max_bytes=10)
+    cache.put("a", 1, size=6)
+    cache.put("b", 2, size=6)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats()["size_bytes"] == 6
+
+
+def test_lru_cache_skips_entries_larger_than_budget():
+    cache = LRUCache(name="test", max_entries=10, max_bytes=10)
+    cache.put("a", 1, size=11)
+
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_cache_invalidate_tag():
+    cache = LRUCache(name="test", max_entries=10, max_bytes=1_000)
+    cache.put("a", 1, size=1, tags={"config-1"})
+    cache.put("b", 2, size=1, tags={"config-2"})
+
+    assert cache.invalidate_tag("config-1") == 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_lru_cache_counts_hits_and_misses():
+    cache = LRUCache(name="test", max_entries=10, max_bytes=1_000)
+    cache.put("a", 1, size=1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    cache = LRUCache(name="test", max_entries=10, max_bytes=1_000, ttl_seconds=60)
+    with patch("app.core.cache.time.monotonic", return_value=100.0):
+        cache.put("a", 1, size=1)
+    with patch("app.core.cache.time.monotonic", return_value=159.0):
+        assert cache.get("a") == 1
+    with patch("app.core.cache.time.monotonic", return_value=160.0):
+        assert cache.get("a") is None
+
+    stats = cache.stats()
+    assert stats["expirations"] == 1
+    assert stats["entries"] == 0
@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from app.core.deletion_index import DeletionIndex, allowed_distance, edit_distance
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        ("sonography", "sonography", 0),
+        ("sonography", "sonograpy", 1),
+        ("sonography", "sonogarphy", 1),
+        ("sonography", "sonografee", 3),
+    ],
+)
+def test_edit_distance(a, b, expected):
+    assert edit_distance(a, b, limit=5) == expected
+
+
+def test_edit_distance_stops_past_limit():
+    assert edit_distance("sonography", "ultrasound", limit=2) == 3
+
+
+def test_short_words_are_only_matched_exactly():
+    index = DeletionIndex(["ban", "pill", "tablet"], max_distance=2)
+
+    assert allowed_distance("pill", 2) == 1
+    assert index.lookup("bun") == []
+    assert index.lookup("pils") == ["pill"]
+    assert index.lookup("tabelt") == ["tablet"]
+
+
+def test_lookup_matches_brute_force():
+    rng = random.Random(5)
+    words = [
+        "".join(rng.choice("abcde") for _ in range(rng.randint(3, 10)))
+        for _ in range(300)
+    ]
+    index = DeletionIndex(words, max_distance=2)
+
+    for _ in range(300):
+        query = "".join(rng.choice("abcde") for _ in range(rng.randint(3, 10)))
+        expected = {
+            word
+            for word in words
+            if word != query
+            and len(query) >= 4
+            and edit_distance(query, word, allowed_distance(word, 2))
+            <= allowed_distance(word, 2)
+        }
+        assert set(index.lookup(query)) == expected
+
+
+def test_extended_leaves_original_index_unchanged():
+    index = DeletionIndex(["tablet"], max_distance=1)
+
+    extended = index.extended(["capsule"])
+
+    assert extended.lookup("capsle") == ["capsule"]
+    assert extended.lookup("tablt") == ["tablet"]
+    assert index.lookup("capsle") == []
@@ -1,14 +1,31 @@
+import json
+import socket
+import threading
+import time
 from unittest.mock import patch
+from uuid import UUID, uuid4
+
+import httpx
+import uvicorn
+from sqlmodel import Session, select
 
 from app.core.constants import REPHRASE_ON_FAIL_PREFIX
+from app.core.db import engine
+from app.models.logging.request_log import RequestLog, RequestStatus
 from app.tests.guardrails_mocks import MockResult
 from app.tests.seed_data import (
     VALIDATOR_TEST_ORGANIZATION_ID,
     VALIDATOR_TEST_PROJECT_ID,
 )
-from app.tests.utils.constants import SAFE_TEXT_FIELD, VALIDATE_API_PATH
+from app.tests.utils.constants import (
+    SAFE_TEXT_FIELD,
+    VALIDATE_API_PATH,
+    VALIDATE_BATCH_API_PATH,
+    VALIDATE_STREAM_API_PATH,
+)
 
-build_guard_path = "app.api.routes.guardrails.build_guard"
+build_executor_path = "app.api.routes.guardrails.build_executor"
+build_batch_executor_path = "app.api.routes.guardrails.build_batch_executor"
 crud_path = "app.api.routes.guardrails.RequestLogCrud"
 
 request_id = "123e4567-e89b-12d3-a456-426614174000"
@@ -22,11 +39,13 @@ def test_route_exists(client):
 
 
 def test_validate_guardrails_success(client):
-    class MockGuard:
-        def validate(self, data):
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
             return MockResult(validated_output="clean text")
 
-    with patch(build_guard_path, return_value=MockGuard()):
+    with patch(build_executor_path, return_value=MockExecutor()):
         response = client.post(
             VALIDATE_API_PATH,
             json={
@@ -47,11 +66,13 @@ def test_validate_guardrails_success(client):
 
 
 def test_validate_guardrails_failure(client):
-    class MockGuard:
-        def validate(self, data):
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
             return MockResult(validated_output=None)
 
-    with patch(build_guard_path, return_value=MockGuard()):
+    with patch(build_executor_path, return_value=MockExecutor()):
         response = client.post(
             VALIDATE_API_PATH,
             json={
@@ -76,11 +97,13 @@ def test_rephrase_needed_is_true_when_on_fail_is_rephrase(client):
         f"{REPHRASE_ON_FAIL_PREFIX} Input is outside the allowed topic scope."
     )
 
-    class MockGuard:
-        def validate(self, data):
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
             return MockResult(validated_output=rephrase_output)
 
-    with patch(build_guard_path, return_value=MockGuard()):
+    with patch(build_executor_path, return_value=MockExecutor()):
         response = client.post(
             VALIDATE_API_PATH,
             json={
@@ -101,7 +124,7 @@ def test_rephrase_needed_is_true_when_on_fail_is_rephrase(client):
 
 
 def test_guardrails_internal_error(client):
-    with patch(build_guard_path, side_effect=Exception("Invalid validator config")):
+    with patch(build_executor_path, side_effect=Exception("Invalid validator config")):
         response = client.post(
             VALIDATE_API_PATH,
             json={
@@ -119,3 +142,210 @@ def test_guardrails_internal_error(client):
     assert body["success"] is False
     assert SAFE_TEXT_FIELD not in body["data"]
     assert "Invalid validator config" in body["error"]
+
+
+class MockBatchExecutor:
+    async def async_validate(self, values):
+        return [
+            MockResult(validated_output=None if "bad" in value else value.upper())
+            for value in values
+        ]
+
+
+def _batch_payload(inputs):
+    return {
+        "organization_id": organization_id,
+        "project_id": project_id,
+        "validators": [],
+        "items": [{"request_id": str(uuid4()), "input": text} for text in inputs],
+    }
+
+
+def test_validate_guardrails_batch_returns_item_per_input(client):
+    payload = _batch_payload(["hello", "bad words", "world"])
+
+    with patch(build_batch_executor_path, return_value=MockBatchExecutor()):
+        response = client.post(VALIDATE_BATCH_API_PATH, json=payload)
+
+    assert response.status_code == 200
+
+    body = response.json()
+    assert body["success"] is True
+    items = body["data"]
+    assert [item["request_id"] for item in items] == [
+        item["request_id"] for item in payload["items"]
+    ]
+    assert [item["success"] for item in items] == [True, False, True]
+    assert items[0]["data"][SAFE_TEXT_FIELD] == "HELLO"
+    assert items[1]["error"] == "Validation failed"
+
+
+def test_validate_guardrails_batch_rejects_only_invalid_request_id(client):
+    payload = _batch_payload(["hello", "world"])
+    payload["items"][0]["request_id"] = "not-a-uuid"
+
+    with patch(build_batch_executor_path, return_value=MockBatchExecutor()):
+        response = client.post(VALIDATE_BATCH_API_PATH, json=payload)
+
+    items = response.json()["data"]
+    assert items[0]["success"] is False
+    assert items[0]["error"] == "Invalid request_id"
+    assert items[1]["success"] is True
+
+
+def test_validate_guardrails_batch_streams_ndjson(client):
+    payload = _batch_payload(["hello", "world"])
+
+    with patch(build_batch_executor_path, return_value=MockBatchExecutor()):
+        response = client.post(
+            VALIDATE_BATCH_API_PATH, params={"stream": True}, json=payload
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["data"][SAFE_TEXT_FIELD] for line in lines] == ["HELLO", "WORLD"]
+
+
+class MockStreamExecutor:
+    validator_logs = []
+
+    def __init__(self):
+        self.seen = []
+
+    async def async_validate(self, data):
+        self.seen.append(data)
+        if "forbidden" in data:
+            return MockResult(validated_output=None)
+        return MockResult(validated_output=data.replace("bad", "[REDACTED]"))
+
+
+def _stream_body(deltas, validators=None):
+    header = {
+        "request_id": request_id,
+        "organization_id": organization_id,
+        "project_id": project_id,
+        "input": "tell me a story",
+        "validators": validators if validators is not None else [],
+    }
+    lines = [json.dumps(header), *(json.dumps({"delta": d}) for d in deltas)]
+    return "\n".join(lines) + "\n"
+
+
+def _stream_events(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_validate_guardrails_stream_emits_validated_sentences(client):
+    executor = MockStreamExecutor()
+
+    with patch(build_executor_path, return_value=executor):
+        response = client.post(
+            VALIDATE_STREAM_API_PATH,
+            content=_stream_body(["Once a bad wol", "f came. It ", "left"]),
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = _stream_events(response)
+    assert [e["safe_text"] for e in events if e["type"] == "chunk"] == [
+        "Once a [REDACTED] wolf came. ",
+        "It left",
+    ]
+    assert executor.seen == ["Once a bad wolf came.", "It left"]
+    done = events[-1]
+    assert done["type"] == "done"
+    assert done["success"] is True
+    assert done[SAFE_TEXT_FIELD] == "Once a [REDACTED] wolf came. It left"
+
+
+def test_validate_guardrails_stream_stops_at_unfixable_sentence(client):
+    executor = MockStreamExecutor()
+
+    with patch(build_executor_path, return_value=executor):
+        response = client.post(
+            VALIDATE_STREAM_API_PATH,
+            content=_stream_body(["Fine start. ", "Something forbidden. ", "More."]),
+        )
+
+    events = _stream_events(response)
+    assert [e["type"] for e in events] == ["chunk", "done"]
+    assert events[-1]["success"] is False
+    assert events[-1]["error"] == "Validation failed"
+    assert executor.seen == ["Fine start.", "Something forbidden."]
+
+
+def test_validate_guardrails_stream_rejects_validators_needing_full_text(client):
+    response = client.post(
+        VALIDATE_STREAM_API_PATH,
+        content=_stream_body(
+            ["hello"],
+            validators=[{"type": "topic_relevance_llm", "configuration": "x"}],
+        ),
+    )
+
+    assert response.status_code == 400
+    assert response.json()["success"] is False
+
+
+def test_validate_guardrails_stream_finalizes_one_request_log(client):
+    with patch(build_executor_path, return_value=MockStreamExecutor()):
+        client.post(
+            VALIDATE_STREAM_API_PATH,
+            content=_stream_body(["A bad ", "day. ", "Bye"]),
+        )
+
+    with Session(engine) as session:
+        logs = session.exec(
+            select(RequestLog).where(RequestLog.request_id == UUID(request_id))
+        ).all()
+
+    assert len(logs) == 1
+    assert logs[0].status == RequestStatus.SUCCESS
+    assert logs[0].request_text == "tell me a story"
+    assert logs[0].output_text == "A bad day. Bye"
+    assert logs[0].response_text == "A [REDACTED] day. Bye"
+
+
+def test_validate_guardrails_stream_reads_a_chunked_body_through_uvicorn(client):
+    # Under a real server, the body arrives in several receive() messages while
+    # the response is already streaming; none of the deltas may be lost.
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    host, port = sock.getsockname()
+    server = uvicorn.Server(
+        uvicorn.Config(client.app, lifespan="off", log_level="warning")
+    )
+
+    def body():
+        for line in _stream_body(
+            ["Once a bad wol", "f came. It ", "left"]
+        ).splitlines():
+            yield (line + "\n").encode()
+            time.sleep(0.05)
+
+    executor = MockStreamExecutor()
+    with patch(build_executor_path, return_value=executor):
+        thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]})
+        thread.start()
+        try:
+            while not server.started:
+                time.sleep(0.01)
+            response = httpx.post(
+                f"http://{host}:{port}{VALIDATE_STREAM_API_PATH}",
+                content=body(),
+                timeout=5,
+            )
+        finally:
+            server.should_exit = True
+            thread.join()
+
+    events = _stream_events(response)
+    assert [e["safe_text"] for e in events if e["type"] == "chunk"] == [
+        "Once a [REDACTED] wolf came. ",
+        "It left",
+    ]
+    assert events[-1]["success"] is True
+    assert executor.seen == ["Once a bad wolf came.", "It left"]
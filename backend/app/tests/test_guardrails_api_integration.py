@@ -1,6 +1,7 @@
 import pytest
 
 from app.tests.seed_data import (
+    BAN_LIST_PAYLOADS,
     VALIDATOR_INTEGRATION_ORGANIZATION_ID,
     VALIDATOR_INTEGRATION_PROJECT_ID,
 )
@@ -12,6 +13,8 @@ request_id = "123e4567-e89b-12d3-a456-426614174000"
 organization_id = VALIDATOR_INTEGRATION_ORGANIZATION_ID
 project_id = VALIDATOR_INTEGRATION_PROJECT_ID
 
+BAN_LISTS_PATH = "/api/v1/guardrails/ban_lists/"
+
 
 def test_input_guardrails_with_real_ban_list(integration_client):
     response = integration_client.post(
@@ -37,6 +40,41 @@ def test_input_guardrails_with_real_ban_list(integration_client):
     assert body["data"][SAFE_TEXT_FIELD] == "this contains b"
 
 
+def test_input_guardrails_with_stored_public_ban_list_picks_up_updates(
+    integration_client,
+):
+    create_response = integration_client.post(
+        BAN_LISTS_PATH, json=BAN_LIST_PAYLOADS["public"]
+    )
+    ban_list_id = create_response.json()["data"]["id"]
+
+    def run(org_id, text):
+        response = integration_client.post(
+            VALIDATE_API_PATH,
+            json={
+                "request_id": request_id,
+                "organization_id": org_id,
+                "project_id": org_id,
+                "input": text,
+                "validators": [{"type": "ban_list", "ban_list_id": ban_list_id}],
+            },
+        )
+        assert response.status_code == 200
+        return response.json()["data"][SAFE_TEXT_FIELD]
+
+    assert "shared" not in run(1, "shared text")
+    # Another tenant reads the same public list.
+    assert "shared" not in run(999, "shared text")
+    assert "newword" in run(999, "newword text")
+
+    integration_client.patch(
+        f"{BAN_LISTS_PATH}{ban_list_id}/",
+        json={"banned_words": ["shared", "newword"]},
+    )
+
+    assert "newword" not in run(999, "newword text")
+
+
 def test_input_guardrails_passes_clean_text(integration_client):
     response = integration_client.post(
         VALIDATE_API_PATH,
@@ -0,0 +1,96 @@
+import json
+import os
+import time
+
+import pytest
+
+from app.core import llm_response_cache as module
+from app.core.llm_response_cache import LLMResponseCache, llm_response_key
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(module.settings, "LLM_RESPONSE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def new_cache() -> LLMResponseCache:
+    return LLMResponseCache(name="test", max_entries=10, max_bytes=10**6)
+
+
+def test_key_covers_model_prompt_version_and_normalized_text():
+    key = llm_response_key("gpt-4o-mini", "Only cooking.", 1, "How do I make  Pasta?")
+
+    assert key == llm_response_key(
+        "gpt-4o-mini", "Only cooking.", 1, "how do i make pasta?"
+    )
+    assert key != llm_response_key("gpt-4o", "Only cooking.", 1, "how do i make pasta?")
+    assert key != llm_response_key(
+        "gpt-4o-mini", "Only baking.", 1, "how do i make pasta?"
+    )
+    assert key != llm_response_key(
+        "gpt-4o-mini", "Only cooking.", 2, "how do i make pasta?"
+    )
+
+
+def test_memory_hits_report_saved_latency():
+    cache = new_cache()
+
+    assert cache.lookup("k") is None
+    cache.store("k", '{"scope_violation": 3}', latency_seconds=0.8)
+
+    assert cache.lookup("k") == '{"scope_violation": 3}'
+    stats = cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["saved_ms_total"] == 800.0
+    assert stats["overall_hit_ratio"] == 0.5
+
+
+def test_directory_tier_is_shared_across_processes(cache_dir):
+    new_cache().store("k", {"passed": True, "score": 3}, latency_seconds=0.5)
+
+    other_worker = new_cache()
+    assert other_worker.lookup("k") == {"passed": True, "score": 3}
+    assert other_worker.lookup("k") == {"passed": True, "score": 3}
+    stats = other_worker.stats()
+    assert (stats["persistent_hits"], stats["hits"]) == (1, 1)
+    assert stats["overall_hit_ratio"] == 1.0
+    assert stats["saved_ms_total"] == 1000.0
+    assert [path.name for path in cache_dir.iterdir()] == ["k.json"]
+
+
+def test_expired_entries_are_not_used(cache_dir, monkeypatch):
+    monkeypatch.setattr(module.settings, "LLM_RESPONSE_CACHE_TTL_SECONDS", 60)
+    (cache_dir / "k.json").write_text(
+        json.dumps(
+            {"stored_at": time.time() - 61, "latency_ms": 500.0, "response": "x"}
+        )
+    )
+    (cache_dir / "broken.json").write_text("{")
+
+    cache = new_cache()
+    assert cache.lookup("k") is None
+    assert cache.lookup("broken") is None
+    assert not (cache_dir / "k.json").exists()
+    assert cache.stats()["persistent_misses"] == 2
+
+
+async def test_async_lookup_reads_the_directory_tier(cache_dir):
+    await new_cache().async_store("k", "reply", latency_seconds=0.2)
+
+    other_worker = new_cache()
+    assert await other_worker.async_lookup("k") == "reply"
+    assert await other_worker.async_lookup("missing") is None
+    stats = other_worker.stats()
+    assert (stats["persistent_hits"], stats["persistent_misses"]) == (1, 1)
+
+
+def test_prune_expired_removes_only_old_entries(cache_dir, monkeypatch):
+    monkeypatch.setattr(module.settings, "LLM_RESPONSE_CACHE_TTL_SECONDS", 60)
+    new_cache().store("fresh", "x", latency_seconds=0.1)
+    new_cache().store("old", "x", latency_seconds=0.1)
+    old = time.time() - 61
+    os.utime(cache_dir / "old.json", (old, old))
+
+    assert module.prune_expired(cache_dir) == 1
+    assert [path.name for path in cache_dir.iterdir()] == ["fresh.json"]
@@ -0,0 +1,99 @@
+import random
+import re
+
+import pytest
+
+from app.core.phrase_matcher import PhraseMatcher, TokenTrie
+from app.core.validators.lexical_slur import LexicalSlur
+
+
+def _regex_redact(phrases, text, replacement="[REDACTED_SLUR]"):
+    """The per-pattern loop LexicalSlur used before PhraseMatcher."""
+    patterns = sorted(
+        (
+            (phrase, re.compile(rf"(?<!\w){re.escape(phrase)}(?!\w)", re.IGNORECASE))
+            for phrase in phrases
+        ),
+        key=lambda x: len(x[0]),
+        reverse=True,
+    )
+    found = [phrase for phrase, pattern in patterns if pattern.search(text)]
+    redacted = text
+    for phrase, pattern in patterns:
+        if phrase in found:
+            redacted = pattern.sub(replacement, redacted)
+    return found, redacted
+
+
+TRICKY_PHRASES = [
+    "ab",
+    "ab cd",
+    "b cd ef",
+    "cd ef",
+    "#tag",
+    "tag",
+    "ab",
+    "साला",
+    "साली",
+    "मुँह मैं ले",
+    "bitch",
+    "σας",
+]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "nothing to see",
+        "ab cd ef",
+        "x ab cd ef y ab",
+        "abab ab-ab _ab ab_",
+        "#tag tag#tag #tagx",
+        "xab cd ef",
+        "वो साला और साली, मुँह मैं ले",
+        "साला।साली",
+        "bıtch and bitch",
+        "σας and σασ",
+    ],
+)
+@pytest.mark.parametrize("matcher_class", [PhraseMatcher, TokenTrie])
+def test_redact_matches_per_pattern_regex(text, matcher_class):
+    matcher = matcher_class(TRICKY_PHRASES)
+
+    assert matcher.redact(text, "[REDACTED_SLUR]") == _regex_redact(
+        TRICKY_PHRASES, text
+    )
+    assert matcher.search(text) == _regex_redact(TRICKY_PHRASES, text)[0]
+
+
+@pytest.mark.parametrize("matcher_class", [PhraseMatcher, TokenTrie])
+def test_redact_matches_per_pattern_regex_on_the_slur_lexicon(matcher_class):
+    phrases = LexicalSlur().slur_list
+    matcher = matcher_class(phrases)
+    rng = random.Random(7)
+    filler = ["the", "a", "-", "#", "और", "है", ",", "!", "x", "।"]
+
+    for _ in range(300):
+        words = rng.choices(phrases, k=3) + rng.choices(filler, k=6)
+        rng.shuffle(words)
+        text = rng.choice([" ", "", "-"]).join(words)
+
+        assert matcher.redact(text, "[REDACTED_SLUR]") == _regex_redact(
+            phrases, text
+        ), text
+
+
+def test_occurrences_include_overlapping_phrases():
+    matcher = PhraseMatcher(["he", "she", "hers"])
+
+    assert matcher.occurrences("ushers") == [(1, 4, 1), (2, 4, 0), (2, 6, 2)]
+
+
+def test_token_trie_only_matches_on_token_edges():
+    matcher = TokenTrie(["he", "she", "hers", "e-pill"])
+
+    assert matcher.occurrences("ushers she e-pill e - pill") == [
+        (7, 10, 1),
+        (11, 17, 3),
+    ]
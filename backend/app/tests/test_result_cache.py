@@ -0,0 +1,98 @@
+from uuid import uuid4
+
+from app.core.cache import invalidate_config
+from app.core.config import settings
+from app.core.enum import ValidatorCostClass
+from app.core.guardrail_controller import get_validator_config_models
+from app.core.result_cache import (
+    GuardrailOutcome,
+    cache_result,
+    result_cache,
+    result_cache_key,
+)
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
+from app.core.validators.config.lexical_slur_safety_validator_config import (
+    LexicalSlurSafetyValidatorConfig,
+)
+from app.core.validators.config.topic_relevance_llm_safety_validator_config import (
+    TopicRelevanceLLMSafetyValidatorConfig,
+)
+from app.models.logging.request_log import RequestStatus
+
+
+def _slur(**kwargs):
+    return LexicalSlurSafetyValidatorConfig(type="uli_slur_match", **kwargs)
+
+
+def test_key_is_stable_for_identical_requests():
+    assert result_cache_key([_slur()], "hello", None) == result_cache_key(
+        [_slur()], "hello", None
+    )
+
+
+def test_key_changes_with_text_config_and_on_fail():
+    base = result_cache_key([_slur()], "hello", None)
+
+    assert result_cache_key([_slur()], "hello!", None) != base
+    assert result_cache_key([_slur()], "hello", "answer") != base
+    assert result_cache_key([_slur(severity="high")], "hello", None) != base
+    assert result_cache_key([_slur(on_fail="exception")], "hello", None) != base
+    assert result_cache_key([_slur()], "hello", None, fail_fast=True) != base
+
+
+def test_key_covers_resolved_ban_list_words():
+    ban_list_id = uuid4()
+
+    def ban_list(words):
+        return BanListSafetyValidatorConfig(
+            type="ban_list", ban_list_id=ban_list_id, banned_words=words
+        )
+
+    assert result_cache_key([ban_list(["foo"])], "hi", None) != result_cache_key(
+        [ban_list(["bar"])], "hi", None
+    )
+
+
+def test_excluded_validator_types_disable_caching(monkeypatch):
+    monkeypatch.setattr(
+        settings, "RESULT_CACHE_EXCLUDED_VALIDATORS", ["uli_slur_match"]
+    )
+
+    assert result_cache_key([_slur()], "hello", None) is None
+
+
+def test_remote_model_validators_are_never_cached():
+    topic = TopicRelevanceLLMSafetyValidatorConfig(
+        type="topic_relevance_llm", configuration="health"
+    )
+
+    assert result_cache_key([_slur(), topic], "hello", None) is None
+
+
+def test_every_remote_model_config_opts_out_of_result_caching():
+    remote = [
+        config
+        for config in get_validator_config_models()
+        if config.cost_class == ValidatorCostClass.RemoteLLM
+    ]
+
+    assert remote
+    assert not [config for config in remote if config.cacheable_result]
+
+
+def test_updating_a_referenced_config_drops_cached_results():
+    result_cache.clear()
+    config_id = uuid4()
+    validators = [
+        BanListSafetyValidatorConfig(
+            type="ban_list", ban_list_id=config_id, banned_words=["foo"]
+        )
+    ]
+    key = result_cache_key(validators, "hi", None)
+    cache_result(key, validators, GuardrailOutcome(status=RequestStatus.SUCCESS))
+
+    assert result_cache.get(key) is not None
+    invalidate_config(config_id)
+    assert result_cache.get(key) is None
@@ -0,0 +1,50 @@
+from app.core.stream_segmenter import StreamSegmenter
+
+
+def _segments(deltas, max_chars=100):
+    segmenter = StreamSegmenter(max_chars=max_chars)
+    segments = []
+    for delta in deltas:
+        segments.extend(segmenter.feed(delta))
+    return segments + segmenter.flush()
+
+
+def test_splits_at_sentence_ends_once_whitespace_arrives():
+    segmenter = StreamSegmenter(max_chars=100)
+
+    assert segmenter.feed("It costs 3.") == []
+    assert segmenter.feed("5 rupees. Th") == ["It costs 3.5 rupees. "]
+    assert segmenter.flush() == ["Th"]
+
+
+def test_splits_on_newlines_and_devanagari_danda():
+    assert _segments(["नमस्ते। आप कैसे", " हैं?\nठीक"]) == [
+        "नमस्ते। ",
+        "आप कैसे हैं?\n",
+        "ठीक",
+    ]
+
+
+def test_keeps_closing_quotes_with_the_sentence():
+    assert _segments(['He said "stop." Then left']) == [
+        'He said "stop." ',
+        "Then left",
+    ]
+
+
+def test_long_sentences_are_cut_at_whitespace_within_the_window():
+    assert _segments(["aaaa bbbb cccc dddd"], max_chars=10) == [
+        "aaaa bbbb ",
+        "cccc dddd",
+    ]
+
+
+def test_window_without_whitespace_is_cut_hard():
+    assert _segments(["x" * 25], max_chars=10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_joining_segments_gives_back_the_input():
+    text = "First line.\nSecond one!  Third? " + "word " * 50
+    deltas = [text[i : i + 7] for i in range(0, len(text), 7)]
+
+    assert "".join(_segments(deltas, max_chars=40)) == text
@@ -0,0 +1,79 @@
+import re
+import unicodedata
+
+import emoji
+import ftfy
+import pytest
+
+from app.core.text_normalizer import (
+    normalization_cache,
+    normalize_for_matching,
+    normalize_with_offsets,
+)
+
+
+def _full_pipeline(text):
+    """Every step on every text, as LexicalSlur normalized before the fast path."""
+    text = emoji.replace_emoji(text, replace="")
+    text = ftfy.fix_text(text)
+    text = unicodedata.normalize("NFKC", text)
+    text = re.sub(r"\s+", " ", text).strip()
+    return text.lower()
+
+
+TEXTS = [
+    "",
+    "   ",
+    "Plain ASCII text, nothing to fix.",
+    "Tabs\tand\r\nline   breaks",
+    "Fish &amp; chips &lt;3",
+    "mujhe SCHOOL admission ki jaankari chahiye",
+    "मुझे  छात्रवृत्ति योजना के बारे में बताएं।",
+    "नुक़्ता वाले अक्षर: क़ ख़ ग़ ज़ ड़ ढ़ फ़",
+    "Mixed हिंदी and English 👍🏽 with emoji",
+    "Ã©cole mojibake and “curly quotes”",
+    "ﬁne ＦＵＬＬＷＩＤＴＨ ΑΣ İstanbul straße",
+    "keycap #️⃣ and \x1b[31mred\x1b[0m",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_normalize_matches_the_full_pipeline(text):
+    normalization_cache.clear()
+
+    assert normalize_for_matching(text) == _full_pipeline(text)
+    # Second call is served from the memo.
+    assert normalize_for_matching(text) == _full_pipeline(text)
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_offsets_cover_the_normalized_text(text):
+    normalized = normalize_with_offsets(text)
+
+    assert normalized.text == _full_pipeline(text)
+    assert len(normalized.starts) == len(normalized.ends) == len(normalized.text)
+    assert all(
+        0 <= start <= end <= len(text)
+        for start, end in zip(normalized.starts, normalized.ends, strict=True)
+    )
+
+
+def test_memo_reuses_results():
+    normalization_cache.clear()
+    hits = normalization_cache.stats()["hits"]
+
+    normalize_for_matching("Repeated text")
+    normalize_for_matching("Repeated text")
+
+    assert normalization_cache.stats()["hits"] == hits + 1
+
+
+def test_replace_applies_to_the_original_text():
+    normalized = normalize_with_offsets("Hello  WORLD 👋, ﬁne   day")
+    start = normalized.text.index("world")
+    fine = normalized.text.index("fine")
+
+    assert (
+        normalized.replace([(start, start + 5), (fine, fine + 4)], "[X]")
+        == "Hello  [X] 👋, [X]   day"
+    )
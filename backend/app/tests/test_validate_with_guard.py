@@ -1,16 +1,29 @@
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
 from guardrails.validators import FailResult as GRFailResult
+from guardrails.validators import PassResult as GRPassResult
+from starlette.requests import ClientDisconnect
 
 from app.api.routes.guardrails import (
     _resolve_validator_configs,
+    _run_stream,
     _validate_with_guard,
 )
+from app.core.ban_list_cache import (
+    apply_ban_list_change,
+    ban_list_cache,
+    compile_ban_list,
+    get_compiled_ban_list,
+)
 from app.core.enum import LLMValidatorName
-from app.schemas.guardrail_config import GuardrailRequest
+from app.core.validator_executor import ValidatorRunLog
+from app.models.logging.request_log import RequestStatus
+from app.models.logging.validator_log import ValidatorOutcome
+from app.schemas.guardrail_config import GuardrailRequest, GuardrailStreamRequest
 from app.tests.guardrails_mocks import MockResult
 from app.tests.seed_data import (
     VALIDATOR_TEST_ORGANIZATION_ID,
@@ -23,6 +36,13 @@ mock_validator_log_crud = MagicMock()
 mock_request_log_id = uuid4()
 
 
+@pytest.fixture(autouse=True)
+def clear_ban_list_cache():
+    ban_list_cache.clear()
+    yield
+    ban_list_cache.clear()
+
+
 def _build_payload(input_text: str) -> GuardrailRequest:
     return GuardrailRequest(
         request_id=str(uuid4()),
@@ -33,17 +53,19 @@ def _build_payload(input_text: str) -> GuardrailRequest:
     )
 
 
-def test_validate_with_guard_success():
-    class MockGuard:
-        def validate(self, data):
+async def test_validate_with_guard_success():
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
             return MockResult(validated_output="clean text")
 
     payload = _build_payload("hello")
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=MockGuard(),
+        "app.api.routes.guardrails.build_executor",
+        return_value=MockExecutor(),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=payload,
             data=payload.input,
             request_log_crud=mock_request_log_crud,
@@ -57,17 +79,19 @@ def test_validate_with_guard_success():
     assert response.data.response_id is not None
 
 
-def test_validate_with_guard_validation_error():
-    class MockGuard:
-        def validate(self, data):
+async def test_validate_with_guard_validation_error():
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
             return MockResult(validated_output=None)
 
     payload = _build_payload("bad text")
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=MockGuard(),
+        "app.api.routes.guardrails.build_executor",
+        return_value=MockExecutor(),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=payload,
             data=payload.input,
             request_log_crud=mock_request_log_crud,
@@ -81,13 +105,13 @@ def test_validate_with_guard_validation_error():
     assert response.error
 
 
-def test_validate_with_guard_exception():
+async def test_validate_with_guard_exception():
     payload = _build_payload("text")
     with patch(
-        "app.api.routes.guardrails.build_guard",
+        "app.api.routes.guardrails.build_executor",
         side_effect=Exception("Invalid config"),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=payload,
             data=payload.input,
             request_log_crud=mock_request_log_crud,
@@ -101,36 +125,26 @@ def test_validate_with_guard_exception():
     assert response.error == "Invalid config"
 
 
-def test_validate_with_guard_uses_fail_result_error_message():
-    """Case 2: when guard returns no validated_output, the error message should
-    be extracted from the first FailResult in the last iteration's validator logs."""
-    mock_log = MagicMock()
-    mock_log.validator_name = "some_validator"
-    mock_log.validation_result = GRFailResult(error_message="specific validator error")
-
-    mock_outputs = MagicMock()
-    mock_outputs.validator_logs = [mock_log]
-
-    mock_iteration = MagicMock()
-    mock_iteration.outputs = mock_outputs
-
-    mock_last = MagicMock()
-    mock_last.iterations = [mock_iteration]
-
-    mock_history = MagicMock()
-    mock_history.last = mock_last
+async def test_validate_with_guard_uses_fail_result_error_message():
+    """Case 2: when the executor returns no validated_output, the error message should
+    be extracted from the first FailResult in the validator logs."""
+    fail_log = ValidatorRunLog(
+        validator_name="some_validator",
+        value_before_validation="bad text",
+        validation_result=GRFailResult(error_message="specific validator error"),
+    )
 
-    class MockGuard:
-        history = mock_history
+    class MockExecutor:
+        validator_logs = [fail_log]
 
-        def validate(self, data):
-            return MockResult(validated_output=None)
+        async def async_validate(self, data):
+            return MockResult(validated_output=None, validator_logs=[fail_log])
 
     payload = _build_payload("bad text")
     with patch(
-        "app.api.routes.guardrails.build_guard", return_value=MockGuard()
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
     ), patch("app.api.routes.guardrails.add_validator_logs"):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=payload,
             data=payload.input,
             request_log_crud=mock_request_log_crud,
@@ -142,24 +156,22 @@ def test_validate_with_guard_uses_fail_result_error_message():
     assert response.error == "specific validator error"
 
 
-def test_validate_with_guard_handles_empty_iterations():
-    """Case 2: when guard history exists but iterations is empty, falls back
-    to the default 'Validation failed' message without raising."""
+async def test_validate_with_guard_handles_empty_validator_logs():
+    """Case 2: when no validator logged a failure, falls back to the default
+    'Validation failed' message without raising."""
 
-    class MockGuard:
-        class history:
-            class last:
-                iterations = []
+    class MockExecutor:
+        validator_logs = []
 
-        def validate(self, data):
+        async def async_validate(self, data):
             return MockResult(validated_output=None)
 
     payload = _build_payload("bad text")
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=MockGuard(),
+        "app.api.routes.guardrails.build_executor",
+        return_value=MockExecutor(),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=payload,
             data=payload.input,
             request_log_crud=mock_request_log_crud,
@@ -171,6 +183,261 @@ def test_validate_with_guard_handles_empty_iterations():
     assert response.error == "Validation failed"
 
 
+async def test_validate_with_guard_writes_validator_logs_in_one_batch():
+    pass_log = ValidatorRunLog(
+        validator_name="PassingValidator",
+        value_before_validation="text",
+        value_after_validation="text",
+        validation_result=GRPassResult(),
+    )
+    fail_log = ValidatorRunLog(
+        validator_name="FailingValidator",
+        value_before_validation="text",
+        value_after_validation="",
+        validation_result=GRFailResult(error_message="failed"),
+    )
+
+    class MockExecutor:
+        validator_logs = [pass_log, fail_log]
+
+        async def async_validate(self, data):
+            return MockResult(validated_output="", validator_logs=self.validator_logs)
+
+    validator_log_crud = MagicMock()
+    payload = _build_payload("text")
+    with patch(
+        "app.api.routes.guardrails.build_executor",
+        return_value=MockExecutor(),
+    ):
+        await _validate_with_guard(
+            payload=payload,
+            data=payload.input,
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=validator_log_crud,
+            suppress_pass_logs=True,
+        )
+
+    validator_log_crud.create_many.assert_called_once()
+    (rows,) = validator_log_crud.create_many.call_args.args
+    assert [row.name for row in rows] == ["FailingValidator"]
+    assert rows[0].error == "failed"
+
+
+async def test_validate_with_guard_fail_fast_plans_and_reports_skipped_validators():
+    fail_log = ValidatorRunLog(
+        validator_name="LexicalSlur",
+        value_before_validation="bad text",
+        validation_result=GRFailResult(error_message="slur found"),
+    )
+
+    class MockExecutor:
+        validator_logs = [fail_log]
+
+        async def async_validate(self, data):
+            return MockResult(validated_output=None, validator_logs=[fail_log])
+
+    payload = GuardrailRequest(
+        request_id=str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        input="bad text",
+        fail_fast=True,
+        validators=[
+            {
+                "type": "topic_relevance_llm",
+                "configuration": "health",
+                "on_fail": "exception",
+            },
+            {"type": "uli_slur_match", "on_fail": "exception"},
+        ],
+    )
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
+    ) as build_executor, patch("app.api.routes.guardrails.add_validator_logs"):
+        response = await _validate_with_guard(
+            payload=payload,
+            data=payload.input,
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=mock_validator_log_crud,
+        )
+
+    planned, fail_fast = build_executor.call_args.args
+    assert [v.type for v in planned] == ["uli_slur_match", "topic_relevance_llm"]
+    assert fail_fast is True
+    assert response.success is False
+    assert response.data.skipped_validators == ["topic_relevance_llm"]
+
+
+async def test_validate_with_guard_reuses_cached_outcome_for_repeated_request():
+    class MockExecutor:
+        validator_logs = []
+
+        async def async_validate(self, data):
+            return MockResult(validated_output="clean text")
+
+    request_log_crud = MagicMock()
+    payload = _build_payload("hello")
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
+    ) as build_executor:
+        for _ in range(2):
+            response = await _validate_with_guard(
+                payload=payload,
+                data=payload.input,
+                request_log_crud=request_log_crud,
+                request_log_id=mock_request_log_id,
+                validator_log_crud=mock_validator_log_crud,
+            )
+
+    assert build_executor.call_count == 1
+    assert request_log_crud.update.call_count == 2
+    assert response.success is True
+    assert response.data.safe_text == "clean text"
+
+
+async def test_validate_with_guard_writes_validator_logs_for_cached_outcome():
+    run_log = ValidatorRunLog(
+        validator_name="LexicalSlur",
+        value_before_validation="hello",
+        value_after_validation="hello",
+        validation_result=GRPassResult(),
+    )
+
+    class MockExecutor:
+        validator_logs = [run_log]
+
+        async def async_validate(self, data):
+            return MockResult(validated_output="hello")
+
+    validator_log_crud = MagicMock()
+    payload = _build_payload("hello")
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
+    ) as build_executor:
+        for _ in range(2):
+            await _validate_with_guard(
+                payload=payload,
+                data=payload.input,
+                request_log_crud=mock_request_log_crud,
+                request_log_id=mock_request_log_id,
+                validator_log_crud=validator_log_crud,
+            )
+
+    assert build_executor.call_count == 1
+    first, second = validator_log_crud.create_many.call_args_list
+    assert [row.name for row in second.args[0]] == ["LexicalSlur"]
+    assert [row.outcome for row in second.args[0]] == [
+        row.outcome for row in first.args[0]
+    ]
+
+
+async def test_validate_with_guard_does_not_cache_unexpected_errors():
+    payload = _build_payload("hello")
+    with patch(
+        "app.api.routes.guardrails.build_executor",
+        side_effect=RuntimeError("provider down"),
+    ) as build_executor:
+        for _ in range(2):
+            response = await _validate_with_guard(
+                payload=payload,
+                data=payload.input,
+                request_log_crud=mock_request_log_crud,
+                request_log_id=mock_request_log_id,
+                validator_log_crud=mock_validator_log_crud,
+            )
+
+    assert build_executor.call_count == 2
+    assert response.success is False
+
+
+async def test_validate_with_guard_fail_open_timeout_returns_partial_result():
+    timeout_log = ValidatorRunLog(
+        validator_name="TopicRelevanceLLM",
+        value_before_validation="text",
+        value_after_validation="text",
+        latency_ms=120.0,
+        timed_out=True,
+    )
+
+    class MockExecutor:
+        validator_logs = [timeout_log]
+
+        async def async_validate(self, data):
+            return MockResult(validated_output="text", validator_logs=[timeout_log])
+
+    validator_log_crud = MagicMock()
+    payload = GuardrailRequest(
+        request_id=str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        input="text",
+        deadline_ms=100,
+        validators=[{"type": "topic_relevance_llm", "configuration": "health"}],
+    )
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
+    ) as build_executor:
+        for _ in range(2):
+            response = await _validate_with_guard(
+                payload=payload,
+                data=payload.input,
+                request_log_crud=mock_request_log_crud,
+                request_log_id=mock_request_log_id,
+                validator_log_crud=validator_log_crud,
+                suppress_pass_logs=True,
+            )
+
+    assert build_executor.call_args.kwargs["deadline"] is not None
+    # Timed-out outcomes are not cached.
+    assert build_executor.call_count == 2
+    assert response.success is True
+    assert response.data.safe_text == "text"
+    assert response.data.timed_out_validators == ["topic_relevance_llm"]
+    (rows,) = validator_log_crud.create_many.call_args.args
+    assert [row.outcome for row in rows] == [ValidatorOutcome.TIMEOUT]
+    assert rows[0].error == "TopicRelevanceLLM timed out after 120 ms"
+
+
+async def test_validate_with_guard_fail_closed_timeout_fails_request():
+    timeout_log = ValidatorRunLog(
+        validator_name="LexicalSlur",
+        value_before_validation="text",
+        value_after_validation="text",
+        latency_ms=80.0,
+        timed_out=True,
+    )
+
+    class MockExecutor:
+        validator_logs = [timeout_log]
+
+        async def async_validate(self, data):
+            return MockResult(validated_output=None, validator_logs=[timeout_log])
+
+    payload = GuardrailRequest(
+        request_id=str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        input="text",
+        validators=[{"type": "uli_slur_match", "timeout_ms": 80}],
+    )
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockExecutor()
+    ), patch("app.api.routes.guardrails.add_validator_logs"):
+        response = await _validate_with_guard(
+            payload=payload,
+            data=payload.input,
+            request_log_crud=mock_request_log_crud,
+            request_log_id=mock_request_log_id,
+            validator_log_crud=mock_validator_log_crud,
+        )
+
+    assert response.success is False
+    assert response.error == "LexicalSlur timed out after 80 ms"
+    assert response.data.timed_out_validators == ["uli_slur_match"]
+
+
 def test_resolve_validator_configs_ban_list_from_id():
     ban_list_id = str(uuid4())
     payload = GuardrailRequest(
@@ -181,9 +448,17 @@ def test_resolve_validator_configs_ban_list_from_id():
         validators=[{"type": "ban_list", "ban_list_id": ban_list_id}],
     )
     mock_session = MagicMock()
+    updated_at = datetime(2026, 1, 1)
 
-    with patch("app.api.routes.guardrails.ban_list_crud.get") as mock_get:
-        mock_get.return_value = MagicMock(banned_words=["foo", "bar"])
+    with patch(
+        "app.api.routes.guardrails.ban_list_crud.get_version",
+        return_value=updated_at,
+    ), patch("app.api.routes.guardrails.ban_list_crud.get") as mock_get:
+        mock_get.return_value = MagicMock(
+            id=payload.validators[0].ban_list_id,
+            updated_at=updated_at,
+            banned_words=["foo", "bar"],
+        )
         _resolve_validator_configs(payload, mock_session)
 
     assert payload.validators[0].banned_words == ["foo", "bar"]
@@ -195,6 +470,80 @@ def test_resolve_validator_configs_ban_list_from_id():
     )
 
 
+def _ban_list_payload(ban_list_id, organization_id=VALIDATOR_TEST_ORGANIZATION_ID):
+    return GuardrailRequest(
+        request_id=str(uuid4()),
+        organization_id=organization_id,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        input="test",
+        validators=[{"type": "ban_list", "ban_list_id": str(ban_list_id)}],
+    )
+
+
+def test_resolve_validator_configs_reuses_compiled_ban_list_per_version():
+    ban_list_id = uuid4()
+    builds = ban_list_cache.stats()["builds"]
+    versions = [datetime(2026, 1, 1), datetime(2026, 1, 1), datetime(2026, 1, 2)]
+    stored = {
+        datetime(2026, 1, 1): ["foo"],
+        datetime(2026, 1, 2): ["foo", "bar"],
+    }
+
+    with patch(
+        "app.api.routes.guardrails.ban_list_crud.get_version",
+        side_effect=versions,
+    ), patch("app.api.routes.guardrails.ban_list_crud.get") as mock_get:
+        mock_get.side_effect = [
+            MagicMock(id=ban_list_id, updated_at=version, banned_words=words)
+            for version, words in stored.items()
+        ]
+        # Two tenants of a public list, then the list is updated elsewhere.
+        first = _ban_list_payload(ban_list_id)
+        shared = _ban_list_payload(ban_list_id, organization_id=999)
+        updated = _ban_list_payload(ban_list_id)
+        for payload in (first, shared, updated):
+            _resolve_validator_configs(payload, MagicMock())
+
+    assert mock_get.call_count == 2
+    assert first.validators[0].build() is not shared.validators[0].build()
+    assert first.validators[0]._compiled is shared.validators[0]._compiled
+    assert shared.validators[0].banned_words == ["foo"]
+    assert updated.validators[0].banned_words == ["foo", "bar"]
+    assert ban_list_cache.stats()["builds"] == builds + 2
+
+
+def test_resolved_ban_list_cache_key_uses_version_not_words():
+    ban_list_id = uuid4()
+    compiled = compile_ban_list(
+        ban_list_id, datetime(2026, 1, 1), ["foo"] * 1000, "hub"
+    )
+    config = _ban_list_payload(ban_list_id).validators[0]
+    config.use_compiled(compiled)
+
+    dumped = config.cache_dump()
+
+    assert "banned_words" not in dumped
+    assert dumped["ban_list_version"] == "2026-01-01T00:00:00"
+
+
+def test_ban_list_change_carries_trie_matchers_to_new_version():
+    ban_list_id = uuid4()
+    previous, current = datetime(2026, 1, 1), datetime(2026, 1, 2)
+    compile_ban_list(ban_list_id, previous, ["foo", "bar"], "trie")
+    compile_ban_list(ban_list_id, previous, ["foo", "bar"], "hub")
+
+    apply_ban_list_change(
+        ban_list_id, previous, current, ["foo", "baz"], ["baz"], ["bar"]
+    )
+
+    assert get_compiled_ban_list(ban_list_id, previous, "trie") is None
+    assert get_compiled_ban_list(ban_list_id, current, "hub") is None
+    carried = get_compiled_ban_list(ban_list_id, current, "trie")
+    assert carried.banned_words == ["foo", "baz"]
+    result = carried.validator.validate("foo bar baz", {})
+    assert result.fix_value == "bar"
+
+
 def test_resolve_validator_configs_skips_ban_list_lookup_when_words_provided():
     payload = GuardrailRequest(
         request_id=str(uuid4()),
@@ -429,43 +778,33 @@ def test_resolve_validator_configs_uses_inline_topic_relevance_llm_without_looku
     mock_get.assert_not_called()
 
 
-def _build_mock_guard_with_fail_result(validator_name: str, error_message: str):
-    mock_log = MagicMock()
-    mock_log.validator_name = validator_name
-    mock_log.validation_result = GRFailResult(error_message=error_message)
-
-    mock_outputs = MagicMock()
-    mock_outputs.validator_logs = [mock_log]
-
-    mock_iteration = MagicMock()
-    mock_iteration.outputs = mock_outputs
-
-    mock_last = MagicMock()
-    mock_last.iterations = [mock_iteration]
-
-    mock_history = MagicMock()
-    mock_history.last = mock_last
+def _build_mock_executor_with_fail_result(validator_name: str, error_message: str):
+    fail_log = ValidatorRunLog(
+        validator_name=validator_name,
+        value_before_validation="",
+        validation_result=GRFailResult(error_message=error_message),
+    )
 
-    class MockGuard:
-        history = mock_history
+    class MockExecutor:
+        validator_logs = [fail_log]
 
-        def validate(self, data):
-            return MockResult(validated_output=None)
+        async def async_validate(self, data):
+            return MockResult(validated_output=None, validator_logs=[fail_log])
 
-    return MockGuard()
+    return MockExecutor()
 
 
-def test_nsfw_error_message_redacts_input():
+async def test_nsfw_error_message_redacts_input():
     """Case 2: when the failing validator is nsfw_text, the original input should
     be stripped from the error response."""
     unsafe_input = "this is some unsafe content"
     error_msg = f"The following sentences in your response were found to be NSFW:\n\n- {unsafe_input}"
 
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=_build_mock_guard_with_fail_result("nsfw_text", error_msg),
+        "app.api.routes.guardrails.build_executor",
+        return_value=_build_mock_executor_with_fail_result("nsfw_text", error_msg),
     ), patch("app.api.routes.guardrails.add_validator_logs"):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=_build_payload(unsafe_input),
             data=unsafe_input,
             request_log_crud=mock_request_log_crud,
@@ -477,17 +816,17 @@ def test_nsfw_error_message_redacts_input():
     assert unsafe_input not in response.error
 
 
-def test_all_validators_redact_input_from_error_message():
+async def test_all_validators_redact_input_from_error_message():
     """Case 2: input text should be stripped from the error message for any validator,
     not just nsfw_text (everything after the first colon is dropped)."""
     input_text = "some input text"
     error_msg = f"Found banned word in: {input_text}"
 
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=_build_mock_guard_with_fail_result("ban_list", error_msg),
+        "app.api.routes.guardrails.build_executor",
+        return_value=_build_mock_executor_with_fail_result("ban_list", error_msg),
     ), patch("app.api.routes.guardrails.add_validator_logs"):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=_build_payload(input_text),
             data=input_text,
             request_log_crud=mock_request_log_crud,
@@ -499,7 +838,7 @@ def test_all_validators_redact_input_from_error_message():
     assert input_text not in response.error
 
 
-def test_profanity_free_error_message_redacts_input():
+async def test_profanity_free_error_message_redacts_input():
     """Case 2: when the failing validator is profanity_free, the original input
     should be stripped from the error response (everything after the first colon is dropped).
     """
@@ -507,10 +846,10 @@ def test_profanity_free_error_message_redacts_input():
     error_msg = f"Profanity detected in: {unsafe_input}"
 
     with patch(
-        "app.api.routes.guardrails.build_guard",
-        return_value=_build_mock_guard_with_fail_result("profanity_free", error_msg),
+        "app.api.routes.guardrails.build_executor",
+        return_value=_build_mock_executor_with_fail_result("profanity_free", error_msg),
     ), patch("app.api.routes.guardrails.add_validator_logs"):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=_build_payload(unsafe_input),
             data=unsafe_input,
             request_log_crud=mock_request_log_crud,
@@ -522,19 +861,19 @@ def test_profanity_free_error_message_redacts_input():
     assert unsafe_input not in response.error
 
 
-def test_nsfw_exception_redacts_input():
+async def test_nsfw_exception_redacts_input():
     """Case 3: when an nsfw_text exception message contains the input, the original
     input should be stripped from the error response (everything after the first colon is dropped).
     """
     unsafe_input = "this is some unsafe content"
 
     with patch(
-        "app.api.routes.guardrails.build_guard",
+        "app.api.routes.guardrails.build_executor",
         side_effect=Exception(
             f"Validation failed for field with errors: The following sentences in your response were found to be NSFW:\n\n- {unsafe_input}"
         ),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=_build_payload(unsafe_input),
             data=unsafe_input,
             request_log_crud=mock_request_log_crud,
@@ -546,19 +885,19 @@ def test_nsfw_exception_redacts_input():
     assert unsafe_input not in response.error
 
 
-def test_profanity_free_exception_redacts_input():
+async def test_profanity_free_exception_redacts_input():
     """Case 3: when a profanity_free exception message contains the input, the
     original input should be stripped from the error response (everything after the first colon is dropped).
     """
     unsafe_input = "this contains profane words"
 
     with patch(
-        "app.api.routes.guardrails.build_guard",
+        "app.api.routes.guardrails.build_executor",
         side_effect=Exception(
             f"Validation failed for field with errors: Profanity detected in: {unsafe_input}"
         ),
     ):
-        response = _validate_with_guard(
+        response = await _validate_with_guard(
             payload=_build_payload(unsafe_input),
             data=unsafe_input,
             request_log_crud=mock_request_log_crud,
@@ -625,3 +964,71 @@ def test_resolve_validator_configs_rejects_topic_relevance_config_used_for_answe
 
     assert exc_info.value.status_code == 400
     assert "answer_relevance_custom_llm" in exc_info.value.detail
+
+
+async def test_run_stream_closed_early_logs_a_failed_finalize_instead_of_raising():
+    class MockStreamExecutor:
+        async def async_validate(self, data):
+            return MockResult(validated_output=data)
+
+    async def lines():
+        yield '{"delta": "One. "}'
+        yield '{"delta": "Two. "}'
+
+    payload = GuardrailStreamRequest(
+        request_id=str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        validators=[],
+    )
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockStreamExecutor()
+    ), patch("app.api.routes.guardrails.RequestLogCrud") as request_log_crud, patch(
+        "app.api.routes.guardrails.ValidatorLogCrud"
+    ), patch(
+        "app.api.routes.guardrails.logger"
+    ) as logger:
+        request_log_crud.return_value.update.side_effect = RuntimeError("db down")
+        stream = _run_stream(payload, lines(), uuid4(), MagicMock(), False)
+
+        event = await anext(stream)
+        await stream.aclose()
+
+    assert event.type == "chunk"
+    request_log_crud.return_value.update.assert_called_once()
+    logger.exception.assert_called_once()
+
+
+async def test_run_stream_closes_the_request_log_when_the_client_disconnects():
+    class MockStreamExecutor:
+        async def async_validate(self, data):
+            return MockResult(validated_output=data)
+
+    async def lines():
+        yield '{"delta": "One. "}'
+        raise ClientDisconnect()
+
+    payload = GuardrailStreamRequest(
+        request_id=str(uuid4()),
+        organization_id=VALIDATOR_TEST_ORGANIZATION_ID,
+        project_id=VALIDATOR_TEST_PROJECT_ID,
+        validators=[],
+    )
+    with patch(
+        "app.api.routes.guardrails.build_executor", return_value=MockStreamExecutor()
+    ), patch("app.api.routes.guardrails.RequestLogCrud") as request_log_crud, patch(
+        "app.api.routes.guardrails.ValidatorLogCrud"
+    ):
+        events = [
+            event
+            async for event in _run_stream(
+                payload, lines(), uuid4(), MagicMock(), False
+            )
+        ]
+
+    assert [event.type for event in events] == ["chunk"]
+    update = request_log_crud.return_value.update.call_args.kwargs
+    assert update["request_status"] == RequestStatus.ERROR
+    assert update["request_log_update"].response_text == (
+        "Stream closed before completion"
+    )
@@ -0,0 +1,439 @@
+import asyncio
+import time
+
+import pytest
+from guardrails import Guard, OnFailAction
+from guardrails.validators import (
+    FailResult,
+    PassResult,
+    Validator,
+    register_validator,
+)
+
+from app.core.validator_executor import BatchValidatorExecutor, ValidatorExecutor
+
+
+@register_validator(name="test/word_filter", data_type="string")
+class _WordFilter(Validator):
+    def __init__(self, word: str, fixable: bool = True, **kwargs):
+        super().__init__(word=word, fixable=fixable, **kwargs)
+        self.word = word
+        self.fixable = fixable
+
+    def _validate(self, value, metadata):
+        if value is not None and self.word in value:
+            return FailResult(
+                error_message=f"found {self.word}",
+                fix_value=value.replace(self.word, "").strip()
+                if self.fixable
+                else None,
+            )
+        return PassResult()
+
+
+def _rephrase(value, fail_result):
+    return f"Please rephrase: {fail_result.error_message}"
+
+
+ON_FAIL_CASES = [
+    OnFailAction.FIX,
+    OnFailAction.NOOP,
+    OnFailAction.EXCEPTION,
+    _rephrase,
+]
+
+
+def _guard_output(validators, text):
+    try:
+        return Guard().use(*validators).validate(text).validated_output
+    except Exception:
+        return None
+
+
+@pytest.mark.parametrize("first_on_fail", ON_FAIL_CASES)
+@pytest.mark.parametrize("second_on_fail", ON_FAIL_CASES)
+@pytest.mark.parametrize("fixable", [True, False])
+@pytest.mark.parametrize("text", ["bad and ugly", "ugly", "fine"])
+@pytest.mark.parametrize("concurrent", [False, True])
+async def test_executor_matches_guard_output(
+    first_on_fail, second_on_fail, fixable, text, concurrent
+):
+    def make():
+        return [
+            _WordFilter("bad", fixable=fixable, on_fail=first_on_fail),
+            _WordFilter("ugly", fixable=fixable, on_fail=second_on_fail),
+        ]
+
+    result = await ValidatorExecutor(make(), concurrent=concurrent).async_validate(text)
+
+    assert result.validated_output == _guard_output(make(), text)
+
+
+@pytest.mark.parametrize("first_on_fail", ON_FAIL_CASES)
+@pytest.mark.parametrize("second_on_fail", ON_FAIL_CASES)
+@pytest.mark.parametrize("fixable", [True, False])
+@pytest.mark.parametrize("text", ["bad and ugly", "ugly", "fine"])
+def test_sync_executor_matches_guard_output(
+    first_on_fail, second_on_fail, fixable, text
+):
+    def make():
+        return [
+            _WordFilter("bad", fixable=fixable, on_fail=first_on_fail),
+            _WordFilter("ugly", fixable=fixable, on_fail=second_on_fail),
+        ]
+
+    result = ValidatorExecutor(make()).validate(text)
+
+    assert result.validated_output == _guard_output(make(), text)
+
+
+def test_sync_executor_logs_match_async_executor():
+    def make():
+        return [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _WordFilter("ugly", on_fail=OnFailAction.NOOP),
+        ]
+
+    sync_logs = ValidatorExecutor(make()).validate("bad ugly").validator_logs
+    async_logs = asyncio.run(
+        ValidatorExecutor(make()).async_validate("bad ugly")
+    ).validator_logs
+
+    assert [
+        (log.validator_name, log.value_before_validation, log.value_after_validation)
+        for log in sync_logs
+    ] == [
+        (log.validator_name, log.value_before_validation, log.value_after_validation)
+        for log in async_logs
+    ]
+    assert all(log.latency_ms is not None for log in sync_logs)
+
+
+async def test_executor_chains_fixes_in_order():
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _WordFilter("ugly", on_fail=OnFailAction.FIX),
+        ]
+    )
+
+    result = await executor.async_validate("bad ugly text")
+
+    assert result.validated_output == "text"
+    assert [log.value_before_validation for log in result.validator_logs] == [
+        "bad ugly text",
+        "ugly text",
+    ]
+    assert result.validator_logs[-1].value_after_validation == "text"
+
+
+async def test_executor_stops_on_exception_and_keeps_fail_log():
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.EXCEPTION),
+            _WordFilter("ugly", on_fail=OnFailAction.FIX),
+        ]
+    )
+
+    result = await executor.async_validate("bad ugly")
+
+    assert result.validated_output is None
+    assert len(result.validator_logs) == 1
+    assert isinstance(result.validator_logs[0].validation_result, FailResult)
+    assert executor.validator_logs == result.validator_logs
+
+
+async def test_executor_logs_class_name_for_each_validator():
+    executor = ValidatorExecutor([_WordFilter("bad", on_fail=OnFailAction.NOOP)])
+
+    result = await executor.async_validate("fine")
+
+    assert result.validated_output == "fine"
+    assert [log.validator_name for log in result.validator_logs] == ["_WordFilter"]
+    assert isinstance(result.validator_logs[0].validation_result, PassResult)
+
+
+@register_validator(name="test/slow_pass", data_type="string")
+class _SlowPass(Validator):
+    def __init__(self, delay: float, seen: list, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.seen = seen
+
+    async def async_validate(self, value, metadata):
+        self.seen.append(value)
+        await asyncio.sleep(self.delay)
+        return PassResult()
+
+
+async def test_concurrent_executor_overlaps_independent_validators():
+    seen = []
+    validators = [_SlowPass(0.2, seen, on_fail=OnFailAction.NOOP) for _ in range(3)]
+
+    start = time.perf_counter()
+    result = await ValidatorExecutor(validators, concurrent=True).async_validate("text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output == "text"
+    assert elapsed < 0.4
+
+
+async def test_concurrent_executor_never_sends_pre_fix_text_past_a_fix():
+    # Stands in for an LLM validator placed after pii_remover(fix).
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _SlowPass(0.01, seen, on_fail=OnFailAction.NOOP),
+        ],
+        concurrent=True,
+    )
+
+    result = await executor.async_validate("bad text")
+
+    assert result.validated_output == "text"
+    assert seen == ["text"]
+    assert result.validator_logs[1].value_before_validation == "text"
+
+
+async def test_concurrent_executor_reruns_validators_after_a_rephrase():
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=_rephrase),
+            _SlowPass(0.01, seen, on_fail=OnFailAction.NOOP),
+        ],
+        concurrent=True,
+        barriers=[False, False],
+    )
+
+    result = await executor.async_validate("bad text")
+
+    assert result.validated_output == "Please rephrase: found bad"
+    assert seen == ["bad text", "Please rephrase: found bad"]
+
+
+@register_validator(name="test/batch_upper", data_type="string")
+class _BatchUpper(Validator):
+    def __init__(self, calls: list, **kwargs):
+        super().__init__(**kwargs)
+        self.calls = calls
+
+    def _validate(self, value, metadata):
+        raise AssertionError("per-text validation should not be used")
+
+    def validate_batch(self, values):
+        self.calls.append(list(values))
+        return [
+            FailResult(error_message="lowercase", fix_value=value.upper())
+            if value != value.upper()
+            else PassResult()
+            for value in values
+        ]
+
+
+async def test_batch_executor_matches_per_text_executor():
+    texts = ["bad and ugly", "ugly", "fine", "bad"]
+
+    def make():
+        return [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _WordFilter("ugly", fixable=False, on_fail=OnFailAction.EXCEPTION),
+        ]
+
+    batch_results = await BatchValidatorExecutor(
+        [make() for _ in texts]
+    ).async_validate(texts)
+
+    for text, batch_result in zip(texts, batch_results, strict=True):
+        single = await ValidatorExecutor(make()).async_validate(text)
+        assert batch_result.validated_output == single.validated_output
+        assert [log.value_after_validation for log in batch_result.validator_logs] == [
+            log.value_after_validation for log in single.validator_logs
+        ]
+
+
+async def test_batch_executor_uses_validate_batch_once_per_position():
+    calls = []
+    shared = _BatchUpper(calls, on_fail=OnFailAction.FIX)
+    rows = [
+        [_WordFilter("bad", on_fail=OnFailAction.EXCEPTION), shared] for _ in range(3)
+    ]
+
+    results = await BatchValidatorExecutor(rows).async_validate(["abc", "bad", "DEF"])
+
+    assert calls == [["abc", "DEF"]]
+    assert [r.validated_output for r in results] == ["ABC", None, "DEF"]
+
+
+async def test_batch_executor_isolates_unexpected_errors():
+    @register_validator(name="test/explode_on_boom", data_type="string")
+    class _Explode(Validator):
+        def _validate(self, value, metadata):
+            if value == "boom":
+                raise RuntimeError("model crashed")
+            return PassResult()
+
+    rows = [[_Explode(on_fail=OnFailAction.NOOP)] for _ in range(2)]
+
+    results = await BatchValidatorExecutor(rows).async_validate(["boom", "ok"])
+
+    assert isinstance(results[0].error, RuntimeError)
+    assert results[0].validated_output is None
+    assert results[1].error is None
+    assert results[1].validated_output == "ok"
+
+
+async def test_concurrent_executor_runs_exception_validators_together():
+    seen = []
+    validators = [
+        _SlowPass(0.2, seen, on_fail=OnFailAction.EXCEPTION) for _ in range(3)
+    ]
+
+    start = time.perf_counter()
+    result = await ValidatorExecutor(validators, concurrent=True).async_validate("text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output == "text"
+    assert elapsed < 0.4
+
+
+async def test_concurrent_executor_cancels_later_runs_after_an_exception():
+    seen = []
+    slow = _SlowPass(1.0, seen, on_fail=OnFailAction.NOOP)
+    executor = ValidatorExecutor(
+        [_WordFilter("bad", on_fail=OnFailAction.EXCEPTION), slow],
+        concurrent=True,
+    )
+
+    start = time.perf_counter()
+    result = await executor.async_validate("bad text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output is None
+    assert len(result.validator_logs) == 1
+    assert seen == ["bad text"]
+    assert elapsed < 0.5
+
+
+async def test_exception_barrier_does_not_start_validators_behind_it():
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.EXCEPTION),
+            _SlowPass(0.01, seen, on_fail=OnFailAction.NOOP),
+        ],
+        concurrent=True,
+        barriers=[True, False],
+    )
+
+    result = await executor.async_validate("bad text")
+
+    assert result.validated_output is None
+    assert len(result.validator_logs) == 1
+    assert seen == []
+
+
+async def test_concurrent_executor_runs_validators_up_to_a_barrier_together():
+    seen = []
+    validators = [
+        *(_SlowPass(0.2, seen, on_fail=OnFailAction.NOOP) for _ in range(3)),
+        _WordFilter("bad", on_fail=OnFailAction.EXCEPTION),
+    ]
+
+    start = time.perf_counter()
+    result = await ValidatorExecutor(validators, concurrent=True).async_validate("text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output == "text"
+    assert elapsed < 0.4
+
+
+async def test_executor_records_latency_per_validator():
+    seen = []
+    result = await ValidatorExecutor(
+        [_SlowPass(0.05, seen, on_fail=OnFailAction.NOOP)]
+    ).async_validate("text")
+
+    assert result.validator_logs[0].latency_ms >= 50
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+async def test_fail_closed_timeout_stops_the_run(concurrent):
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _SlowPass(1.0, seen, on_fail=OnFailAction.NOOP),
+            _WordFilter("ugly", on_fail=OnFailAction.FIX),
+        ],
+        concurrent=concurrent,
+        timeouts=[None, 0.05, None],
+    )
+
+    start = time.perf_counter()
+    result = await executor.async_validate("bad text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output is None
+    assert [log.timed_out for log in result.validator_logs] == [False, True]
+    assert result.validator_logs[1].validation_result is None
+    assert elapsed < 0.5
+
+
+@pytest.mark.parametrize("concurrent", [False, True])
+async def test_fail_open_timeout_keeps_results_of_finished_validators(concurrent):
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _SlowPass(1.0, seen, on_fail=OnFailAction.NOOP),
+            _WordFilter("ugly", on_fail=OnFailAction.FIX),
+        ],
+        concurrent=concurrent,
+        timeouts=[None, 0.05, None],
+        fail_open=[False, True, False],
+    )
+
+    result = await executor.async_validate("bad ugly text")
+
+    assert result.validated_output == "text"
+    assert [log.timed_out for log in result.validator_logs] == [False, True, False]
+    assert result.validator_logs[1].value_after_validation == "ugly text"
+
+
+async def test_deadline_abandons_every_validator_still_running():
+    seen = []
+    executor = ValidatorExecutor(
+        [
+            _WordFilter("bad", on_fail=OnFailAction.FIX),
+            _SlowPass(1.0, seen, on_fail=OnFailAction.NOOP),
+            _SlowPass(1.0, seen, on_fail=OnFailAction.NOOP),
+        ],
+        concurrent=True,
+        fail_open=[True, True, True],
+        deadline=time.monotonic() + 0.1,
+    )
+
+    start = time.perf_counter()
+    result = await executor.async_validate("text")
+    elapsed = time.perf_counter() - start
+
+    assert result.validated_output == "text"
+    assert [log.timed_out for log in result.validator_logs] == [False, True, True]
+    assert elapsed < 0.5
+
+
+async def test_timeout_error_raised_by_a_validator_is_not_a_timeout():
+    @register_validator(name="test/raises_timeout", data_type="string")
+    class _RaisesTimeout(Validator):
+        async def async_validate(self, value, metadata):
+            raise asyncio.TimeoutError("provider timed out")
+
+    executor = ValidatorExecutor(
+        [_RaisesTimeout(on_fail=OnFailAction.NOOP)], timeouts=[5.0]
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await executor.async_validate("text")
+    assert executor.validator_logs[0].timed_out is False
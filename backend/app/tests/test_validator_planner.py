@@ -0,0 +1,178 @@
+import pytest
+from guardrails.validators import PassResult
+
+from app.api.routes.utils import get_cache_stats
+from app.core.llm_response_cache import mark_cache_hit
+from app.core.validator_executor import ValidatorRunLog
+from app.core.validator_planner import (
+    ValidatorCostModel,
+    cost_model,
+    plan_validators,
+    record_latencies,
+    skipped_validators,
+)
+from app.core.validators.config.gender_assumption_bias_safety_validator_config import (
+    GenderAssumptionBiasSafetyValidatorConfig,
+)
+from app.core.validators.config.lexical_slur_safety_validator_config import (
+    LexicalSlurSafetyValidatorConfig,
+)
+from app.core.validators.config.pii_remover_safety_validator_config import (
+    PIIRemoverSafetyValidatorConfig,
+)
+from app.core.validators.config.topic_relevance_llm_safety_validator_config import (
+    TopicRelevanceLLMSafetyValidatorConfig,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_cost_model():
+    cost_model.reset()
+    yield
+    cost_model.reset()
+
+
+def _validators():
+    return [
+        TopicRelevanceLLMSafetyValidatorConfig(
+            type="topic_relevance_llm",
+            configuration="maternal health",
+            on_fail="exception",
+        ),
+        LexicalSlurSafetyValidatorConfig(type="uli_slur_match", on_fail="exception"),
+        GenderAssumptionBiasSafetyValidatorConfig(
+            type="gender_assumption_bias", on_fail="exception"
+        ),
+    ]
+
+
+def test_plan_orders_by_cost_class_and_keeps_request_order_within_a_class():
+    planned = plan_validators(_validators())
+
+    assert [v.type for v in planned] == [
+        "uli_slur_match",
+        "gender_assumption_bias",
+        "topic_relevance_llm",
+    ]
+
+
+def test_observed_latency_overrides_static_cost_class():
+    for _ in range(5):
+        cost_model.observe("uli_slur_match", 2000.0)
+
+    planned = plan_validators(_validators())
+
+    assert [v.type for v in planned] == [
+        "gender_assumption_bias",
+        "topic_relevance_llm",
+        "uli_slur_match",
+    ]
+
+
+def test_plan_never_moves_a_validator_ahead_of_a_fix():
+    for _ in range(5):
+        cost_model.observe("topic_relevance_llm", 0.1)
+    validators = [
+        LexicalSlurSafetyValidatorConfig(type="uli_slur_match", on_fail="exception"),
+        PIIRemoverSafetyValidatorConfig(type="pii_remover", on_fail="fix"),
+        TopicRelevanceLLMSafetyValidatorConfig(
+            type="topic_relevance_llm", configuration="health", on_fail="exception"
+        ),
+        GenderAssumptionBiasSafetyValidatorConfig(
+            type="gender_assumption_bias", on_fail="exception"
+        ),
+    ]
+
+    planned = plan_validators(validators)
+
+    assert [v.type for v in planned] == [
+        "uli_slur_match",
+        "pii_remover",
+        "topic_relevance_llm",
+        "gender_assumption_bias",
+    ]
+
+
+def test_plan_keeps_fixes_in_requested_order():
+    validators = [
+        TopicRelevanceLLMSafetyValidatorConfig(
+            type="topic_relevance_llm", configuration="health", on_fail="fix"
+        ),
+        PIIRemoverSafetyValidatorConfig(type="pii_remover", on_fail="fix"),
+        LexicalSlurSafetyValidatorConfig(type="uli_slur_match", on_fail="rephrase"),
+    ]
+
+    assert plan_validators(validators) == validators
+
+
+def test_cost_model_needs_min_observations_before_using_them():
+    model = ValidatorCostModel(min_observations=3, smoothing=0.5)
+    slur = LexicalSlurSafetyValidatorConfig(type="uli_slur_match")
+
+    model.observe("uli_slur_match", 100.0)
+    model.observe("uli_slur_match", 300.0)
+    assert model.estimate(slur) == 1.0
+
+    model.observe("uli_slur_match", 300.0)
+    assert model.estimate(slur) == 250.0
+    assert model.stats()["uli_slur_match"]["observations"] == 3
+
+
+def test_record_latencies_only_counts_validators_that_ran():
+    validators = _validators()
+    logs = [
+        ValidatorRunLog(
+            validator_name="TopicRelevanceLLM",
+            value_before_validation="text",
+            latency_ms=900.0,
+        )
+    ]
+
+    record_latencies(validators, logs)
+
+    assert set(cost_model.stats()) == {"topic_relevance_llm"}
+
+
+def test_record_latencies_skips_cached_llm_verdicts():
+    validators = _validators()
+    logs = [
+        ValidatorRunLog(
+            validator_name="TopicRelevanceLLM",
+            value_before_validation="text",
+            validation_result=mark_cache_hit(PassResult()),
+            latency_ms=0.2,
+        ),
+        ValidatorRunLog(
+            validator_name="LexicalSlur",
+            value_before_validation="text",
+            validation_result=PassResult(),
+            latency_ms=1.0,
+        ),
+    ]
+
+    record_latencies(validators, logs)
+
+    assert set(cost_model.stats()) == {"uli_slur_match"}
+
+
+def test_skipped_validators_lists_validators_after_the_last_log():
+    validators = _validators()
+    logs = [ValidatorRunLog(validator_name="x", value_before_validation="text")]
+
+    assert skipped_validators(validators, logs) == [
+        "uli_slur_match",
+        "gender_assumption_bias",
+    ]
+    assert skipped_validators(validators, logs * 3) is None
+
+
+def test_cache_stats_report_observed_validator_latencies():
+    cost_model.observe("uli_slur_match", 2.0)
+
+    stats = get_cache_stats(None)["validator_latency"]
+
+    assert stats["uli_slur_match"] == {
+        "observations": 1,
+        "average_latency_ms": 2.0,
+        "used_for_planning": False,
+    }
@@ -0,0 +1,63 @@
+import pytest
+
+from app.core.text_normalizer import normalize_for_matching
+from app.core.variant_folding import VariantIndex, fold_variants
+
+
+@pytest.mark.parametrize(
+    "variant, listed",
+    [
+        ("k u t t a", "kutta"),
+        ("k.u.t.t.a", "kutta"),
+        ("kutt@", "kutta"),
+        ("kuttaaaa", "kutta"),
+        ("कुत्ता", "kutta"),
+        ("मादरचोद", "madarchod"),
+        ("bhainchod", "भैनचोद"),
+        ("chootiya", "चूतिया"),
+        ("gaandu", "गांडू"),
+        ("bhosdiwala", "भोसड़ीwala"),
+        ("pu55y", "pussy"),
+        ("wh0re", "whore"),
+    ],
+)
+def test_variants_fold_to_the_same_key(variant, listed):
+    assert (
+        fold_variants(normalize_for_matching(variant)).text
+        == fold_variants(normalize_for_matching(listed)).text
+    )
+
+
+def test_folded_characters_keep_their_source_span():
+    text = "a k u t t @ here"
+    folded = fold_variants(text)
+
+    start = folded.text.index("kuta")
+    end = start + len("kuta")
+    assert text[folded.starts[start] : folded.ends[end - 1]] == "k u t t @"
+    assert folded.replace([(start, end)], "[X]") == "a [X] here"
+
+
+def test_numbers_and_sentence_punctuation_are_not_leetspeak():
+    assert fold_variants("call 100 now!").text == "kal 100 nov!"
+
+
+def test_variant_index_finds_spaced_letters_after_a_single_letter_word():
+    index = VariantIndex(["kutta"])
+
+    found, spans = index.find_spans("you are a k u t t a")
+
+    assert found == ["kutta"]
+    assert spans == [(10, 19)]
+
+
+def test_variant_index_respects_word_boundaries():
+    index = VariantIndex(["kutta"])
+
+    assert index.find_spans("kuttapan and akutta") == ([], [])
+
+
+def test_short_phrases_are_not_matched_as_variants():
+    index = VariantIndex(["bai", "kutta"])
+
+    assert index.find_spans("to be or not to be") == ([], [])
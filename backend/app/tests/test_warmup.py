@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from app.api.routes.utils import ready
+from app.core import warmup
+
+
+@pytest.fixture(autouse=True)
+def reset_readiness(monkeypatch):
+    monkeypatch.setattr(
+        warmup, "_readiness", {"ready": False, "warmup": None, "error": None}
+    )
+
+
+def test_ready_without_warmup_when_disabled(monkeypatch):
+    monkeypatch.setattr(warmup.settings, "PII_WARMUP_ON_STARTUP", False)
+    monkeypatch.setattr(
+        warmup.pii_remover, "warm_up", lambda: pytest.fail("should not load models")
+    )
+
+    warmup.warm_up()
+
+    assert warmup.readiness() == {"ready": True, "warmup": None, "error": None}
+
+
+def test_warmup_records_timings_and_memory(monkeypatch):
+    monkeypatch.setattr(warmup.settings, "PII_WARMUP_ON_STARTUP", True)
+    monkeypatch.setattr(
+        warmup.pii_remover,
+        "warm_up",
+        lambda: {"model_load_ms": 1200.0, "warmup_ms": 80.0},
+    )
+
+    warmup.warm_up()
+
+    state = warmup.readiness()
+    assert state["ready"] is True
+    assert state["warmup"]["model_load_ms"] == 1200.0
+    assert state["warmup"]["rss_bytes"] > 0
+    assert ready().status_code == 200
+
+
+def test_failed_warmup_is_not_ready(monkeypatch):
+    monkeypatch.setattr(warmup.settings, "PII_WARMUP_ON_STARTUP", True)
+
+    def missing_model():
+        raise OSError("Can't find model 'en_core_web_lg'")
+
+    monkeypatch.setattr(warmup.pii_remover, "warm_up", missing_model)
+
+    warmup.warm_up()
+
+    response = ready()
+    assert response.status_code == 503
+    assert json.loads(response.body)["error"] == "Can't find model 'en_core_web_lg'"
@@ -1,2 +1,4 @@
 VALIDATE_API_PATH = "/api/v1/guardrails/"
 SAFE_TEXT_FIELD = "safe_text"
+VALIDATE_BATCH_API_PATH = "/api/v1/guardrails/batch"
+VALIDATE_STREAM_API_PATH = "/api/v1/guardrails/stream"
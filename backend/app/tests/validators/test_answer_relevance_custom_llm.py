@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from guardrails.validators import FailResult, PassResult
@@ -232,3 +232,35 @@ def test_llm_callable_is_forwarded():
         v._validate(ANSWER_RELEVANT)
 
         assert mock_llm.call_args.kwargs["model"] == "gpt-4o"
+
+
+# ---------------------------------------------------------------------------
+# Async path uses acompletion
+# ---------------------------------------------------------------------------
+
+
+async def test_async_validate_passes_when_llm_returns_yes(validator):
+    with patch(
+        "app.core.validators.answer_relevance_custom_llm.acompletion",
+        new_callable=AsyncMock,
+    ) as mock_llm, patch(
+        "app.core.validators.answer_relevance_custom_llm.completion"
+    ) as mock_sync_llm:
+        mock_llm.return_value = _make_llm_response("YES")
+        result = await validator.async_validate(ANSWER_RELEVANT, {})
+
+    assert isinstance(result, PassResult)
+    mock_llm.assert_awaited_once()
+    mock_sync_llm.assert_not_called()
+
+
+async def test_async_validate_fails_gracefully_when_llm_raises(validator):
+    with patch(
+        "app.core.validators.answer_relevance_custom_llm.acompletion",
+        new_callable=AsyncMock,
+        side_effect=Exception("network timeout"),
+    ):
+        result = await validator.async_validate(ANSWER_RELEVANT, {})
+
+    assert isinstance(result, FailResult)
+    assert "network timeout" in result.error_message
@@ -0,0 +1,163 @@
+import random
+from unittest.mock import patch
+
+import pytest
+from guardrails.validators import FailResult, PassResult
+
+from app.core.validators import ban_list
+from app.core.validators.ban_list import TrieBanList
+from app.core.validators.config.ban_list_safety_validator_config import (
+    BanListSafetyValidatorConfig,
+)
+
+
+def test_passes_clean_text():
+    validator = TrieBanList(banned_words=["sonography"])
+
+    result = validator.validate("When is the next vaccination camp?", {})
+
+    assert isinstance(result, PassResult)
+
+
+def test_removes_words_and_phrases_in_one_pass():
+    validator = TrieBanList(banned_words=["sonography", "gender check"])
+
+    result = validator.validate("Can I get a Sonography and a gender  check?", {})
+
+    assert isinstance(result, FailResult)
+    assert result.fix_value == "Can I get a and a?"
+    assert result.error_message == (
+        "Output contains banned words: gender check, sonography"
+    )
+
+
+def test_matches_whole_words_only():
+    validator = TrieBanList(banned_words=["ban"])
+
+    result = validator.validate("A banner is not banned, but a ban is.", {})
+
+    assert result.fix_value == "A banner is not banned, but a is."
+
+
+def test_prefers_longest_phrase():
+    validator = TrieBanList(banned_words=["pill", "abortion pill"])
+
+    result = validator.validate("abortion pill price", {})
+
+    assert result.fix_value == "price"
+    assert result.error_message == "Output contains banned words: abortion pill, pill"
+
+
+def test_keeps_text_around_matches_as_sent():
+    validator = TrieBanList(banned_words=["दवा"])
+
+    result = validator.validate("Doctor ने  दवा दी 🙏", {})
+
+    assert result.fix_value == "Doctor ने  दी 🙏"
+
+
+def test_large_list_matches_each_word():
+    rng = random.Random(3)
+    words = {
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(8))
+        for _ in range(20_000)
+    }
+    validator = TrieBanList(banned_words=sorted(words))
+
+    for word in rng.sample(sorted(words), 50):
+        result = validator.validate(f"please do not say {word} here", {})
+        assert result.fix_value == "please do not say here"
+
+
+def test_config_selects_engine(monkeypatch):
+    config = BanListSafetyValidatorConfig(
+        type="ban_list", banned_words=["foo"], engine="trie"
+    )
+
+    assert isinstance(config.build(), TrieBanList)
+    monkeypatch.setattr(
+        "app.core.validators.config.ban_list_safety_validator_config.settings.BAN_LIST_ENGINE",
+        "trie",
+    )
+    assert isinstance(
+        BanListSafetyValidatorConfig(type="ban_list", banned_words=["foo"]).build(),
+        TrieBanList,
+    )
+
+
+def test_fuzzy_matches_misspelled_words():
+    validator = TrieBanList(banned_words=["sonography", "gender check"], max_distance=1)
+
+    result = validator.validate("Is a sonograpy or a gender chek allowed?", {})
+
+    assert result.fix_value == "Is a or a allowed?"
+    assert result.error_message == (
+        "Output contains banned words: gender check, sonography"
+    )
+
+
+def test_fuzzy_keeps_short_words_exact():
+    validator = TrieBanList(banned_words=["ban", "pill"], max_distance=2)
+
+    result = validator.validate("A bun and a pils, then a ban.", {})
+
+    assert result.fix_value == "A bun and a, then a."
+
+
+def test_fuzzy_without_typos_matches_like_exact():
+    rng = random.Random(11)
+    words = [
+        " ".join(
+            "".join(rng.choice("abcdefgh") for _ in range(rng.randint(2, 7)))
+            for _ in range(rng.randint(1, 2))
+        )
+        for _ in range(200)
+    ]
+    exact = TrieBanList(banned_words=words)
+    fuzzy = TrieBanList(banned_words=words, max_distance=1)
+
+    for _ in range(100):
+        text = " ".join(rng.sample(words, 3))
+        assert set(fuzzy._matcher.find_spans(text)[1]) >= set(
+            exact._matcher.find_spans(text)[1]
+        )
+
+
+@pytest.mark.parametrize("max_distance", [0, 1])
+def test_updated_matches_like_a_fresh_build(max_distance):
+    words = ["sonography", "Gender check", "gender check", "pill"]
+    validator = TrieBanList(banned_words=words, max_distance=max_distance)
+
+    updated = validator.updated(
+        ["sonography", "gender check", "abortion pill"],
+        added=["abortion pill"],
+        removed=["Gender check", "pill"],
+    )
+
+    text = "Is a sonography, gender check or abortion pill or pill safe?"
+    fresh = TrieBanList(
+        banned_words=["sonography", "gender check", "abortion pill"],
+        max_distance=max_distance,
+    )
+    assert updated.validate(text, {}).fix_value == "Is a, or or pill safe?"
+    assert updated.validate(text, {}).error_message == (
+        fresh.validate(text, {}).error_message
+    )
+    assert validator.validate(text, {}).fix_value == "Is a, or abortion or safe?"
+
+
+def test_updated_respells_every_removed_variant_in_one_pass():
+    words = [f"word{i}" for i in range(1000)]
+    variants = [f"Word{i}" for i in range(0, 1000, 20)]
+    validator = TrieBanList(banned_words=variants + words)
+    remaining = words
+
+    with patch.object(ban_list, "_normalize", wraps=ban_list._normalize) as normalize:
+        updated = validator.updated(remaining, added=[], removed=variants)
+
+    assert normalize.call_count <= 3 * len(variants) + len(remaining)
+    result = updated.validate("say word20 and word999", {})
+    assert set(result.error_message.split(": ")[1].split(", ")) == {
+        "word20",
+        "word999",
+    }
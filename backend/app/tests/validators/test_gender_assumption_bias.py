@@ -1,3 +1,6 @@
+import random
+import re
+
 import pandas as pd
 import pytest
 from unittest.mock import patch
@@ -7,6 +10,12 @@ from app.core.validators.gender_assumption_bias import GenderAssumptionBias
 from guardrails.validators import FailResult, PassResult
 
 
+@pytest.fixture(autouse=True)
+def empty_rewriter_cache(monkeypatch):
+    """Each test loads its own lexicon instead of the one cached by another."""
+    monkeypatch.setattr(GenderAssumptionBias, "_REWRITER_CACHE", {})
+
+
 @pytest.fixture
 def mock_gender_bias_df():
     return pd.DataFrame(
@@ -81,3 +90,74 @@ def test_csv_load_failure_raises_value_error():
     with patch("pandas.read_csv", side_effect=Exception("boom")):
         with pytest.raises(ValueError):
             GenderAssumptionBias(categories=[BiasCategories.All])
+
+
+def _sequential_rewrite(entries, text):
+    """The per-entry search and sub loop the validator used before BiasRewriter."""
+    detected = []
+    for entry in entries:
+        pattern = rf"\b{re.escape(entry['word'])}\b"
+        if re.search(pattern, text, flags=re.IGNORECASE):
+            detected.append(entry["word"])
+            text = re.sub(pattern, entry["neutral-term"], text, flags=re.IGNORECASE)
+    return detected, text
+
+
+@pytest.mark.parametrize(
+    "categories",
+    [
+        [BiasCategories.All],
+        [BiasCategories.Generic],
+        [BiasCategories.Healthcare, BiasCategories.Education],
+        [BiasCategories.All, BiasCategories.Generic],
+    ],
+)
+def test_single_pass_matches_sequential_rewrite(categories):
+    validator = GenderAssumptionBias(categories=categories)
+    entries = validator.gender_bias_list
+    tokens = (
+        [entry["word"] for entry in entries]
+        + [entry["neutral-term"] for entry in entries]
+        + ["The", "नर्स", "ने", "कहा", "x", "1", "े"]
+    )
+    rng = random.Random(3)
+
+    for _ in range(500):
+        words = [
+            token.upper() if rng.random() < 0.2 else token
+            for token in rng.choices(tokens, k=rng.randint(1, 12))
+        ]
+        text = "".join(
+            word + rng.choice([" ", " ", ", ", "-", "", "। ", "'s "]) for word in words
+        )
+
+        detected, fixed = _sequential_rewrite(entries, text)
+        result = validator._validate(text)
+        if detected:
+            assert result.error_message == (
+                f"Detected gender assumption bias: {detected}"
+            ), text
+            assert result.fix_value == fixed, text
+        else:
+            assert isinstance(result, PassResult), text
+
+
+def test_chained_replacements_are_reported():
+    validator = GenderAssumptionBias(categories=[BiasCategories.Healthcare])
+
+    result = validator._validate("Ask the midwife.")
+
+    assert result.fix_value == "Ask the birth attendant."
+    assert result.error_message == (
+        "Detected gender assumption bias: ['midwife', 'attendant']"
+    )
+
+
+def test_lexicon_is_loaded_once_per_category_list(mock_gender_bias_df):
+    with patch("pandas.read_csv", return_value=mock_gender_bias_df) as read_csv:
+        first = GenderAssumptionBias(categories=[BiasCategories.All])
+        second = GenderAssumptionBias(categories=[BiasCategories.All])
+        GenderAssumptionBias(categories=[BiasCategories.Generic])
+
+    assert read_csv.call_count == 2
+    assert first._rewriter is second._rewriter
@@ -1,8 +1,10 @@
+import json
+
 import pandas as pd
 import pytest
 
 from app.core.validators.lexical_slur import LexicalSlur, SlurSeverity
-from app.core.config import Settings
+from app.core.config import Settings, settings
 
 
 # ---------------------------------------
@@ -141,3 +143,127 @@ def test_severity_high_includes_only_h(patch_slur_load, monkeypatch, slur_csv):
 
     validator = LexicalSlur(severity=SlurSeverity.High)
     assert validator.slur_list == ["highone"]
+
+
+def test_redact_original_keeps_the_text_as_sent(patch_slur_load):
+    validator = LexicalSlur(redact_original=True)
+    result = validator._validate("You  are a BadWord 😡 Person!")
+
+    assert result.outcome == "fail"
+    assert result.fix_value == "You  are a [REDACTED_SLUR] 😡 Person!"
+
+
+def test_default_redacts_the_normalized_text(patch_slur_load):
+    validator = build_validator()
+    result = validator._validate("You  are a BadWord 😡 Person!")
+
+    assert result.fix_value == "you are a [REDACTED_SLUR] person!"
+
+
+@pytest.fixture
+def slur_file(monkeypatch, slur_csv):
+    """Load the real loader from the temp CSV with empty process caches."""
+    monkeypatch.setattr(Settings, "SLUR_LIST_FILEPATH", slur_csv)
+    monkeypatch.setattr(LexicalSlur, "_SLUR_CACHE", {})
+    monkeypatch.setattr(LexicalSlur, "_MATCHER_CACHE", {})
+    return slur_csv
+
+
+def test_languages_narrow_the_slur_list(slur_file):
+    assert LexicalSlur(languages=["en"]).slur_list == ["badword", "mildslur"]
+    assert LexicalSlur(languages=["hi"]).slur_list == ["highslur"]
+    assert LexicalSlur(languages=["en", "hi"]).slur_list == [
+        "badword",
+        "mildslur",
+        "highslur",
+    ]
+
+
+def test_languages_fall_back_to_script_without_language_column(slur_file):
+    pd.DataFrame({"label": ["Badword", "साला"], "severity": ["L", "H"]}).to_csv(
+        slur_file, index=False
+    )
+
+    assert LexicalSlur(languages=["en"]).slur_list == ["badword"]
+    assert LexicalSlur(languages=["hi"]).slur_list == ["badword", "साला"]
+
+
+def test_instances_share_the_compiled_matcher(slur_file):
+    first = LexicalSlur(severity=SlurSeverity.Medium)
+    second = LexicalSlur(severity=SlurSeverity.Medium)
+
+    assert first._slur_matcher is second._slur_matcher
+    assert LexicalSlur()._slur_matcher is not first._slur_matcher
+
+
+def test_compiled_lexicon_is_loaded_from_disk(slur_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SLUR_LEXICON_CACHE_DIR", str(tmp_path / "lexicons"))
+    LexicalSlur(languages=["en"])
+    assert len(list((tmp_path / "lexicons").iterdir())) == 1
+
+    monkeypatch.setattr(LexicalSlur, "_SLUR_CACHE", {})
+    monkeypatch.setattr(LexicalSlur, "_MATCHER_CACHE", {})
+
+    def fail_read_csv(*args, **kwargs):
+        raise AssertionError("the CSV should not be parsed")
+
+    monkeypatch.setattr(pd, "read_csv", fail_read_csv)
+    validator = LexicalSlur(languages=["en"])
+
+    assert validator.slur_list == ["badword", "mildslur"]
+    assert validator._validate("a badword").fix_value == "a [REDACTED_SLUR]"
+
+
+def test_edited_slur_list_is_not_served_from_disk(slur_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SLUR_LEXICON_CACHE_DIR", str(tmp_path / "lexicons"))
+    LexicalSlur()
+    pd.DataFrame({"label": ["newword"], "severity": ["H"]}).to_csv(
+        slur_file, index=False
+    )
+    monkeypatch.setattr(LexicalSlur, "_SLUR_CACHE", {})
+
+    assert LexicalSlur().slur_list == ["newword"]
+
+
+def test_match_variants_detects_obfuscated_spellings(patch_slur_load):
+    validator = LexicalSlur(match_variants=True)
+    result = validator._validate("You are a b@dw0rd and a h i g h s l u r!")
+
+    assert result.outcome == "fail"
+    assert result.error_message == "Mentioned toxic words: highslur, badword"
+    assert result.fix_value == "you are a [REDACTED_SLUR] and a [REDACTED_SLUR]!"
+
+
+def test_variants_are_not_matched_by_default(patch_slur_load):
+    validator = build_validator()
+    result = validator._validate("You are a b@dw0rd")
+
+    assert result.outcome == "pass"
+
+
+def test_match_variants_with_redact_original(patch_slur_load):
+    validator = LexicalSlur(match_variants=True, redact_original=True)
+    result = validator._validate("You are a B@DW0RD 😡")
+
+    assert result.fix_value == "You are a [REDACTED_SLUR] 😡"
+
+
+def test_stored_lexicon_is_plain_json(slur_file, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "SLUR_LEXICON_CACHE_DIR", str(tmp_path / "lexicons"))
+    LexicalSlur(languages=["en"])
+
+    (artifact,) = (tmp_path / "lexicons").iterdir()
+    assert artifact.suffix == ".json"
+    assert json.loads(artifact.read_text()) == ["badword", "mildslur"]
+
+
+def test_malformed_stored_lexicon_falls_back_to_the_csv(
+    slur_file, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "SLUR_LEXICON_CACHE_DIR", str(tmp_path / "lexicons"))
+    LexicalSlur(languages=["en"])
+    (artifact,) = (tmp_path / "lexicons").iterdir()
+    artifact.write_text('{"not": "a list"}')
+    monkeypatch.setattr(LexicalSlur, "_SLUR_CACHE", {})
+
+    assert LexicalSlur(languages=["en"]).slur_list == ["badword", "mildslur"]
@@ -1,8 +1,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from presidio_analyzer import RecognizerResult
+from pydantic import ValidationError
 
+from app.core.config import settings
 from app.core.validators import pii_remover
+from app.core.validators.config.pii_remover_safety_validator_config import (
+    PIIRemoverSafetyValidatorConfig,
+)
 from app.core.validators.pii_remover import ALL_ENTITY_TYPES, PIIRemover
 
 # -------------------------------
@@ -15,8 +21,9 @@ def mock_presidio():
     with patch(
         "app.core.validators.pii_remover._get_cached_analyzer"
     ) as mock_analyzer, patch(
-        "app.core.validators.pii_remover.AnonymizerEngine"
+        "app.core.validators.pii_remover._get_anonymizer"
     ) as mock_anonymizer:
+        pii_remover.pii_analysis_cache.clear()
         analyzer_instance = MagicMock()
         mock_analyzer.return_value = analyzer_instance
         anonymizer_instance = mock_anonymizer.return_value
@@ -66,9 +73,61 @@ def test_analyzer_called_with_correct_arguments(validator):
         text="hello",
         entities=validator.entity_types,
         language="en",
+        score_threshold=0.5,
     )
 
 
+def test_validate_batch_analyzes_all_texts_in_one_pass(validator):
+    validator.anonymizer.anonymize.side_effect = [
+        MagicMock(text="first"),
+        MagicMock(text="[PHONE_NUMBER]"),
+    ]
+
+    with patch(
+        "app.core.validators.pii_remover.BatchAnalyzerEngine"
+    ) as mock_batch_engine:
+        mock_batch_engine.return_value.analyze_iterator.return_value = [
+            [],
+            [RecognizerResult("PHONE_NUMBER", 0, 10, 0.9)],
+        ]
+        results = validator.validate_batch(["first", "9999999999"])
+
+    mock_batch_engine.assert_called_once_with(analyzer_engine=validator.analyzer)
+    mock_batch_engine.return_value.analyze_iterator.assert_called_once_with(
+        texts=["first", "9999999999"],
+        language="en",
+        batch_size=settings.PII_BATCH_SIZE,
+        n_process=settings.PII_BATCH_N_PROCESS,
+        entities=validator.entity_types,
+        score_threshold=0.5,
+    )
+    assert [r.outcome for r in results] == ["pass", "fail"]
+    assert results[1].fix_value == "[PHONE_NUMBER]"
+
+
+def test_analyze_batch_matches_single_text_analysis():
+    pii_remover._ANALYZER_CACHE.clear()
+    entity_types = ["PHONE_NUMBER", "EMAIL_ADDRESS", "IN_PAN"]
+    texts = [
+        "Call my phone 9876543210",
+        "nothing to see here",
+        "Mail priya@example.com, PAN ABCDE1234F",
+    ] * 3
+
+    batched = pii_remover.analyze_batch(texts, entity_types, batch_size=2)
+
+    analyzer = pii_remover._get_cached_analyzer(entity_types)
+    single = [
+        analyzer.analyze(text=text, entities=entity_types, language="en")
+        for text in texts
+    ]
+    assert [sorted(map(str, r)) for r in batched] == [
+        sorted(map(str, r)) for r in single
+    ]
+    assert batched[1] == []
+    pii_remover._ANALYZER_CACHE.clear()
+
+
 def test_default_entity_types_applied(validator):
     assert validator.entity_types == ALL_ENTITY_TYPES
 
@@ -79,22 +138,217 @@ def test_custom_entity_types_override(mock_presidio):
     assert v.entity_types == ["EMAIL_ADDRESS"]
 
 
-def test_cached_analyzer_registers_only_requested_indian_recognizers():
+@pytest.fixture
+def installed_models():
+    with patch("app.core.validators.pii_remover.is_installed", return_value=True):
+        yield
+    pii_remover._ANALYZER_CACHE.clear()
+    pii_remover._NLP_ENGINES.clear()
+
+
+def test_cached_analyzer_registers_only_requested_indian_recognizers(
+    installed_models,
+):
     with patch(
         "app.core.validators.pii_remover.NlpEngineProvider"
     ) as mock_provider, patch(
         "app.core.validators.pii_remover.AnalyzerEngine"
     ) as mock_analyzer:
         pii_remover._ANALYZER_CACHE.clear()
-        pii_remover._GLOBAL_NLP_ENGINE = None
+        pii_remover._NLP_ENGINES.clear()
         analyzer_instance = mock_analyzer.return_value
 
-        pii_remover._get_cached_analyzer(["EMAIL_ADDRESS", "IN_AADHAAR", "IN_PAN"])
-        pii_remover._get_cached_analyzer(["EMAIL_ADDRESS", "IN_AADHAAR", "IN_PAN"])
+        entity_types = ["PERSON", "EMAIL_ADDRESS", "IN_AADHAAR", "IN_PAN"]
+        pii_remover._get_cached_analyzer(entity_types)
+        pii_remover._get_cached_analyzer(entity_types)
 
         mock_provider.assert_called_once_with(
-            nlp_configuration=pii_remover.CONFIGURATION
+            nlp_configuration=pii_remover.nlp_configuration("en_core_web_lg")
         )
         mock_provider.return_value.create_engine.assert_called_once()
         mock_analyzer.assert_called_once()
         assert analyzer_instance.registry.add_recognizer.call_count == 2
+
+
+def test_warm_up_builds_and_runs_common_analyzers(installed_models):
+    with patch(
+        "app.core.validators.pii_remover.NlpEngineProvider"
+    ) as mock_provider, patch(
+        "app.core.validators.pii_remover.AnalyzerEngine"
+    ) as mock_analyzer:
+        pii_remover._ANALYZER_CACHE.clear()
+        pii_remover._NLP_ENGINES.clear()
+
+        timings = pii_remover.warm_up()
+
+        mock_provider.return_value.create_engine.assert_called_once()
+        assert len(pii_remover._ANALYZER_CACHE) == 3
+        assert mock_analyzer.return_value.analyze.call_count == 3
+        assert set(timings) == {"model_load_ms", "warmup_ms"}
+
+
+def test_pattern_only_entity_types_skip_the_spacy_model():
+    with patch("app.core.validators.pii_remover.NlpEngineProvider") as mock_provider:
+        pii_remover._ANALYZER_CACHE.clear()
+
+        analyzer = pii_remover._get_cached_analyzer(["PHONE_NUMBER", "IN_PAN"])
+        results = analyzer.analyze(
+            text="Call my phone 9876543210, PAN ABCDE1234F",
+            entities=["PHONE_NUMBER", "IN_PAN"],
+            language="en",
+        )
+
+        mock_provider.assert_not_called()
+        assert isinstance(analyzer.nlp_engine, pii_remover.TokenizerNlpEngine)
+        found = {(r.entity_type, r.start, r.end) for r in results if r.score > 0.1}
+        assert found == {("PHONE_NUMBER", 14, 24), ("IN_PAN", 30, 40)}
+        # The "phone" context word still raises the phone number's score.
+        assert max(r.score for r in results if r.entity_type == "PHONE_NUMBER") > 0.4
+        pii_remover._ANALYZER_CACHE.clear()
+
+
+def test_tokenizer_engine_lemmatizes_with_the_english_lookup_table():
+    engine = pii_remover.TokenizerNlpEngine()
+    engine.load()
+
+    artifacts = engine.process_text("Emails were sent to both Numbers", "en")
+
+    assert artifacts.lemmas == ["email", "be", "send", "to", "both", "number"]
+
+
+def test_analyzers_are_cached_per_spacy_model(installed_models):
+    with patch(
+        "app.core.validators.pii_remover.NlpEngineProvider"
+    ) as mock_provider, patch(
+        "app.core.validators.pii_remover.AnalyzerEngine",
+        side_effect=lambda **kwargs: MagicMock(),
+    ):
+        pii_remover._ANALYZER_CACHE.clear()
+        pii_remover._NLP_ENGINES.clear()
+
+        default = pii_remover._get_cached_analyzer(["PERSON"])
+        small = pii_remover._get_cached_analyzer(["PERSON"], "sm")
+        pii_remover._get_cached_analyzer(["PERSON", "EMAIL_ADDRESS"], "sm")
+        # Pattern-only analyzers need no model, so the tier does not matter.
+        pattern = pii_remover._get_cached_analyzer(["EMAIL_ADDRESS"], "sm")
+
+        assert set(pii_remover._NLP_ENGINES) == {"en_core_web_lg", "en_core_web_sm"}
+        assert mock_provider.call_count == 2
+        mock_provider.assert_called_with(
+            nlp_configuration=pii_remover.nlp_configuration("en_core_web_sm")
+        )
+        assert len(pii_remover._ANALYZER_CACHE) == 3
+        assert pattern is pii_remover._get_cached_analyzer(["EMAIL_ADDRESS"])
+        assert default is not small
+
+
+def test_missing_spacy_model_is_not_downloaded():
+    pii_remover._NLP_ENGINES.clear()
+    with patch("app.core.validators.pii_remover.NlpEngineProvider") as mock_provider:
+        with pytest.raises(OSError, match="en_core_web_trf"):
+            pii_remover._get_nlp_engine("trf")
+
+    mock_provider.assert_not_called()
+
+
+def test_spacy_model_setting_and_custom_paths(monkeypatch):
+    monkeypatch.setattr(pii_remover.settings, "PII_SPACY_MODEL", "md")
+
+    assert pii_remover.resolve_spacy_model() == "en_core_web_md"
+    assert pii_remover.resolve_spacy_model("trf") == "en_core_web_trf"
+    assert pii_remover.resolve_spacy_model("/models/pii_ner") == "/models/pii_ner"
+
+
+def test_config_passes_spacy_model_tier(mock_presidio):
+    config = PIIRemoverSafetyValidatorConfig(type="pii_remover", spacy_model="sm")
+
+    assert config.build().spacy_model == "sm"
+    with pytest.raises(ValidationError):
+        PIIRemoverSafetyValidatorConfig(type="pii_remover", spacy_model="/tmp/model")
+
+
+def test_windows_cover_long_texts_with_overlap(monkeypatch):
+    monkeypatch.setattr(pii_remover.settings, "PII_CHUNK_CHARS", 200)
+    monkeypatch.setattr(pii_remover.settings, "PII_CHUNK_OVERLAP_CHARS", 40)
+    text = "Short one. " * 30 + "word " * 100 + "The end."
+
+    windows = pii_remover._windows(text)
+
+    assert windows[0][0] == 0 and windows[-1][1] == len(text)
+    assert all(end - start <= 200 for start, end, _, _ in windows)
+    for (_, end, _, owned_end), (start, _, owned_start, _) in zip(
+        windows, windows[1:], strict=False
+    ):
+        assert end - start >= 40
+        assert owned_end == owned_start and start < owned_start < end
+    assert pii_remover._windows("Short one.") == [(0, 10, 0, 10)]
+
+
+def test_long_texts_are_anonymized_like_unchunked(monkeypatch):
+    pii_remover._ANALYZER_CACHE.clear()
+    validator = PIIRemover(entity_types=["PHONE_NUMBER", "EMAIL_ADDRESS", "IN_PAN"])
+    sentences = [
+        "Please call my phone 9876543210 after six.",
+        "My email is priya.sharma@example.com, write anytime.",
+        "The clinic opens at nine and closes at five.",
+        "PAN ABCDE1234F was attached to the form.",
+        "Nothing personal in this sentence at all.",
+    ]
+    text = " ".join(sentences[i % 5] for i in range(7 * 60))
+    text += " and then " + "more words and a phone 9123456780 " * 40
+
+    monkeypatch.setattr(pii_remover.settings, "PII_CHUNK_CHARS", 10**6)
+    unchunked = validator.validate(text, {})
+    monkeypatch.setattr(pii_remover.settings, "PII_CHUNK_CHARS", 1_000)
+    monkeypatch.setattr(pii_remover.settings, "PII_CHUNK_OVERLAP_CHARS", 120)
+    pii_remover.pii_analysis_cache.clear()
+    chunked = validator.validate(text, {})
+    pii_remover.pii_analysis_cache.clear()
+    batched = validator.validate_batch([text, sentences[0]])
+
+    assert len(pii_remover._windows(text)) > 10
+    assert chunked.fix_value == unchunked.fix_value
+    assert batched[0].fix_value == unchunked.fix_value
+    assert batched[1].fix_value == validator.validate(sentences[0], {}).fix_value
+    pii_remover._ANALYZER_CACHE.clear()
+
+
+def test_threshold_drops_low_confidence_entities():
+    pii_remover._ANALYZER_CACHE.clear()
+    pii_remover.pii_analysis_cache.clear()
+    text = "Reference ABCDE1234F"
+
+    strict = PIIRemover(entity_types=["IN_PAN"], threshold=0.5)
+    lenient = PIIRemover(entity_types=["IN_PAN"], threshold=0.1)
+
+    assert strict.validate(text, {}).outcome == "pass"
+    assert lenient.validate(text, {}).fix_value == "Reference <IN_PAN>"
+    pii_remover._ANALYZER_CACHE.clear()
+
+
+def test_shared_analysis_runs_once_and_filters_per_validator():
+    pii_remover._ANALYZER_CACHE.clear()
+    pii_remover.pii_analysis_cache.clear()
+    phone = PIIRemover(entity_types=["PHONE_NUMBER"])
+    email = PIIRemover(entity_types=["EMAIL_ADDRESS"], threshold=0.3)
+    pii_remover.share_pii_analysis([phone, MagicMock(), email])
+    text = "Call my phone 9876543210 or mail priya@example.com"
+
+    assert phone.analyzer is email.analyzer
+    assert phone.analysis_threshold == email.analysis_threshold == 0.3
+    with patch.object(
+        phone.analyzer, "analyze", wraps=phone.analyzer.analyze
+    ) as analyze:
+        phone_result = phone.validate(text, {})
+        email_result = email.validate(text, {})
+        phone.validate(text, {})
+
+    analyze.assert_called_once()
+    assert (
+        phone_result.fix_value
+        == "Call my phone <PHONE_NUMBER> or mail priya@example.com"
+    )
+    assert email_result.fix_value == "Call my phone 9876543210 or mail <EMAIL_ADDRESS>"
+    assert phone.anonymizer is email.anonymizer
+    pii_remover._ANALYZER_CACHE.clear()
+    pii_remover.pii_analysis_cache.clear()
@@ -1,8 +1,9 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from guardrails.validators import FailResult, PassResult
 
+from app.core.llm_response_cache import is_cache_hit
 from app.core.validators.topic_relevance_llm import TopicRelevanceLLM
 
 TOPIC_CONFIG = "Only answer questions about cooking and recipes."
@@ -438,3 +439,77 @@ def test_invalid_prompt_schema_version_returns_fail():
 
     assert isinstance(result, FailResult)
     assert "not found" in result.error_message
+
+
+# ---------------------------------------------------------------------------
+# Async path uses acompletion
+# ---------------------------------------------------------------------------
+
+
+async def test_async_validate_fails_when_score_is_1(validator):
+    with patch(
+        "app.core.validators.topic_relevance_llm.acompletion",
+        new_callable=AsyncMock,
+    ) as mock_llm, patch(
+        "app.core.validators.topic_relevance_llm.completion"
+    ) as mock_sync_llm:
+        mock_llm.return_value = _make_llm_response('{"scope_violation": 1}')
+        result = await validator.async_validate("What is the capital of France?", {})
+
+    assert isinstance(result, FailResult)
+    assert result.metadata["scope_score"] == 1
+    mock_sync_llm.assert_not_called()
+    messages = mock_llm.call_args.kwargs["messages"]
+    assert messages[1] == {
+        "role": "user",
+        "content": "What is the capital of France?",
+    }
+
+
+async def test_async_validate_skips_llm_for_empty_value(validator):
+    with patch(
+        "app.core.validators.topic_relevance_llm.acompletion",
+        new_callable=AsyncMock,
+    ) as mock_llm:
+        result = await validator.async_validate("   ", {})
+
+    assert isinstance(result, FailResult)
+    mock_llm.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+
+def test_repeated_query_reuses_the_cached_reply(validator):
+    with patch("app.core.validators.topic_relevance_llm.completion") as mock_llm:
+        mock_llm.return_value = _make_llm_response(
+            '{"scope_violation": 1, "reasoning": "cricket"}'
+        )
+        first = validator._validate("What is the latest cricket score?")
+        second = validator._validate("what is the latest  cricket score?")
+
+    mock_llm.assert_called_once()
+    assert isinstance(second, FailResult)
+    assert not is_cache_hit(first) and is_cache_hit(second)
+    assert second.metadata["scope_score"] == first.metadata["scope_score"]
+
+
+def test_unparseable_replies_and_opted_out_configs_are_not_cached():
+    with patch(
+        "app.core.validators.llm_utils.get_supported_openai_params",
+        return_value=[],
+    ):
+        uncached = TopicRelevanceLLM(system_prompt=TOPIC_CONFIG, cache_responses=False)
+        cached = TopicRelevanceLLM(system_prompt=TOPIC_CONFIG)
+
+    with patch("app.core.validators.topic_relevance_llm.completion") as mock_llm:
+        mock_llm.return_value = _make_llm_response('{"scope_violation": 3}')
+        uncached._validate("How do I make pasta?")
+        uncached._validate("How do I make pasta?")
+        mock_llm.return_value = _make_llm_response("not json")
+        cached._validate("How do I bake bread?")
+        cached._validate("How do I bake bread?")
+
+    assert mock_llm.call_count == 4
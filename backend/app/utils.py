@@ -1,8 +1,13 @@
 import logging
 import functools as ft
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
 from pathlib import Path
+from fastapi import Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
 from typing import Any, Dict, Generic, Optional, TypeVar
 
 from app.core.constants import VALIDATOR_CONFIG_SYSTEM_FIELDS as SYSTEM_FIELDS
@@ -34,6 +39,38 @@ def split_validator_payload(data: dict):
     return model_fields, config_fields
 
 
+async def request_lines(request: Request) -> AsyncIterator[str]:
+    """Non-empty lines of the request body, yielded as soon as each one is complete."""
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *complete, buffer = buffer.split(b"\n")
+        for line in complete:
+            if line.strip():
+                yield line.decode("utf-8")
+    if buffer.strip():
+        yield buffer.decode("utf-8")
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    A StreamingResponse whose body is generated while the request body is
+    still being read. On servers below ASGI spec 2.4, StreamingResponse
+    listens for a disconnect by consuming receive(), which would swallow the
+    request body; here only the body reader calls receive(), and a disconnect
+    reaches it as ClientDisconnect.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError:
+            raise ClientDisconnect()
+
+        if self.background is not None:
+            await self.background()
+
+
 @ft.singledispatch
 def load_description(filename: Path) -> str:
     if not filename.exists():